@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""Offline benchmarks for the debate orchestrator.
+
+Suites:
+- markdown: MarkdownTokenizer, classify_text_target, split_mixed and parse_critique on
+  generated multi-megabyte inputs; per-KiB cost per size shows whether scaling is linear.
+- parse: parse_critique and split_mixed throughput on generated critiques of 1 KiB-10 MiB.
+- io: session-dir write cost per round (round input/critique files plus the events.jsonl journal).
+- orchestrator: end-to-end debate.py runs against fake `codex`/`claude` executables put on
+  PATH, with configurable latency, output size and failure rate. Backend time is taken from
+  the session's trace.jsonl, so the reported overhead excludes (stub) model latency.
+
+No real model backends are called. Results can be written to a JSON report and compared
+against an earlier report to catch orchestrator regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import debate  # noqa: E402
+
+DEBATE_SCRIPT = Path(__file__).resolve().parent / "debate.py"
+DEFAULT_MARKDOWN_SIZES_KB = [256, 1024, 4096, 8192]
+DEFAULT_PARSE_SIZES_KB = [1, 16, 256, 1024, 10240]
+DEFAULT_IO_SIZES_KB = [16, 1024]
+SUITES = ("markdown", "parse", "io", "orchestrator")
+
+# Fake backend: prints a critique with one P2 (judge -> D) padded with P3 bullets to the
+# requested size. Configured through DEBATE_STUB_* variables. The P2 recurs unchanged, which
+# fingerprint convergence stops on, so orchestrator runs pass --no-fingerprint-convergence.
+STUB_BACKEND = """#!{python}
+import os, random, sys, time
+time.sleep(float(os.environ.get("DEBATE_STUB_LATENCY", "0")))
+if random.random() < float(os.environ.get("DEBATE_STUB_FAILURE_RATE", "0")):
+    print("stub backend failure", file=sys.stderr)
+    sys.exit(1)
+target = int(os.environ.get("DEBATE_STUB_OUTPUT_BYTES", "2048"))
+out = ["## P1 - Must Fix", "- None", "## P2 - Should Fix", "- Retry loop in client.py:40 swallows errors",
+       "## P3 - Nice to Have"]
+size = sum(len(line) + 1 for line in out)
+n = 0
+while size < target:
+    n += 1
+    line = f"- Optional cleanup {{n}} in module_{{n}}.py:{{n * 3}}"
+    out.append(line)
+    size += len(line) + 1
+out += ["## Missing Alternatives", "- None", "## Recommended Decision", "- continue"]
+print("\\n".join(out))
+"""
+
+
+def generate_artifact(target_bytes: int, seed: int = 7) -> str:
+    """Mixed proposal/code markdown with headings, bullets and nested fences."""
+    rng = random.Random(seed)
+    headings = ["Design", "Proposal", "Approach", "Context", "Tradeoff", "Notes", "Decision"]
+    parts: List[str] = []
+    size = 0
+    n = 0
+    while size < target_bytes:
+        n += 1
+        block = [
+            f"## {rng.choice(headings)} {n}",
+            f"Paragraph {n} explains the change and its rollout constraints in some detail.",
+            f"- bullet {n}a about latency",
+            f"* bullet {n}b about correctness",
+            "````markdown",
+            "```python",
+            f"def handler_{n}(x):",
+            "    # - not a bullet, inside a fence",
+            "    return x",
+            "```",
+            "````",
+            "",
+        ]
+        chunk = "\n".join(block) + "\n"
+        parts.append(chunk)
+        size += len(chunk)
+    return "".join(parts)
+
+
+def generate_critique(target_bytes: int, seed: int = 11) -> str:
+    rng = random.Random(seed)
+    sections = ["## P1 - Must Fix", "## P2 - Should Fix", "## P3 - Nice to Have", "## Missing Alternatives"]
+    parts: List[str] = []
+    size = 0
+    n = 0
+    while size < target_bytes:
+        n += 1
+        lines = [rng.choice(sections)]
+        lines += [f"- Finding {n}.{k}: retry logic in module_{n}.py:{k * 10} drops errors" for k in range(5)]
+        lines += ["Supporting evidence paragraph for the findings above.", ""]
+        chunk = "\n".join(lines) + "\n"
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append("## Recommended Decision\n- revise\n")
+    return "".join(parts)
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def throughput_row(case: str, size_kb: int, text_bytes: int, seconds: float) -> Dict:
+    return {
+        "case": case,
+        "size_kb": size_kb,
+        "bytes": text_bytes,
+        "seconds": round(seconds, 6),
+        "us_per_kb": round(seconds * 1e6 / (text_bytes / 1024), 3),
+        "mb_per_second": round(text_bytes / (1024 * 1024) / seconds, 2) if seconds else None,
+    }
+
+
+def bench_markdown(sizes_kb: List[int], repeat: int) -> Dict:
+    rows: List[Dict] = []
+    for size_kb in sizes_kb:
+        artifact = generate_artifact(size_kb * 1024)
+        critique = generate_critique(size_kb * 1024)
+        cases = {
+            "tokenize_artifact": lambda: debate.tokenize_markdown(artifact),
+            "classify_text_target": lambda: debate.classify_text_target(artifact),
+            "split_mixed": lambda: debate.split_mixed(artifact),
+            "parse_critique": lambda: debate.parse_critique(critique),
+        }
+        for name, fn in cases.items():
+            text_bytes = len(critique if name == "parse_critique" else artifact)
+            rows.append(throughput_row(name, size_kb, text_bytes, best_of(fn, repeat)))
+
+    scaling: Dict[str, float] = {}
+    for name in {row["case"] for row in rows}:
+        case_rows = sorted((row for row in rows if row["case"] == name), key=lambda row: row["bytes"])
+        # ~1.0 means linear; >1 means per-byte cost grows with input size.
+        scaling[name] = round(case_rows[-1]["us_per_kb"] / case_rows[0]["us_per_kb"], 3)
+    metrics = {f"markdown.{row['case']}.{row['size_kb']}kb.us_per_kb": row["us_per_kb"] for row in rows}
+    return {"rows": rows, "per_kb_cost_ratio_largest_vs_smallest": scaling, "metrics": metrics}
+
+
+def bench_parse(sizes_kb: List[int], repeat: int) -> Dict:
+    rows: List[Dict] = []
+    for size_kb in sizes_kb:
+        critique = generate_critique(size_kb * 1024)
+        rows.append(
+            throughput_row("parse_critique", size_kb, len(critique), best_of(lambda: debate.parse_critique(critique), repeat))
+        )
+        rows.append(
+            throughput_row("split_mixed", size_kb, len(critique), best_of(lambda: debate.split_mixed(critique), repeat))
+        )
+    metrics = {f"parse.{row['case']}.{row['size_kb']}kb.us_per_kb": row["us_per_kb"] for row in rows}
+    return {"rows": rows, "metrics": metrics}
+
+
+def bench_io(sizes_kb: List[int], rounds: int, repeat: int) -> Dict:
+    """Time the per-round session-dir writes debate.py performs, without backend calls."""
+    rows: List[Dict] = []
+    with tempfile.TemporaryDirectory(prefix="debate-bench-io-") as tmp:
+        base = Path(tmp)
+        for size_kb in sizes_kb:
+            artifact = generate_artifact(size_kb * 1024)
+            critique = generate_critique(max(1, size_kb // 4) * 1024)
+            parsed = debate.parse_critique(critique)
+
+            def one_session() -> None:
+                _session_id, session_dir = debate.make_session_dir(base)
+                (session_dir / "artifact.md").write_text(artifact, encoding="utf-8")
+                state: Dict = {"session_id": session_dir.name, "rounds": [], "status": "in_progress"}
+                journal = debate.SessionJournal(session_dir)
+                journal.checkpoint(state, snapshot=True)
+                for round_no in range(1, rounds + 1):
+                    (session_dir / f"round-{round_no}-input.md").write_text(artifact, encoding="utf-8")
+                    (session_dir / f"round-{round_no}-critique.md").write_text(critique, encoding="utf-8")
+                    state["rounds"].append(
+                        {"round": round_no, "p1": parsed.p1, "p2": parsed.p2, "p3": parsed.p3, "missing": parsed.missing}
+                    )
+                    journal.checkpoint(state)
+                (session_dir / "final-artifact.md").write_text(artifact, encoding="utf-8")
+                state["status"] = "closed"
+                journal.checkpoint(state, snapshot=True)
+                journal.close()
+                shutil.rmtree(session_dir)
+
+            seconds = best_of(one_session, repeat)
+            rows.append(
+                {
+                    "size_kb": size_kb,
+                    "rounds": rounds,
+                    "session_seconds": round(seconds, 6),
+                    "ms_per_round": round(seconds * 1000 / rounds, 3),
+                }
+            )
+    metrics = {f"io.{row['size_kb']}kb.ms_per_round": row["ms_per_round"] for row in rows}
+    return {"rows": rows, "metrics": metrics}
+
+
+def install_stub_backends(bin_dir: Path) -> None:
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    script = STUB_BACKEND.format(python=sys.executable)
+    for name in ("codex", "claude"):
+        path = bin_dir / name
+        path.write_text(script, encoding="utf-8")
+        path.chmod(0o755)
+
+
+def backend_seconds_from_trace(trace_file: Path) -> float:
+    total = 0.0
+    if not trace_file.exists():
+        return total
+    for line in trace_file.read_text(encoding="utf-8").splitlines():
+        span = json.loads(line)
+        # Mixed rounds run backend calls concurrently; only count top-level (main-thread) time.
+        if span["name"] == "backend_cmd" and span["thread"] == 1:
+            total += span["duration_seconds"]
+    return total
+
+
+def bench_orchestrator(
+    *,
+    runs: int,
+    rounds: int,
+    latency: float,
+    output_bytes: int,
+    failure_rate: float,
+    artifact_kb: int,
+    extra_args: List[str],
+) -> Dict:
+    samples: List[Dict] = []
+    with tempfile.TemporaryDirectory(prefix="debate-bench-orch-") as tmp:
+        root = Path(tmp)
+        install_stub_backends(root / "bin")
+        workdir = root / "work"
+        workdir.mkdir()
+        artifact_file = workdir / "proposal.md"
+        artifact_file.write_text(generate_artifact(artifact_kb * 1024), encoding="utf-8")
+        env = dict(os.environ)
+        env.update(
+            {
+                "PATH": f"{root / 'bin'}{os.pathsep}{env.get('PATH', '')}",
+                # Pretend to run inside codex so the opposite backend is the `claude` stub.
+                "CODEX_THREAD_ID": "debate-bench",
+                "DEBATE_STUB_LATENCY": str(latency),
+                "DEBATE_STUB_OUTPUT_BYTES": str(output_bytes),
+                "DEBATE_STUB_FAILURE_RATE": str(failure_rate),
+                "GIT_CEILING_DIRECTORIES": str(root),
+            }
+        )
+        for run in range(runs):
+            state_dir = root / f"state-{run}"
+            cmd = [
+                sys.executable,
+                str(DEBATE_SCRIPT),
+                "--target",
+                "proposal",
+                "--artifact-file",
+                str(artifact_file),
+                "--mode",
+                "auto",
+                "--max-rounds",
+                str(rounds),
+                "--no-cache",
+                # Measure max_rounds rounds; otherwise the recurring stub P2 ends the session after round 2.
+                "--no-fingerprint-convergence",
+                "--state-dir",
+                str(state_dir),
+                *extra_args,
+            ]
+            started = time.perf_counter()
+            proc = subprocess.run(cmd, cwd=workdir, env=env, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+            wall = time.perf_counter() - started
+            if proc.returncode != 0:
+                raise RuntimeError(f"debate.py exited {proc.returncode}: {proc.stderr[-2000:]}")
+            session_dir = next(state_dir.glob("debate-*"))
+            decision = json.loads((session_dir / "decision.json").read_text(encoding="utf-8"))
+            session_seconds = float(decision["total_duration_seconds"])
+            backend_seconds = backend_seconds_from_trace(session_dir / "trace.jsonl")
+            session_rounds = max(1, int(decision["rounds"]))
+            samples.append(
+                {
+                    "process_wall_seconds": round(wall, 4),
+                    "session_seconds": session_seconds,
+                    "backend_seconds": round(backend_seconds, 4),
+                    "rounds": session_rounds,
+                    "overhead_seconds_per_round": round(max(0.0, session_seconds - backend_seconds) / session_rounds, 4),
+                    "final_decision": decision.get("final_decision"),
+                }
+            )
+
+    def median(key: str) -> float:
+        return round(statistics.median(sample[key] for sample in samples), 4)
+
+    summary = {
+        "runs": runs,
+        "max_rounds": rounds,
+        "stub_latency_seconds": latency,
+        "stub_output_bytes": output_bytes,
+        "stub_failure_rate": failure_rate,
+        "artifact_kb": artifact_kb,
+        "median_process_wall_seconds": median("process_wall_seconds"),
+        "median_session_seconds": median("session_seconds"),
+        "median_backend_seconds": median("backend_seconds"),
+        "median_overhead_seconds_per_round": median("overhead_seconds_per_round"),
+        "median_rounds": median("rounds"),
+    }
+    metrics = {
+        "orchestrator.overhead_seconds_per_round": summary["median_overhead_seconds_per_round"],
+        "orchestrator.process_wall_seconds": summary["median_process_wall_seconds"],
+    }
+    return {"summary": summary, "samples": samples, "metrics": metrics}
+
+
+def compare_reports(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Return regression lines for metrics that got slower by more than threshold (fraction)."""
+    regressions: List[str] = []
+    old_metrics: Dict[str, float] = {}
+    new_metrics: Dict[str, float] = {}
+    for report, sink in ((baseline, old_metrics), (current, new_metrics)):
+        for suite in report.get("suites", {}).values():
+            sink.update(suite.get("metrics", {}))
+    print("\nComparison vs baseline (lower is better):")
+    for name in sorted(set(old_metrics) & set(new_metrics)):
+        old, new = old_metrics[name], new_metrics[name]
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(f"{name}: {old} -> {new} (+{change:.0%})")
+        print(f"- {name}: {old} -> {new} ({change:+.1%}){flag}")
+    return regressions
+
+
+def print_rows(title: str, rows: List[Dict]) -> None:
+    print(f"\n## {title}")
+    if not rows:
+        return
+    keys = list(rows[0])
+    print("  ".join(f"{key:>14}" for key in keys))
+    for row in rows:
+        print("  ".join(f"{str(row[key]):>14}" for key in keys))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks for debate.py")
+    # No argparse choices: with nargs="*" they reject the list default, so no-arg runs failed.
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        default=[],
+        metavar="suite",
+        help=f"Suites to run: {', '.join(SUITES)} or all (default: all).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per micro-benchmark; best is reported (default 3).")
+    parser.add_argument("--markdown-sizes-kb", type=int, nargs="+", default=DEFAULT_MARKDOWN_SIZES_KB)
+    parser.add_argument("--parse-sizes-kb", type=int, nargs="+", default=DEFAULT_PARSE_SIZES_KB)
+    parser.add_argument("--io-sizes-kb", type=int, nargs="+", default=DEFAULT_IO_SIZES_KB)
+    parser.add_argument("--io-rounds", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=3, help="End-to-end orchestrator runs (default 3).")
+    parser.add_argument("--rounds", type=int, default=3, help="Max rounds per orchestrator run (default 3).")
+    parser.add_argument("--stub-latency", type=float, default=0.05, help="Fake backend latency in seconds.")
+    parser.add_argument("--stub-output-bytes", type=int, default=4096, help="Fake backend critique size.")
+    parser.add_argument("--stub-failure-rate", type=float, default=0.0, help="Fake backend failure probability.")
+    parser.add_argument("--artifact-kb", type=int, default=32, help="Orchestrator artifact size in KiB.")
+    parser.add_argument(
+        "--debate-arg",
+        action="append",
+        default=[],
+        help="Extra argument passed to every orchestrator run (repeatable, e.g. --debate-arg=--fail-fast).",
+    )
+    parser.add_argument("--output", help="Write the JSON report here.")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against.")
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=0.25,
+        help="With --compare, exit 1 when a metric is slower by more than this fraction (default 0.25).",
+    )
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.suites if name not in (*SUITES, "all")]
+    if unknown:
+        parser.error(f"invalid suite: {', '.join(unknown)} (choose from {', '.join(SUITES)}, all)")
+    suites = list(SUITES) if not args.suites or "all" in args.suites else list(dict.fromkeys(args.suites))
+
+    report: Dict = {
+        "created_at": dt.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "suites": {},
+    }
+    if "markdown" in suites:
+        result = bench_markdown(args.markdown_sizes_kb, args.repeat)
+        report["suites"]["markdown"] = result
+        print_rows("markdown", result["rows"])
+        print(f"per-KiB cost ratio, largest vs smallest (1.0 = linear): {result['per_kb_cost_ratio_largest_vs_smallest']}")
+    if "parse" in suites:
+        result = bench_parse(args.parse_sizes_kb, args.repeat)
+        report["suites"]["parse"] = result
+        print_rows("parse", result["rows"])
+    if "io" in suites:
+        result = bench_io(args.io_sizes_kb, args.io_rounds, args.repeat)
+        report["suites"]["io"] = result
+        print_rows("io", result["rows"])
+    if "orchestrator" in suites:
+        result = bench_orchestrator(
+            runs=args.runs,
+            rounds=args.rounds,
+            latency=args.stub_latency,
+            output_bytes=args.stub_output_bytes,
+            failure_rate=args.stub_failure_rate,
+            artifact_kb=args.artifact_kb,
+            extra_args=args.debate_arg,
+        )
+        report["suites"]["orchestrator"] = result
+        print_rows("orchestrator", result["samples"])
+        print(json.dumps(result["summary"], indent=2))
+
+    status = 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare_reports(report, baseline, args.regression_threshold)
+        report["regressions"] = regressions
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.regression_threshold:.0%}", file=sys.stderr)
+            status = 1
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nSaved: {args.output}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,26 +10,67 @@ Stores session state under:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import bisect
+import codecs
+import concurrent.futures
+import contextlib
 import dataclasses
 import datetime as dt
+import difflib
+import fcntl
+import glob
 import hashlib
+import io
 import json
+import math
+import mmap
+import multiprocessing
 import os
+import queue
+import random
 import re
 import shlex
+import shutil
+import signal
+import socket
+import socketserver
+import sqlite3
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 
 DEFAULT_MAX_ROUNDS = 3
 DEFAULT_BUDGET_MINUTES = 20
 DEFAULT_BACKEND_TIMEOUT_SECONDS = 600
-PROPOSAL_SECTION_PATTERN = (
-    r"(?im)^\s{0,3}(#+\s*(design|proposal|approach|decision|tradeoff|rebuttal|response)\b)"
+# Matched against heading titles produced by MarkdownTokenizer.
+PROPOSAL_HEADING_PATTERN = re.compile(r"(?i)^(design|proposal|approach|decision|tradeoff|rebuttal|response)\b")
+CRITIQUE_HEADING_PATTERN = re.compile(
+    r"(?i)^(?:"
+    r"(?P<p1>P1\b|.*Must Fix|.*Must Reconsider)"
+    r"|(?P<p2>P2\b|.*Should Fix|.*Should Improve)"
+    r"|(?P<p3>P3\b|.*Nice to Have|.*Nice to Strengthen)"
+    r"|(?P<early_stop>Early Stop\b)"
+    r"|(?P<reset>(?:Code Critique|Proposal Critique|Backend Error|Backend Fallback)\b)"
+    r"|(?P<missing>Missing\b)"
+    r"|(?P<recommendation>Recommended Decision\b)"
+    r")"
 )
+MD_FENCE_PATTERN = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+MD_HEADING_PATTERN = re.compile(r"^\s*(#{1,6})(?!#)\s*(.*?)\s*$")
+NO_ISSUE_STRIP_PATTERN = re.compile(r"[*_`]+")
+AGREEMENT_SIGNAL_PATTERN = re.compile(r"\b(?:lgtm|looks good|no concerns|no critical issues|approved)\b")
+# "not approved", "hardly looks good": a negation within two words before the marker.
+AGREEMENT_NEGATION_PATTERN = re.compile(r"\b(?:not|never|hardly|isn't|is not|wasn't|cannot|can't)\s+(?:\w+\s+)?$")
+# "looks good, but ...": the marker is qualified in the same sentence.
+AGREEMENT_CONTRAST_PATTERN = re.compile(r"^[\s,;:-]*(?:but|except|however|although|though|apart from)\b")
 INTENSITY_PROFILES = {
     "quick": {
         "max_rounds": 1,
@@ -47,6 +88,14 @@ INTENSITY_PROFILES = {
         "backend_timeout_seconds": 900,
     },
 }
+# --intensity adaptive: provisional values come from this profile, then history refines them.
+ADAPTIVE_BASE_INTENSITY = "standard"
+ADAPTIVE_MIN_SAMPLES = 5
+ADAPTIVE_TIMEOUT_PERCENTILE = 95
+ADAPTIVE_TIMEOUT_MARGIN = 1.5
+ADAPTIVE_MIN_TIMEOUT_SECONDS = 60
+ADAPTIVE_MAX_TIMEOUT_SECONDS = 1800
+ADAPTIVE_MIN_PREDICTED_SECONDS = 1.0
 REQUIRED_INTENSITY_KEYS = (
     "max_rounds",
     "budget_minutes",
@@ -79,11 +128,1177 @@ def validate_intensity_profiles() -> None:
             )
 
 
+STREAM_READ_CHUNK_BYTES = 64 * 1024
+DEFAULT_MAX_ARTIFACT_MB = 32
+DEFAULT_MAX_BACKEND_OUTPUT_MB = 8
+# Bump when review prompts change so cached critiques from older prompts are not reused.
+PROMPT_TEMPLATE_VERSION = "review-v1"
+CRITIQUE_CACHE_DIR_NAME = "critique-cache"
+DEFAULT_CACHE_TTL_HOURS = 168
+DEFAULT_CACHE_MAX_MB = 64
+SCHEDULER_DIR_NAME = "scheduler"
+DEFAULT_SCHEDULER_MAX_CONCURRENT = 2
+DEFAULT_SCHEDULER_RPM = 30
+SCHEDULER_POLL_MIN_SECONDS = 0.02
+SCHEDULER_POLL_MAX_SECONDS = 0.5
+CANCEL_POLL_SECONDS = 0.05
+DEFAULT_HEDGE_AFTER_SECONDS = 120.0
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 5
+# Most recent sessions scanned for backend latency history (trace.jsonl).
+LATENCY_HISTORY_SESSIONS = 50
+# Span errors whose duration is a lower bound on the call's latency rather than a failure to skip.
+LATENCY_CENSORED_ERRORS = ("timed out",)
+# Hedge thresholds also keep primaries killed by a winning hedge ("codex call cancelled after 41.2s").
+HEDGE_CENSORED_ERRORS = (*LATENCY_CENSORED_ERRORS, "cancelled after")
+# Histogram buckets (upper bounds) for --metrics-textfile; +Inf is implicit.
+METRICS_DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 900, 1800)
+METRICS_SESSION_DURATION_BUCKETS = (60, 300, 600, 1200, 1800, 3600, 7200)
+METRICS_ROUNDS_BUCKETS = (1, 2, 3, 4, 5, 8)
+METRICS_BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+METRICS_HISTOGRAMS = {
+    "debate_backend_call_duration_seconds": (
+        "Wall time of backend review and revision calls (cache hits and cancelled calls excluded).",
+        METRICS_DURATION_BUCKETS,
+    ),
+    "debate_session_duration_seconds": ("Wall time of a debate session.", METRICS_SESSION_DURATION_BUCKETS),
+    "debate_session_rounds": ("Rounds per debate session.", METRICS_ROUNDS_BUCKETS),
+    "debate_artifact_bytes": ("Size of the reviewed artifact.", METRICS_BYTES_BUCKETS),
+}
+METRICS_COUNTERS = {
+    "debate_sessions_total": "Finished debate sessions by final decision.",
+    "debate_round_choices_total": "Debate rounds by choice (A-E, AUTO_STOP).",
+    "debate_auto_stops_total": "Sessions stopped early by the convergence rules, by reason.",
+    "debate_backend_timeouts_total": "Backend calls that hit the per-call timeout.",
+    "debate_backend_errors_total": "Rounds whose review failed with a backend error.",
+    "debate_fallbacks_total": "Reviews served by the local backend instead of the opposite one, by cause.",
+}
+METRICS_GAUGES = {
+    "debate_last_session_timestamp_seconds": "Unix time the last debate session finished.",
+}
+FINDING_DUPLICATE_THRESHOLD = 0.6
+# Cross-round finding fingerprints: MinHash over word unigram/bigram shingles.
+FINGERPRINT_MATCH_THRESHOLD = 0.4
+FINGERPRINT_STOPWORDS = frozenset(
+    "a an and are as at be by can could for from has have in into is it its lack lacks may might missing no "
+    "not of on or should that the then this to was were when which will with without would".split()
+)
+FINDING_LINE_SUFFIX_PATTERN = re.compile(r"(?<=[a-z0-9]):\d+(?::\d+)?\b")
+MINHASH_PRIME = (1 << 61) - 1
+_minhash_rng = random.Random(0x5EED)
+MINHASH_COEFFICIENTS = tuple(
+    (_minhash_rng.randrange(1, MINHASH_PRIME), _minhash_rng.randrange(0, MINHASH_PRIME)) for _ in range(64)
+)
+SEVERITY_SECTIONS = ("p1", "p2", "p3")
+DEFAULT_DELTA_MAX_RATIO = 0.6
+DEFAULT_CHUNK_MAX_BYTES = 150_000
+DEFAULT_CHUNK_CONCURRENCY = 4
+# First line of a file patch; combined diffs (merges without --first-parent) use diff --cc/--combined.
+GIT_PATCH_HEADER_PREFIXES = (b"diff --git ", b"diff --cc ", b"diff --combined ")
+DIFF_FILE_HEADER_PATTERN = re.compile(r"^diff --git a/(.+?) b/(.+)$")
+NON_SPACE_BYTES_PATTERN = re.compile(rb"\S")
+NUMSTAT_LINE_PATTERN = re.compile(r"^(\d+|-)\t(\d+|-)\t(.+)$")
+# Path-like tokens in findings: "src/a.py", "client.py:40" (one-letter suffixes such as "e.g" excluded).
+FINDING_PATH_PATTERN = re.compile(r"(?<![\w/.-])((?:[\w.-]+/)+[\w.-]+|[\w-]+\.[A-Za-z][A-Za-z0-9]{1,7})(?::\d+)?\b")
+SESSION_INDEX_FILE = "index.sqlite3"
+SESSION_INDEX_SCHEMA_VERSION = 1
+SESSION_ARCHIVE_DIR_NAME = "archive"
+DEFAULT_RETENTION_MAX_AGE_DAYS = 90
+DEFAULT_RETENTION_MAX_MB = 512
+DEFAULT_RETENTION_KEEP_LAST = 20
+# Unfinished sessions stay resumable (--resume); only age deletes them, and only after this long.
+DEFAULT_RETENTION_STALE_DAYS = 365
+DEFAULT_COMPACT_AFTER_DAYS = 2
+DEFAULT_GC_TIME_BUDGET_SECONDS = 0.5
+GC_MIN_INTERVAL_SECONDS = 3600
+SERVE_SOCKET_NAME = "debate.sock"
+DEFAULT_SERVE_WORKERS = 4
+SERVE_MAX_REQUEST_BYTES = 1024 * 1024
+# Client environment forwarded to daemon jobs: backend detection, tool lookup and the state root depend on it.
+SERVE_FORWARDED_ENV = ("CODEX_THREAD_ID", "CODEX_SANDBOX_ID", "PATH", "HOME", "XDG_STATE_HOME")
+# Flags that shape backend argv and prompts; --replay restores them from the recorded run so keys match.
+REPLAY_SHAPING_ARGS = (
+    "target",
+    "scope",
+    "fanout_backends",
+    "fanout_samples",
+    "consensus_min",
+    "fail_fast",
+    "fail_fast_p1",
+    "no_delta_review",
+    "delta_max_ratio",
+    "chunk_max_bytes",
+    "chunk_concurrency",
+    "skip_materialize_opposite",
+    "speculative_revision",
+    "no_fingerprint_convergence",
+)
+SESSION_EVENTS_FILE = "events.jsonl"
+EVENT_FSYNC_INTERVAL_SECONDS = 1.0
+SNAPSHOT_INTERVAL_SECONDS = 30.0
+HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$")
+REVIEW_OUTPUT_SECTIONS = (
+    "Output sections:\n"
+    "## P1 - Must Fix\n## P2 - Should Fix\n## P3 - Nice to Have\n"
+    "## Missing Alternatives\n## Recommended Decision\n"
+    "Include concrete evidence."
+)
+
+
+class BudgetExceededError(RuntimeError):
+    pass
+
+
+class BackendCancelledError(RuntimeError):
+    """A backend call was killed because a hedged call for the same review already won."""
+
+
+class HedgeFailedError(RuntimeError):
+    """Neither the primary nor the hedged fallback backend produced a usable critique."""
+
+
 @dataclasses.dataclass
 class CmdResult:
     code: int
     stdout: str
     stderr: str
+    stopped_early: bool = False
+    duration_seconds: float = 0.0
+    truncated: bool = False
+
+
+# Per-line output callback (stream, line); returning True stops the command early.
+LineCallback = Callable[[str, str], Optional[bool]]
+
+
+class Tracer:
+    """Collects timed spans for one debate session.
+
+    Spans finished before attach() are buffered; afterwards each span is appended to
+    <session_dir>/trace.jsonl as it ends, so a killed session still leaves a trace.
+    write_chrome_trace() exports everything in Chrome trace-event format.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._spans: List[Dict] = []
+        self._thread_ids: Dict[int, int] = {}
+        self._jsonl: Optional[Path] = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans = []
+            self._thread_ids = {}
+            self._jsonl = None
+
+    def attach(self, session_dir: Path) -> None:
+        with self._lock:
+            self._jsonl = session_dir / "trace.jsonl"
+            buffered = list(self._spans)
+        with self._jsonl.open("a", encoding="utf-8") as fh:
+            for span in buffered:
+                fh.write(json.dumps(span, ensure_ascii=False, default=str) + "\n")
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Dict]:
+        """Time the block; callers may add attributes (bytes_out, exit_code, ...) to the yielded dict."""
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(attrs)
+        start = time.time()
+        perf_start = time.perf_counter()
+        try:
+            yield attrs
+        except BaseException as exc:
+            attrs.setdefault("error", str(exc) or exc.__class__.__name__)
+            raise
+        finally:
+            stack.pop()
+            self.record(name, start, start + (time.perf_counter() - perf_start), **attrs)
+
+    def annotate(self, **attrs) -> None:
+        """Add attributes to the innermost open span of the calling thread."""
+        stack = self._local.__dict__.get("stack")
+        if stack:
+            stack[-1].update(attrs)
+
+    def record(self, name: str, start: float, end: float, **attrs) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            tid = self._thread_ids.setdefault(ident, len(self._thread_ids) + 1)
+            span = {
+                "name": name,
+                "start": round(start, 6),
+                "end": round(end, 6),
+                "duration_seconds": round(end - start, 6),
+                "thread": tid,
+                "attrs": attrs,
+            }
+            self._spans.append(span)
+            if self._jsonl is not None:
+                with self._jsonl.open("a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(span, ensure_ascii=False, default=str) + "\n")
+
+    def spans(self) -> List[Dict]:
+        with self._lock:
+            return list(self._spans)
+
+    def write_chrome_trace(self, path: Path) -> None:
+        pid = os.getpid()
+        with self._lock:
+            events = [
+                {
+                    "name": span["name"],
+                    "cat": "debate",
+                    "ph": "X",
+                    "ts": int(span["start"] * 1_000_000),
+                    "dur": int(span["duration_seconds"] * 1_000_000),
+                    "pid": pid,
+                    "tid": span["thread"],
+                    "args": span["attrs"],
+                }
+                for span in self._spans
+            ]
+        path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+
+
+TRACER = Tracer()
+
+
+class CritiqueCache:
+    """On-disk critique cache keyed by artifact content and review parameters.
+
+    Entries expire after ttl_seconds; when the cache grows past max_bytes the least
+    recently used entries (by mtime, refreshed on every hit) are evicted first.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        ttl_seconds: float,
+        max_bytes: int,
+        read_enabled: bool = True,
+    ) -> None:
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.read_enabled = read_enabled
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def key(self, *, artifact_file: Path, backend: str, target: str, scope: str, sample: int = 0) -> str:
+        artifact_digest = file_sha256(artifact_file)
+        fields = {
+            "artifact_sha256": artifact_digest,
+            "backend": backend,
+            "target": target,
+            "scope": scope,
+            "prompt_version": PROMPT_TEMPLATE_VERSION,
+        }
+        if sample:
+            fields["sample"] = sample
+        material = json.dumps(fields, sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.read_enabled:
+            with self._lock:
+                self.misses += 1
+            return None
+        path = self._entry_path(key)
+        critique = None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - float(entry.get("created_at", 0)) <= self.ttl_seconds:
+                critique = entry.get("critique")
+                os.utime(path)
+        except (OSError, ValueError):
+            critique = None
+        with self._lock:
+            if critique is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return critique
+
+    def put(self, key: str, critique: str, **meta: str) -> None:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".tmp-{os.getpid()}-{threading.get_ident()}")
+        tmp.write_text(
+            json.dumps({"created_at": time.time(), "critique": critique, **meta}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+        with self._lock:
+            self.stores += 1
+        self.evict()
+
+    def evict(self) -> None:
+        now = time.time()
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        removed = 0
+        total = 0
+        live: List[Tuple[float, int, Path]] = []
+        for mtime, size, path in entries:
+            # mtime is refreshed on hits, so created_at is only read for possibly-expired files.
+            if now - mtime > self.ttl_seconds and self._expired(path, now):
+                removed += self._remove(path)
+                continue
+            live.append((mtime, size, path))
+            total += size
+        for mtime, size, path in sorted(live):
+            if total <= self.max_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+        with self._lock:
+            self.evictions += removed
+
+    def _expired(self, path: Path, now: float) -> bool:
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            return now - float(entry.get("created_at", 0)) > self.ttl_seconds
+        except (OSError, ValueError):
+            return True
+
+    @staticmethod
+    def _remove(path: Path) -> int:
+        try:
+            path.unlink()
+            return 1
+        except FileNotFoundError:
+            return 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "dir": str(self.root),
+                "read_enabled": self.read_enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
+
+
+class BackendRecorder:
+    """Record backend calls into a session dir, or serve them back from a recorded session.
+
+    Calls are keyed by a hash of the argv with the session dir replaced by a placeholder,
+    so prompts that reference round files match across sessions. Repeated identical calls
+    (e.g. fan-out samples) are numbered in call order.
+    """
+
+    SESSION_PLACEHOLDER = "<session_dir>"
+
+    def __init__(self, mode: str, recordings_dir: Path, session_dir: Path) -> None:
+        self.mode = mode
+        self.recordings_dir = recordings_dir
+        self.session_dir = session_dir
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if mode == "record":
+            recordings_dir.mkdir(parents=True, exist_ok=True)
+
+    def normalize(self, cmd: List[str]) -> List[str]:
+        return [arg.replace(str(self.session_dir), self.SESSION_PLACEHOLDER) for arg in cmd]
+
+    def _next_path(self, cmd: List[str]) -> Tuple[Path, List[str]]:
+        normalized = self.normalize(cmd)
+        key = hashlib.sha256(json.dumps(normalized).encode("utf-8")).hexdigest()[:24]
+        with self._lock:
+            seq = self._seen.get(key, 0)
+            self._seen[key] = seq + 1
+        return self.recordings_dir / f"{key}-{seq}.json", normalized
+
+    def save(self, cmd: List[str], res: CmdResult) -> None:
+        path, normalized = self._next_path(cmd)
+        entry = {
+            "argv": normalized,
+            "code": res.code,
+            "stdout": res.stdout,
+            "stderr": res.stderr,
+            "stopped_early": res.stopped_early,
+            "duration_seconds": res.duration_seconds,
+        }
+        path.write_text(json.dumps(entry, ensure_ascii=False, indent=2), encoding="utf-8")
+        with self._lock:
+            self.recorded += 1
+
+    def replay(self, cmd: List[str], on_line: Optional[LineCallback] = None) -> CmdResult:
+        """Return the recorded result; on_line sees stdout lines so --fail-fast behaves as live."""
+        path, _normalized = self._next_path(cmd)
+        if not path.exists():
+            # Fall back to the first recording of the same call (an extra retry or sample).
+            path = path.with_name(path.name.rsplit("-", 1)[0] + "-0.json")
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            log_event(f"debate: warning replay_miss cmd={cmd[0]} key={path.name}")
+            return CmdResult(127, "", f"debate replay: no recording for {cmd[0]} call")
+        with self._lock:
+            self.replayed += 1
+        stdout = entry.get("stdout", "")
+        stopped_early = False
+        if on_line:
+            kept: List[str] = []
+            for line in stdout.splitlines(keepends=True):
+                kept.append(line)
+                if on_line("stdout", line.rstrip("\n")):
+                    stopped_early = True
+                    break
+            stdout = "".join(kept)
+        return CmdResult(
+            int(entry.get("code", 1)),
+            stdout,
+            entry.get("stderr", ""),
+            stopped_early=stopped_early,
+        )
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "dir": str(self.recordings_dir),
+                "recorded": self.recorded,
+                "replayed": self.replayed,
+                "misses": self.misses,
+            }
+
+
+def pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def fair_order(waiters: Dict[str, Dict], served: Dict[str, float]) -> List[str]:
+    """Round-robin over sessions (least recently served first), FIFO within a session."""
+    by_session: Dict[str, List[str]] = {}
+    for token, waiter in sorted(waiters.items(), key=lambda item: item[1]["enqueued"]):
+        by_session.setdefault(waiter["session"], []).append(token)
+    sessions = sorted(by_session, key=lambda name: (served.get(name, 0.0), waiters[by_session[name][0]]["enqueued"]))
+    order: List[str] = []
+    for depth in range(max((len(tokens) for tokens in by_session.values()), default=0)):
+        order.extend(by_session[name][depth] for name in sessions if depth < len(by_session[name]))
+    return order
+
+
+class BackendScheduler:
+    """Cross-process admission control for backend calls, shared through files under the state root.
+
+    Each backend has <root>/<backend>.json (holders, waiters, a requests-per-minute token
+    bucket, last-served time per session) guarded by an flock on <backend>.lock. A call is
+    admitted once it is within the free slots of a round-robin order over sessions; entries
+    left by dead processes are dropped on every pass.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        session_id: str,
+        max_concurrent: Dict[str, int],
+        rpm: Dict[str, int],
+    ) -> None:
+        self.root = root
+        self.session_id = session_id
+        self.max_concurrent = max_concurrent
+        self.rpm = rpm
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.calls = 0
+        self.queue_wait_seconds = 0.0
+        self.model_seconds = 0.0
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def limits(self, backend: str) -> Tuple[int, int]:
+        return (
+            self.max_concurrent.get(backend, DEFAULT_SCHEDULER_MAX_CONCURRENT),
+            self.rpm.get(backend, DEFAULT_SCHEDULER_RPM),
+        )
+
+    def _update(self, backend: str, apply: Callable[[Dict], object]) -> object:
+        with (self.root / f"{backend}.lock").open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            state_file = self.root / f"{backend}.json"
+            try:
+                state = json.loads(state_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                state = {}
+            result = apply(state)
+            write_json(state_file, state)
+            return result
+
+    def _try_grant(self, state: Dict, backend: str, token: str, enqueued: float) -> Tuple[bool, int]:
+        now = time.time()
+        max_concurrent, rpm = self.limits(backend)
+        holders = {key: entry for key, entry in state.get("holders", {}).items() if pid_alive(entry["pid"])}
+        waiters = {key: entry for key, entry in state.get("waiters", {}).items() if pid_alive(entry["pid"])}
+        waiters.setdefault(token, {"pid": os.getpid(), "session": self.session_id, "enqueued": enqueued})
+        # Forget sessions that have been idle for an hour; they rejoin the rotation as new.
+        served = {name: at for name, at in state.get("served", {}).items() if now - at < 3600}
+        tokens = state.get("tokens")
+        if tokens is None:
+            tokens = float(rpm)
+        else:
+            tokens = min(float(rpm), tokens + (now - state.get("refilled_at", now)) * rpm / 60)
+
+        order = fair_order(waiters, served)
+        position = order.index(token)
+        granted = position < min(max_concurrent - len(holders), int(tokens))
+        if granted:
+            holders[token] = {**waiters.pop(token), "since": now}
+            served[self.session_id] = now
+            tokens -= 1
+        state.update(holders=holders, waiters=waiters, served=served, tokens=tokens, refilled_at=now)
+        return granted, position
+
+    def _forget(self, backend: str, token: str) -> None:
+        def apply(state: Dict) -> None:
+            state.get("holders", {}).pop(token, None)
+            state.get("waiters", {}).pop(token, None)
+
+        self._update(backend, apply)
+
+    def _acquire(self, backend: str, token: str, runtime: Optional["BackendRuntime"]) -> float:
+        started = time.monotonic()
+        enqueued = time.time()
+        delay = SCHEDULER_POLL_MIN_SECONDS
+        polls = 0
+        with TRACER.span("scheduler_wait", backend=backend) as span:
+            try:
+                while True:
+                    polls += 1
+                    granted, position = self._update(
+                        backend, lambda state: self._try_grant(state, backend, token, enqueued)
+                    )
+                    if polls == 1:
+                        span["position"] = position
+                    if granted:
+                        break
+                    remaining = runtime.remaining_seconds() if runtime else None
+                    if remaining is not None and remaining <= 0:
+                        raise BudgetExceededError(f"session budget exhausted while queued for {backend}")
+                    if runtime and runtime.cancel is not None and runtime.cancel.is_set():
+                        raise BackendCancelledError(f"{backend} call cancelled while queued")
+                    time.sleep(delay if remaining is None else min(delay, remaining))
+                    delay = min(delay * 2, SCHEDULER_POLL_MAX_SECONDS)
+            except BaseException:
+                self._forget(backend, token)
+                raise
+            finally:
+                span["polls"] = polls
+        return time.monotonic() - started
+
+    @contextlib.contextmanager
+    def slot(self, backend: str, *, runtime: Optional["BackendRuntime"] = None) -> Iterator[float]:
+        """Hold one of the backend's call slots; yields the seconds spent queued."""
+        with self._lock:
+            self._seq += 1
+            token = f"{os.getpid()}-{threading.get_ident()}-{self._seq}"
+        waited = self._acquire(backend, token, runtime)
+        started = time.monotonic()
+        try:
+            yield waited
+        finally:
+            self._forget(backend, token)
+            with self._lock:
+                self.calls += 1
+                self.queue_wait_seconds += waited
+                self.model_seconds += time.monotonic() - started
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "dir": str(self.root),
+                "calls": self.calls,
+                "queue_wait_seconds": round(self.queue_wait_seconds, 3),
+                "model_seconds": round(self.model_seconds, 3),
+            }
+
+
+class SessionIndex:
+    """SQLite index over session metadata in a session base dir (sessions, rounds, findings).
+
+    Rows are replaced wholesale from metadata.json on every write, so the index can always
+    be rebuilt from disk. Concurrent sessions (batch mode) share it through SQLite locking.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            # The index is rebuildable from metadata.json, so skip per-commit fsync.
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SESSION_INDEX_SCHEMA_VERSION:
+                self.conn.executescript(
+                    """
+                    DROP TABLE IF EXISTS findings;
+                    DROP TABLE IF EXISTS rounds;
+                    DROP TABLE IF EXISTS sessions;
+                    """
+                )
+            self.conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    session_dir TEXT,
+                    workspace_root TEXT,
+                    target TEXT,
+                    scope TEXT,
+                    intensity TEXT,
+                    backend TEXT,
+                    status TEXT,
+                    final_decision TEXT,
+                    final_choice TEXT,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    total_duration_seconds REAL,
+                    rounds INTEGER,
+                    p1_total INTEGER,
+                    p2_total INTEGER,
+                    artifact_bytes INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS rounds (
+                    session_id TEXT NOT NULL,
+                    round INTEGER NOT NULL,
+                    choice TEXT,
+                    judge_recommendation TEXT,
+                    judge_reason TEXT,
+                    backend_error INTEGER,
+                    p1_count INTEGER,
+                    p2_count INTEGER,
+                    p3_count INTEGER,
+                    PRIMARY KEY (session_id, round)
+                );
+                CREATE TABLE IF NOT EXISTS findings (
+                    session_id TEXT NOT NULL,
+                    round INTEGER NOT NULL,
+                    severity TEXT NOT NULL,
+                    file TEXT,
+                    text TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started_at);
+                CREATE INDEX IF NOT EXISTS findings_session ON findings (session_id, round);
+                CREATE INDEX IF NOT EXISTS findings_file ON findings (file, severity);
+                PRAGMA user_version = {SESSION_INDEX_SCHEMA_VERSION};
+                """
+            )
+
+    @staticmethod
+    def finding_file(text: str) -> Optional[str]:
+        match = FINDING_PATH_PATTERN.search(text)
+        return match.group(1) if match else None
+
+    def upsert(self, state: Dict) -> None:
+        session_id = state["session_id"]
+        rounds = state.get("rounds", [])
+        session_row = {
+            "session_id": session_id,
+            "session_dir": state.get("session_dir"),
+            "workspace_root": state.get("workspace_root"),
+            "target": state.get("target"),
+            "scope": state.get("scope"),
+            "intensity": state.get("intensity"),
+            "backend": state.get("backend"),
+            "status": state.get("status"),
+            "final_decision": state.get("final_decision"),
+            "final_choice": rounds[-1].get("choice") if rounds else None,
+            "started_at": state.get("started_at"),
+            "completed_at": state.get("completed_at"),
+            "total_duration_seconds": state.get("total_duration_seconds"),
+            "rounds": len(rounds),
+            "p1_total": sum(len(item.get("p1", [])) for item in rounds),
+            "p2_total": sum(len(item.get("p2", [])) for item in rounds),
+            "artifact_bytes": state.get("artifact_bytes"),
+        }
+        round_rows = []
+        finding_rows = []
+        for item in rounds:
+            round_rows.append(
+                (
+                    session_id,
+                    item.get("round"),
+                    item.get("choice"),
+                    item.get("judge_recommendation"),
+                    item.get("judge_reason"),
+                    int(bool(item.get("backend_error"))),
+                    len(item.get("p1", [])),
+                    len(item.get("p2", [])),
+                    len(item.get("p3", [])),
+                )
+            )
+            for severity in (*SEVERITY_SECTIONS, "missing"):
+                for text in item.get(severity, []):
+                    finding_rows.append((session_id, item.get("round"), severity, self.finding_file(text), text))
+        columns = ", ".join(session_row)
+        placeholders = ", ".join(f":{name}" for name in session_row)
+        with self._lock, self.conn:
+            self.conn.execute(f"INSERT OR REPLACE INTO sessions ({columns}) VALUES ({placeholders})", session_row)
+            self.conn.execute("DELETE FROM rounds WHERE session_id = ?", (session_id,))
+            self.conn.execute("DELETE FROM findings WHERE session_id = ?", (session_id,))
+            self.conn.executemany("INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", round_rows)
+            self.conn.executemany("INSERT INTO findings VALUES (?, ?, ?, ?, ?)", finding_rows)
+
+    def remove(self, session_id: str) -> None:
+        with self._lock, self.conn:
+            for table in ("findings", "rounds", "sessions"):
+                self.conn.execute(f"DELETE FROM {table} WHERE session_id = ?", (session_id,))
+
+    def rebuild(self, session_base_dir: Path) -> int:
+        with self._lock, self.conn:
+            for table in ("findings", "rounds", "sessions"):
+                self.conn.execute(f"DELETE FROM {table}")
+        count = 0
+        for entry in list_stored_sessions(session_base_dir):
+            state = read_stored_metadata(entry)
+            if state is None:
+                log_event(f"debate: warning index_skip path={entry.path}")
+                continue
+            if "session_id" in state:
+                self.upsert(state)
+                count += 1
+        return count
+
+    def set_location(self, session_id: str, location: Path) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE sessions SET session_dir = ? WHERE session_id = ?", (str(location), session_id)
+            )
+
+    def query(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def apply_session_events(state: Dict, events: List[Dict]) -> Dict:
+    """Fold journal events into a session state (a metadata.json snapshot or {})."""
+    applied = int(state.get("journal_seq", 0))
+    for event in events:
+        seq = int(event.get("seq", 0))
+        if seq <= applied:
+            continue
+        kind = event.get("type")
+        if kind == "state":
+            state.update(event.get("fields", {}))
+        elif kind == "round":
+            entry = event.get("entry", {})
+            rounds = [item for item in state.get("rounds", []) if item.get("round") != entry.get("round")]
+            state["rounds"] = sorted([*rounds, entry], key=lambda item: item.get("round", 0))
+        elif kind == "rounds_truncate":
+            state["rounds"] = state.get("rounds", [])[: int(event.get("keep", 0))]
+        applied = seq
+    state["journal_seq"] = applied
+    return state
+
+
+def parse_session_events(text: str) -> List[Dict]:
+    events = []
+    for line in text.splitlines():
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            # A torn final line from a crash mid-append; everything before it is intact.
+            break
+    return events
+
+
+class SessionJournal:
+    """Append-only events.jsonl journal with a periodically compacted metadata.json snapshot.
+
+    checkpoint() appends only what changed since the last call (new or rewritten rounds,
+    changed top-level fields) as one O_APPEND write, so per-round cost stays constant and
+    readers can tail the file. fsync is batched to once per EVENT_FSYNC_INTERVAL_SECONDS,
+    and metadata.json (plus the session index) is rewritten atomically at most once per
+    SNAPSHOT_INTERVAL_SECONDS or when forced. Readers fold newer events over the snapshot.
+    """
+
+    def __init__(
+        self,
+        session_dir: Path,
+        *,
+        index: Optional[SessionIndex] = None,
+        baseline: Optional[Dict] = None,
+    ) -> None:
+        """baseline is the state already in the journal (when resuming); only changes to it are logged."""
+        baseline = json.loads(json.dumps(baseline or {}, default=str))
+        self.session_dir = session_dir
+        self.index = index
+        self.seq = int(baseline.pop("journal_seq", 0))
+        self._fd = os.open(session_dir / SESSION_EVENTS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._rounds: List[Dict] = baseline.pop("rounds", [])
+        self._fields: Dict[str, object] = baseline
+        self._dirty = False
+        self._last_fsync = time.monotonic()
+        self._last_snapshot = float("-inf")
+
+    def _events_for(self, state: Dict) -> List[Dict]:
+        events: List[Dict] = []
+        changed = {
+            key: value
+            for key, value in state.items()
+            if key not in ("rounds", "journal_seq") and self._fields.get(key, object()) != value
+        }
+        if changed:
+            events.append({"type": "state", "fields": changed})
+            self._fields.update(json.loads(json.dumps(changed, default=str)))
+        rounds = state.get("rounds", [])
+        keep = 0
+        while keep < min(len(rounds), len(self._rounds)) and rounds[keep] == self._rounds[keep]:
+            keep += 1
+        if keep < len(self._rounds):
+            events.append({"type": "rounds_truncate", "keep": keep})
+        events += [{"type": "round", "entry": entry} for entry in rounds[keep:]]
+        self._rounds = json.loads(json.dumps(rounds, default=str))
+        return events
+
+    def checkpoint(self, state: Dict, *, snapshot: bool = False) -> None:
+        events = self._events_for(state)
+        if events:
+            now = dt.datetime.now().isoformat()
+            lines = []
+            for event in events:
+                self.seq += 1
+                lines.append(json.dumps({"seq": self.seq, "ts": now, **event}, ensure_ascii=False, default=str))
+            os.write(self._fd, ("\n".join(lines) + "\n").encode("utf-8"))
+            self._dirty = True
+        if self._dirty and (snapshot or time.monotonic() - self._last_fsync >= EVENT_FSYNC_INTERVAL_SECONDS):
+            os.fsync(self._fd)
+            self._dirty = False
+            self._last_fsync = time.monotonic()
+        if snapshot or time.monotonic() - self._last_snapshot >= SNAPSHOT_INTERVAL_SECONDS:
+            self.snapshot(state)
+
+    def snapshot(self, state: Dict) -> None:
+        state["journal_seq"] = self.seq
+        write_json(self.session_dir / "metadata.json", state)
+        self._last_snapshot = time.monotonic()
+        if self.index is None:
+            return
+        try:
+            self.index.upsert(state)
+        except sqlite3.Error as exc:
+            log_event(f"debate: warning session_index_write_failed error={exc}")
+
+    def close(self) -> None:
+        if self._fd < 0:
+            return
+        fd, self._fd = self._fd, -1
+        try:
+            if self._dirty:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+@dataclasses.dataclass
+class StoredSession:
+    """A session in the store: a live directory or a compacted archive/<session_id>.zip."""
+
+    session_id: str
+    path: Path
+    archived: bool
+
+
+@dataclasses.dataclass
+class RetentionPolicy:
+    max_age_days: float = DEFAULT_RETENTION_MAX_AGE_DAYS
+    max_bytes: int = DEFAULT_RETENTION_MAX_MB * 1024 * 1024
+    # The newest keep_last sessions are never compacted or deleted.
+    keep_last: int = DEFAULT_RETENTION_KEEP_LAST
+    compact_after_days: float = DEFAULT_COMPACT_AFTER_DAYS
+    stale_after_days: float = DEFAULT_RETENTION_STALE_DAYS
+
+
+def list_stored_sessions(session_base_dir: Path) -> List[StoredSession]:
+    """All sessions, oldest first (session ids embed their start time)."""
+    entries: Dict[str, StoredSession] = {}
+    for path in session_base_dir.glob(f"{SESSION_ARCHIVE_DIR_NAME}/debate-*.zip"):
+        entries[path.stem] = StoredSession(path.stem, path, True)
+    for path in session_base_dir.glob("debate-*"):
+        if path.is_dir():
+            entries[path.name] = StoredSession(path.name, path, False)
+    return [entries[key] for key in sorted(entries)]
+
+
+def read_stored_file(entry: StoredSession, name: str) -> Optional[str]:
+    try:
+        if entry.archived:
+            with zipfile.ZipFile(entry.path) as archive:
+                return archive.read(name).decode("utf-8", errors="replace")
+        return (entry.path / name).read_text(encoding="utf-8", errors="replace")
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def read_stored_metadata(entry: StoredSession) -> Optional[Dict]:
+    """Latest session state: the metadata.json snapshot with newer events.jsonl records applied."""
+    text = read_stored_file(entry, "metadata.json")
+    events_text = read_stored_file(entry, SESSION_EVENTS_FILE)
+    state: Dict = {}
+    if text is not None:
+        try:
+            state = json.loads(text)
+        except ValueError:
+            # Snapshots are written atomically, but fall back to the journal alone if one is damaged.
+            state = {}
+    if events_text:
+        state = apply_session_events(state, parse_session_events(events_text))
+    if not state:
+        return None
+    if entry.archived:
+        state["session_dir"] = str(entry.path)
+    return state
+
+
+def stored_session_bytes(entry: StoredSession) -> int:
+    if entry.archived:
+        return entry.path.stat().st_size
+    return sum(path.stat().st_size for path in entry.path.rglob("*") if path.is_file())
+
+
+def compact_session(entry: StoredSession, archive_dir: Path) -> StoredSession:
+    """Pack a session dir into archive/<session_id>.zip and remove the dir."""
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    dest = archive_dir / f"{entry.session_id}.zip"
+    tmp = dest.with_suffix(f".zip.tmp-{os.getpid()}")
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for path in sorted(entry.path.rglob("*")):
+            if path.is_file():
+                archive.write(path, path.relative_to(entry.path).as_posix())
+    os.replace(tmp, dest)
+    # Keep the session's age: retention compares mtimes, and compaction is not activity.
+    mtime = entry.path.stat().st_mtime
+    os.utime(dest, (mtime, mtime))
+    shutil.rmtree(entry.path)
+    return StoredSession(entry.session_id, dest, True)
+
+
+def delete_stored_session(entry: StoredSession) -> None:
+    if entry.archived:
+        entry.path.unlink(missing_ok=True)
+    else:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def list_batch_dirs(session_base_dir: Path) -> List[StoredSession]:
+    """Batch run dirs (per-item logs, batch-decision.json); retained alongside sessions, never compacted."""
+    return [StoredSession(path.name, path, False) for path in session_base_dir.glob("batch-*") if path.is_dir()]
+
+
+def stored_session_finished(entry: StoredSession) -> bool:
+    """Closed sessions (archives always are) and batches that wrote their decision or whose process is gone."""
+    if entry.archived:
+        return True
+    if entry.session_id.startswith("batch-"):
+        if (entry.path / "batch-decision.json").exists():
+            return True
+        pid = entry.session_id.rsplit("-", 1)[-1]
+        return not (pid.isdigit() and pid_alive(int(pid)))
+    return (read_stored_metadata(entry) or {}).get("status") == "closed"
+
+
+def run_session_gc(
+    session_base_dir: Path,
+    policy: RetentionPolicy,
+    *,
+    index: Optional[SessionIndex] = None,
+    exclude: Tuple[str, ...] = (),
+    time_budget_seconds: Optional[float] = None,
+    dry_run: bool = False,
+) -> Dict:
+    """Apply the retention policy: compact closed sessions, then delete by age and total size.
+
+    Only finished sessions and batch dirs are deleted; an unfinished one (resumable, or
+    live in another process) goes only once older than policy.stale_after_days. Only one
+    process collects at a time (others return immediately), and work stops once
+    time_budget_seconds is used up; the next run picks up where this one stopped.
+    """
+    stats: Dict = {"compacted": [], "deleted": [], "bytes_before": 0, "bytes_after": 0, "complete": True}
+    started = time.monotonic()
+    session_base_dir.mkdir(parents=True, exist_ok=True)
+    with (session_base_dir / ".gc.lock").open("a") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            stats["complete"] = False
+            stats["skipped"] = "another gc is running"
+            return stats
+
+        def out_of_time() -> bool:
+            if time_budget_seconds is not None and time.monotonic() - started > time_budget_seconds:
+                stats["complete"] = False
+                return True
+            return False
+
+        entries = list_stored_sessions(session_base_dir)
+        protected = {entry.session_id for entry in entries[-policy.keep_last :]} if policy.keep_last else set()
+        protected.update(exclude)
+        # Ids embed the start time after the prefix, so this interleaves batches and sessions by age.
+        entries = sorted(
+            entries + list_batch_dirs(session_base_dir), key=lambda entry: entry.session_id.split("-", 1)[1]
+        )
+        stale_after_days = max(policy.max_age_days, policy.stale_after_days)
+        now = time.time()
+        sizes: Dict[str, int] = {}
+        finished: Dict[str, bool] = {}
+        kept: List[StoredSession] = []
+
+        def is_finished(entry: StoredSession) -> bool:
+            if entry.session_id not in finished:
+                finished[entry.session_id] = stored_session_finished(entry)
+            return finished[entry.session_id]
+
+        for entry in entries:
+            if out_of_time():
+                return stats
+            try:
+                age_days = (now - entry.path.stat().st_mtime) / 86400
+                sizes[entry.session_id] = stored_session_bytes(entry)
+            except OSError:
+                continue
+            stats["bytes_before"] += sizes[entry.session_id]
+            if entry.session_id in protected:
+                kept.append(entry)
+                continue
+            if age_days > policy.max_age_days and (age_days > stale_after_days or is_finished(entry)):
+                stats["deleted"].append(entry.session_id)
+                if not dry_run:
+                    delete_stored_session(entry)
+                    if index:
+                        index.remove(entry.session_id)
+                continue
+            if (
+                not entry.archived
+                and not entry.session_id.startswith("batch-")
+                and age_days > policy.compact_after_days
+                and is_finished(entry)
+            ):
+                stats["compacted"].append(entry.session_id)
+                if not dry_run:
+                    entry = compact_session(entry, session_base_dir / SESSION_ARCHIVE_DIR_NAME)
+                    sizes[entry.session_id] = stored_session_bytes(entry)
+                    if index:
+                        index.set_location(entry.session_id, entry.path)
+            kept.append(entry)
+
+        total = sum(sizes.get(entry.session_id, 0) for entry in kept)
+        for entry in kept:
+            if total <= policy.max_bytes or out_of_time():
+                break
+            if entry.session_id in protected or not is_finished(entry):
+                continue
+            stats["deleted"].append(entry.session_id)
+            total -= sizes.get(entry.session_id, 0)
+            if not dry_run:
+                delete_stored_session(entry)
+                if index:
+                    index.remove(entry.session_id)
+        stats["bytes_after"] = total
+    return stats
+
+
+def maybe_run_session_gc(
+    session_base_dir: Path,
+    policy: RetentionPolicy,
+    *,
+    index: Optional[SessionIndex],
+    exclude: Tuple[str, ...],
+) -> None:
+    """Opportunistic GC at session start: at most once per GC_MIN_INTERVAL_SECONDS, time-boxed."""
+    stamp = session_base_dir / ".gc-stamp"
+    try:
+        if time.time() - stamp.stat().st_mtime < GC_MIN_INTERVAL_SECONDS:
+            return
+    except FileNotFoundError:
+        pass
+    try:
+        stamp.touch()
+        with TRACER.span("session_gc") as span:
+            stats = run_session_gc(
+                session_base_dir,
+                policy,
+                index=index,
+                exclude=exclude,
+                time_budget_seconds=DEFAULT_GC_TIME_BUDGET_SECONDS,
+            )
+            span.update(compacted=len(stats["compacted"]), deleted=len(stats["deleted"]), complete=stats["complete"])
+    except (OSError, sqlite3.Error, zipfile.BadZipFile) as exc:
+        log_event(f"debate: warning session_gc_failed error={exc}")
+        return
+    if stats["compacted"] or stats["deleted"]:
+        log_event(
+            f"debate: session_gc compacted={len(stats['compacted'])} deleted={len(stats['deleted'])} "
+            f"complete={stats['complete']}"
+        )
+
+
+@dataclasses.dataclass
+class BackendRuntime:
+    """Session-wide settings shared by every backend model call."""
+
+    deadline: Optional[float] = None
+    stream_output: bool = False
+    cache: Optional[CritiqueCache] = None
+    # Stop a streaming review once this many P1 findings arrived (0 disables fail-fast).
+    fail_fast_p1: int = 0
+    recorder: Optional[BackendRecorder] = None
+    scheduler: Optional[BackendScheduler] = None
+    # Set to kill this call's backend process (the other side of a hedged review won).
+    cancel: Optional[threading.Event] = None
+    # Watches the streamed critique of a single-reviewer round (--speculative-revision).
+    speculator: Optional["RevisionSpeculator"] = None
+    # Per-stream cap on captured backend output (None keeps everything).
+    max_output_bytes: Optional[int] = None
+
+    def remaining_seconds(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def call_timeout(self, timeout: float) -> float:
+        remaining = self.remaining_seconds()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise BudgetExceededError("session budget exhausted before backend call")
+        return min(timeout, remaining)
 
 
 @dataclasses.dataclass
@@ -94,6 +1309,34 @@ class ParsedCritique:
     missing: List[str]
     recommendation: Optional[str]
     backend_error: bool
+    reviewers: int = 1
+    # Number of reviewers that raised each finding (only populated for fan-out merges).
+    support: Dict[str, int] = dataclasses.field(default_factory=dict)
+    early_stop_reason: Optional[str] = None
+
+
+@dataclasses.dataclass
+class DiffChunk:
+    files: List[str]
+    text: str
+
+
+@dataclasses.dataclass
+class ReviewOutcome:
+    name: str
+    critique: Optional[str]
+    error: Optional[str]
+    duration_seconds: float
+    exception: Optional[BaseException] = None
+
+    def timing_entry(self) -> Dict:
+        entry: Dict = {
+            "status": "ok" if self.error is None else "error",
+            "duration_seconds": self.duration_seconds,
+        }
+        if self.error is not None:
+            entry["error"] = self.error
+        return entry
 
 
 def run_cmd(
@@ -102,29 +1345,262 @@ def run_cmd(
     cwd: Optional[Path] = None,
     timeout: int = 600,
 ) -> CmdResult:
-    proc = subprocess.run(
-        cmd,
+    with TRACER.span("run_cmd", cmd=" ".join(cmd[:2])) as span:
+        proc = subprocess.run(
+            cmd,
+            cwd=str(cwd) if cwd else None,
+            text=True,
+            capture_output=True,
+            timeout=timeout,
+        )
+        span.update(exit_code=proc.returncode, bytes_out=len(proc.stdout) + len(proc.stderr))
+    return CmdResult(proc.returncode, proc.stdout.strip(), proc.stderr.strip())
+
+
+def truncation_marker(limit: int) -> str:
+    return f"\n[debate: output truncated at {limit} bytes]\n"
+
+
+async def _pump_stream(
+    reader: asyncio.StreamReader,
+    name: str,
+    sink: List[str],
+    on_line: Optional[LineCallback],
+    stop: asyncio.Event,
+    limit: Optional[int] = None,
+) -> bool:
+    """Decode reader into sink; past limit bytes the rest is drained and dropped. Returns truncated."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    kept = 0
+    truncated = False
+    while True:
+        chunk = await reader.read(STREAM_READ_CHUNK_BYTES)
+        if limit is not None and kept + len(chunk) > limit:
+            chunk = chunk[: limit - kept]
+            truncated = True
+        kept += len(chunk)
+        text = decoder.decode(chunk, final=not chunk or truncated)
+        if text:
+            sink.append(text)
+            pending += text
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                if on_line and on_line(name, line):
+                    stop.set()
+        if not chunk or truncated:
+            break
+    if pending and on_line and on_line(name, pending):
+        stop.set()
+    if truncated:
+        # Keep draining so the child never blocks on a full pipe.
+        while await reader.read(STREAM_READ_CHUNK_BYTES):
+            pass
+    return truncated
+
+
+def _kill_process_group(proc: Union[asyncio.subprocess.Process, subprocess.Popen]) -> None:
+    if proc.returncode is not None:
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+
+
+async def run_cmd_async(
+    cmd: List[str],
+    *,
+    cwd: Optional[Path] = None,
+    timeout: float = 600,
+    deadline: Optional[float] = None,
+    on_line: Optional[LineCallback] = None,
+    max_output_bytes: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> CmdResult:
+    """Run cmd, delivering stdout/stderr lines to on_line as they arrive.
+
+    The call is bounded by both timeout and the absolute monotonic deadline. Hitting
+    the deadline raises BudgetExceededError; hitting timeout raises TimeoutExpired.
+    on_line may return True to stop the process early (result.stopped_early).
+    Setting cancel kills the process and raises BackendCancelledError.
+    Each stream keeps at most max_output_bytes; the rest is discarded behind a marker.
+    """
+    started = time.monotonic()
+    budget_bound = False
+    limit = timeout
+    if deadline is not None:
+        remaining = deadline - started
+        if remaining <= 0:
+            raise BudgetExceededError("session budget exhausted before backend call")
+        if remaining < timeout:
+            limit = remaining
+            budget_bound = True
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
         cwd=str(cwd) if cwd else None,
-        text=True,
-        capture_output=True,
-        timeout=timeout,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
     )
-    return CmdResult(proc.returncode, proc.stdout.strip(), proc.stderr.strip())
+    out: List[str] = []
+    err: List[str] = []
+    stop = asyncio.Event()
+    assert proc.stdout is not None and proc.stderr is not None
+    pumps = asyncio.gather(
+        _pump_stream(proc.stdout, "stdout", out, on_line, stop, max_output_bytes),
+        _pump_stream(proc.stderr, "stderr", err, on_line, stop, max_output_bytes),
+    )
+
+    async def finish() -> List[bool]:
+        truncated = await pumps
+        await proc.wait()
+        return truncated
+
+    async def cancelled() -> None:
+        while cancel is not None and not cancel.is_set():
+            await asyncio.sleep(CANCEL_POLL_SECONDS)
+
+    finisher = asyncio.ensure_future(finish())
+    stopper = asyncio.ensure_future(stop.wait())
+    watchers = {finisher, stopper}
+    if cancel is not None:
+        watchers.add(asyncio.ensure_future(cancelled()))
+    try:
+        done, _pending = await asyncio.wait(watchers, timeout=limit, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for watcher in watchers - {finisher}:
+            watcher.cancel()
+    stopped_early = False
+    if finisher not in done:
+        _kill_process_group(proc)
+        await finisher
+        stdout, stderr = "".join(out), "".join(err)
+        if cancel is not None and cancel.is_set() and not stop.is_set():
+            raise BackendCancelledError(f"{cmd[0]} call cancelled after {round(time.monotonic() - started, 1)}s")
+        if stop.is_set():
+            stopped_early = True
+        elif budget_bound:
+            raise BudgetExceededError(f"session budget exhausted during {cmd[0]} call after {round(limit, 1)}s")
+        else:
+            raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+    out_truncated, err_truncated = finisher.result()
+    stdout = "".join(out).strip()
+    stderr = "".join(err).strip()
+    if out_truncated:
+        stdout += truncation_marker(max_output_bytes or 0)
+    if err_truncated:
+        stderr += truncation_marker(max_output_bytes or 0)
+    return CmdResult(
+        proc.returncode if proc.returncode is not None else -1,
+        stdout,
+        stderr,
+        stopped_early=stopped_early,
+        duration_seconds=round(time.monotonic() - started, 3),
+        truncated=out_truncated or err_truncated,
+    )
+
+
+def run_backend_cmd(
+    cmd: List[str],
+    *,
+    cwd: Optional[Path] = None,
+    timeout: int = 600,
+    runtime: Optional[BackendRuntime] = None,
+    on_line: Optional[LineCallback] = None,
+) -> CmdResult:
+    runtime = runtime or BackendRuntime()
+    callback = on_line
+    if runtime.stream_output:
+        label = cmd[0]
+
+        def callback(stream: str, line: str) -> Optional[bool]:
+            if line.strip():
+                log_event(f"[{label} {stream}] {line}")
+            return on_line(stream, line) if on_line else None
+
+    recorder = runtime.recorder
+    scheduler = runtime.scheduler if not (recorder and recorder.mode == "replay") else None
+    # Queue time for a shared scheduler slot stays outside the backend_cmd span.
+    slot = scheduler.slot(Path(cmd[0]).name, runtime=runtime) if scheduler else contextlib.nullcontext(None)
+    with slot as queue_wait, TRACER.span(
+        "backend_cmd", cmd=" ".join(cmd[:2]), bytes_in=sum(len(arg) for arg in cmd)
+    ) as span:
+        if queue_wait is not None:
+            span["queue_wait_seconds"] = round(queue_wait, 3)
+        if recorder and recorder.mode == "replay":
+            span["replayed"] = True
+            res = recorder.replay(cmd, on_line=callback)
+        else:
+            res = asyncio.run(
+                run_cmd_async(
+                    cmd,
+                    cwd=cwd,
+                    timeout=timeout,
+                    deadline=runtime.deadline,
+                    on_line=callback,
+                    max_output_bytes=runtime.max_output_bytes,
+                    cancel=runtime.cancel,
+                )
+            )
+            if recorder:
+                try:
+                    recorder.save(cmd, res)
+                except OSError as exc:
+                    log_event(f"debate: warning record_failed error={exc}")
+        span.update(
+            exit_code=res.code,
+            bytes_out=len(res.stdout) + len(res.stderr),
+            stopped_early=res.stopped_early,
+            truncated=res.truncated,
+        )
+    # Surface the exit code on the enclosing phase span (call_backend_review, generate_compromise, ...).
+    TRACER.annotate(exit_code=res.code)
+    return res
 
 
 def log_event(message: str) -> None:
     print(message, file=sys.stderr, flush=True)
 
 
+# Environment probe results, keyed by probe and inputs. None (the default) disables caching;
+# `debate.py serve` workers enable it so repeated jobs skip the tool and git probes.
+PROBE_CACHE: Optional[Dict[Tuple[str, ...], object]] = None
+
+
 def require_tool(name: str) -> bool:
-    return run_cmd(["/usr/bin/env", "bash", "-lc", f"command -v {shlex.quote(name)}"]).code == 0
+    key = ("require_tool", name, os.getenv("PATH", ""))
+    if PROBE_CACHE is not None and key in PROBE_CACHE:
+        return bool(PROBE_CACHE[key])
+    with TRACER.span("require_tool", tool=name) as span:
+        # The current PATH is what subprocesses will use; only tools defined by the login
+        # profile need the (slow) login-shell probe.
+        if shutil.which(name):
+            span["via"] = "path"
+            found = True
+        else:
+            span["via"] = "login_shell"
+            found = run_cmd(["/usr/bin/env", "bash", "-lc", f"command -v {shlex.quote(name)}"]).code == 0
+    if PROBE_CACHE is not None:
+        PROBE_CACHE[key] = found
+    return found
 
 
 def get_git_root() -> Optional[Path]:
-    res = run_cmd(["git", "rev-parse", "--show-toplevel"])
-    if res.code != 0:
-        return None
-    return Path(res.stdout)
+    key = ("get_git_root", os.getcwd())
+    if PROBE_CACHE is not None and key in PROBE_CACHE:
+        return PROBE_CACHE[key]  # type: ignore[return-value]
+    with TRACER.span("get_git_root"):
+        res = run_cmd(["git", "rev-parse", "--show-toplevel"])
+    root = Path(res.stdout) if res.code == 0 else None
+    if PROBE_CACHE is not None:
+        PROBE_CACHE[key] = root
+    return root
 
 
 def detect_env() -> str:
@@ -188,89 +1664,295 @@ def is_tmp_path(path: Path) -> bool:
     return False
 
 
-def classify_text_target(text: str) -> str:
-    has_code = "```" in text
-    proposal_markers = re.search(PROPOSAL_SECTION_PATTERN, text)
-    if has_code and proposal_markers:
-        return "mixed"
-    if has_code:
-        return "code"
-    if proposal_markers:
-        return "proposal"
-    return "proposal"
+@dataclasses.dataclass
+class MdToken:
+    kind: str  # "fence" | "heading" | "bullet" | "text"
+    raw: str  # source text; for fences the whole block including fence lines
+    level: int = 0  # heading level
+    body: str = ""  # heading title / bullet item
+    closed: bool = True  # False for a fence that runs to end of input
 
 
-def parse_scope(scope: str) -> Tuple[str, Optional[str]]:
-    if ":" not in scope:
-        return scope, None
-    k, v = scope.split(":", 1)
-    return k, v
+class MarkdownTokenizer:
+    """Single-pass, line-oriented markdown tokenizer.
+
+    Recognizes fenced blocks (``` or ~~~, closed only by a fence of the same character that
+    is at least as long, so nested shorter fences stay inside), ATX headings and bullet
+    lines; everything else is a text token. Lines inside a fence never produce headings
+    or bullets. Tokens are emitted as soon as they are complete, so the tokenizer can
+    consume streaming output; call finish() to flush an unterminated fence.
+    """
+
+    def __init__(self) -> None:
+        self._fence_char = ""
+        self._fence_len = 0
+        self._fence_lines: List[str] = []
+
+    def feed_line(self, raw: str) -> Optional[MdToken]:
+        if self._fence_lines:
+            self._fence_lines.append(raw)
+            stripped = raw.strip()
+            if (
+                stripped.startswith(self._fence_char * self._fence_len)
+                and not stripped.strip(self._fence_char)
+                and len(raw) - len(raw.lstrip(" ")) <= 3
+            ):
+                block = "\n".join(self._fence_lines)
+                self._fence_lines = []
+                return MdToken("fence", block)
+            return None
+
+        stripped = raw.lstrip()
+        first = stripped[:1]
+        if first in ("`", "~"):
+            match = MD_FENCE_PATTERN.match(raw)
+            # A backtick fence's info string may not contain backticks (that is inline code).
+            if match and not (match.group(1)[0] == "`" and "`" in match.group(2)):
+                self._fence_char = match.group(1)[0]
+                self._fence_len = len(match.group(1))
+                self._fence_lines = [raw]
+                return None
+        elif first == "#":
+            match = MD_HEADING_PATTERN.match(raw)
+            if match:
+                return MdToken("heading", raw, level=len(match.group(1)), body=match.group(2))
+        elif first in ("-", "*"):
+            return MdToken("bullet", raw, body=stripped.rstrip()[1:].strip())
+        return MdToken("text", raw)
+
+    def finish(self) -> Optional[MdToken]:
+        if not self._fence_lines:
+            return None
+        block = "\n".join(self._fence_lines)
+        self._fence_lines = []
+        return MdToken("fence", block, closed=False)
+
+
+def tokenize_markdown(text: str) -> List[MdToken]:
+    tokenizer = MarkdownTokenizer()
+    tokens = [token for token in map(tokenizer.feed_line, text.splitlines()) if token is not None]
+    tail = tokenizer.finish()
+    if tail is not None:
+        tokens.append(tail)
+    return tokens
+
+
+def is_proposal_heading(token: MdToken) -> bool:
+    return token.kind == "heading" and PROPOSAL_HEADING_PATTERN.match(token.body) is not None
+
+
+def classify_text_target(text: str, tokens: Optional[List[MdToken]] = None) -> str:
+    tokens = tokenize_markdown(text) if tokens is None else tokens
+    has_code = any(token.kind == "fence" for token in tokens)
+    proposal_markers = any(is_proposal_heading(token) for token in tokens)
+    if has_code and proposal_markers:
+        return "mixed"
+    if has_code:
+        return "code"
+    if proposal_markers:
+        return "proposal"
+    return "proposal"
+
+
+def parse_scope(scope: str) -> Tuple[str, Optional[str]]:
+    if ":" not in scope:
+        return scope, None
+    k, v = scope.split(":", 1)
+    return k, v
+
+
+def git_collect_cmd(scope: str) -> List[str]:
+    """One git invocation per scope that prints per-file numstat followed by the patch."""
+    kind, value = parse_scope(scope)
+    if kind == "uncommitted":
+        return ["git", "diff", "--numstat", "--patch"]
+    if kind == "commit" and value:
+        # A merge is reviewed as what it brought into its first parent; plain `git show` prints
+        # no patch (or a combined one) for merges.
+        return ["git", "show", "--first-parent", "--numstat", "--patch", value]
+    if kind == "base" and value:
+        return ["git", "diff", "--numstat", "--patch", f"{value}...HEAD"]
+    if kind == "range" and value:
+        return ["git", "diff", "--numstat", "--patch", value]
+    if kind == "file" and value:
+        return ["git", "diff", "--numstat", "--patch", "--", value]
+    raise ValueError(f"Unsupported scope: {scope}")
+
+
+def parse_numstat_line(line: str) -> Optional[Dict]:
+    match = NUMSTAT_LINE_PATTERN.match(line)
+    if not match:
+        return None
+    added, deleted, path = match.groups()
+    binary = added == "-"
+    return {
+        "path": path,
+        "added": 0 if binary else int(added),
+        "deleted": 0 if binary else int(deleted),
+        "binary": binary,
+    }
+
+
+def stream_git_artifact(
+    cmd: List[str],
+    *,
+    cwd: Path,
+    dest: Path,
+    max_bytes: int,
+    timeout: int = 600,
+) -> Tuple[List[Dict], bool]:
+    """Stream `--numstat --patch` output into dest without holding it in memory.
+
+    Numstat lines precede the first file header (`diff --git`, or `diff --cc` in a combined
+    merge diff; for `git show` they follow the commit header, which is kept) and are
+    returned as per-file stats. At most max_bytes
+    of patch are written; past that the process is killed and a truncation marker added.
+    A git that runs longer than timeout seconds (a hung hook, lock or network filesystem)
+    has its process group killed and raises RuntimeError. Returns (per-file stats, truncated).
+    """
+    files: List[Dict] = []
+    written = 0
+    truncated = False
+    with TRACER.span("run_cmd", cmd=" ".join(cmd[:2]), dest=dest.name) as span, tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, cwd=str(cwd), stdout=subprocess.PIPE, stderr=err, start_new_session=True)
+        assert proc.stdout is not None
+        # The read loop blocks on git's stdout; killing the group closes it and ends the loop.
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            _kill_process_group(proc)
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            with proc.stdout, dest.open("wb") as out:
+                in_patch = False
+                drop_blank = False
+                for raw in proc.stdout:
+                    if not in_patch:
+                        if raw.startswith(GIT_PATCH_HEADER_PREFIXES):
+                            in_patch = True
+                        else:
+                            stat = parse_numstat_line(raw.decode("utf-8", errors="replace").rstrip("\n"))
+                            if stat:
+                                files.append(stat)
+                                drop_blank = True
+                                continue
+                            if drop_blank and raw == b"\n":
+                                drop_blank = False
+                                continue
+                    if written + len(raw) > max_bytes:
+                        truncated = True
+                        out.write(truncation_marker(max_bytes).encode("utf-8"))
+                        _kill_process_group(proc)
+                        break
+                    out.write(raw)
+                    written += len(raw)
+            code = proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:  # an exception left git running
+                _kill_process_group(proc)
+                proc.wait()
+        span.update(exit_code=code, bytes_out=written, truncated=truncated)
+        if timed_out.is_set():
+            raise RuntimeError(f"{' '.join(cmd[:2])} timed out after {timeout}s")
+        if code != 0 and not truncated:
+            err.seek(0)
+            message = err.read().decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"{' '.join(cmd[:2])} failed: {message}")
+    return files, truncated
+
+
+def copy_capped(src: Path, dest: Path, max_bytes: int) -> bool:
+    """Copy at most max_bytes of src to dest (plus a truncation marker). Returns truncated."""
+    with src.open("rb") as fin, dest.open("wb") as fout:
+        copied = 0
+        while copied < max_bytes:
+            block = fin.read(min(STREAM_READ_CHUNK_BYTES, max_bytes - copied))
+            if not block:
+                return False
+            fout.write(block)
+            copied += len(block)
+        if not fin.read(1):
+            return False
+        fout.write(truncation_marker(max_bytes).encode("utf-8"))
+        return True
+
+
+def link_or_copy(src: Path, dest: Path) -> None:
+    """Materialize dest with src's content; a hard link avoids a second copy on disk."""
+    # Never write through an existing dest: it may itself be a link to src.
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+def file_has_content(path: Path) -> bool:
+    """True when path holds any non-whitespace byte; scans via mmap instead of reading it in."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return False
+    if size == 0:
+        return False
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return NON_SPACE_BYTES_PATTERN.search(mm) is not None
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    if path.stat().st_size == 0:
+        return digest.hexdigest()
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        digest.update(mm)
+    return digest.hexdigest()
+
+
+def artifact_file_totals(files: List[Dict]) -> Dict:
+    return {
+        "files": len(files),
+        "added": sum(item.get("added", 0) for item in files),
+        "deleted": sum(item.get("deleted", 0) for item in files),
+    }
+
+
+def write_artifact_stats(session_dir: Path, scope: str, files: List[Dict], truncated: bool) -> None:
+    write_json(
+        session_dir / "artifact.files.json",
+        {"scope": scope, "truncated": truncated, "totals": artifact_file_totals(files), "files": files},
+    )
 
 
 def collect_code_artifact(
     git_root: Path,
     scope: str,
-    session_dir: Path,
-) -> Tuple[str, str, str]:
+    dest: Path,
+    *,
+    max_bytes: int,
+) -> Tuple[List[Dict], str, bool]:
+    """Stream the artifact for a git scope into dest; return (per-file stats, artifact_kind, truncated)."""
     kind, value = parse_scope(scope)
-    artifact_kind = "diff"
-    if kind == "uncommitted":
-        diff_res = run_cmd(["git", "diff"], cwd=git_root)
-        stat_res = run_cmd(["git", "diff", "--stat"], cwd=git_root)
-        if diff_res.code != 0:
-            raise RuntimeError(f"git diff failed: {diff_res.stderr or diff_res.stdout}")
-        diff = diff_res.stdout
-        stat = stat_res.stdout
-    elif kind == "commit" and value:
-        diff_res = run_cmd(["git", "show", "--patch", value], cwd=git_root)
-        stat_res = run_cmd(["git", "show", "--stat", "--oneline", value], cwd=git_root)
-        if diff_res.code != 0:
-            raise RuntimeError(f"git show commit {value} failed: {diff_res.stderr or diff_res.stdout}")
-        diff = diff_res.stdout
-        stat = stat_res.stdout
-    elif kind == "base" and value:
-        expr = f"{value}...HEAD"
-        diff_res = run_cmd(["git", "diff", expr], cwd=git_root)
-        stat_res = run_cmd(["git", "diff", "--stat", expr], cwd=git_root)
-        if diff_res.code != 0:
-            raise RuntimeError(f"git diff base {value} failed: {diff_res.stderr or diff_res.stdout}")
-        diff = diff_res.stdout
-        stat = stat_res.stdout
-    elif kind == "range" and value:
-        diff_res = run_cmd(["git", "diff", value], cwd=git_root)
-        stat_res = run_cmd(["git", "diff", "--stat", value], cwd=git_root)
-        if diff_res.code != 0:
-            raise RuntimeError(f"git diff range {value} failed: {diff_res.stderr or diff_res.stdout}")
-        diff = diff_res.stdout
-        stat = stat_res.stdout
-    elif kind == "file" and value:
-        diff_res = run_cmd(["git", "diff", "--", value], cwd=git_root)
-        stat_res = run_cmd(["git", "diff", "--stat", "--", value], cwd=git_root)
-        if diff_res.code != 0:
-            raise RuntimeError(f"git diff file {value} failed: {diff_res.stderr or diff_res.stdout}")
-        diff = diff_res.stdout
-        stat = stat_res.stdout
-        if not diff.strip():
-            p = (git_root / value).resolve()
-            if p.exists():
-                artifact_kind = "snippet"
-                diff = p.read_text(encoding="utf-8", errors="replace")
-                stat = f"file:{value} bytes={p.stat().st_size}"
-    else:
-        raise ValueError(f"Unsupported scope: {scope}")
-
-    diff_file = session_dir / "artifact.diff"
-    stat_file = session_dir / "artifact.stat"
-    diff_file.write_text(diff, encoding="utf-8")
-    stat_file.write_text(stat, encoding="utf-8")
-    return diff, stat, artifact_kind
+    files, truncated = stream_git_artifact(git_collect_cmd(scope), cwd=git_root, dest=dest, max_bytes=max_bytes)
+    if kind == "file" and value and not file_has_content(dest):
+        p = (git_root / value).resolve()
+        if p.exists():
+            truncated = copy_capped(p, dest, max_bytes)
+            return [{"path": value, "bytes": p.stat().st_size}], "snippet", truncated
+    return files, "diff", truncated
 
 
 def collect_non_git_code_artifact(
     workspace_root: Path,
     scope: str,
-    session_dir: Path,
-) -> Tuple[str, str, str]:
+    dest: Path,
+    *,
+    max_bytes: int,
+) -> Tuple[List[Dict], str, bool]:
     kind, value = parse_scope(scope)
     if kind != "file" or not value:
         raise RuntimeError(
@@ -285,13 +1967,8 @@ def collect_non_git_code_artifact(
     if not file_path.exists() or not file_path.is_file():
         raise RuntimeError(f"File scope path does not exist or is not a file: {file_path}")
 
-    text = file_path.read_text(encoding="utf-8", errors="replace")
-    stat = f"file:{file_path} bytes={file_path.stat().st_size}"
-    diff_file = session_dir / "artifact.diff"
-    stat_file = session_dir / "artifact.stat"
-    diff_file.write_text(text, encoding="utf-8")
-    stat_file.write_text(stat, encoding="utf-8")
-    return text, stat, "snippet"
+    truncated = copy_capped(file_path, dest, max_bytes)
+    return [{"path": str(file_path), "bytes": file_path.stat().st_size}], "snippet", truncated
 
 
 def resolve_artifact(
@@ -299,76 +1976,96 @@ def resolve_artifact(
     git_root: Optional[Path],
     workspace_root: Path,
     session_dir: Path,
-) -> Tuple[str, str, str]:
-    """Return (target, artifact_text, artifact_kind)."""
+) -> Tuple[str, str, str, List[Dict]]:
+    """Persist session_dir/artifact.md; return (target, artifact_text, artifact_kind, per-file stats).
+
+    Code artifacts are streamed to artifact.diff (capped at --max-artifact-mb) and
+    artifact.md is linked to it, so the text is read into memory exactly once.
+    """
+    artifact_file = session_dir / "artifact.md"
+    max_bytes = int(args.max_artifact_mb * 1024 * 1024)
     if args.content:
         text = args.content
+        artifact_file.write_text(text, encoding="utf-8")
         target = args.target if args.target != "auto" else classify_text_target(text)
-        return target, text, "text"
+        return target, text, "text", []
 
     if args.artifact_file:
-        text = Path(args.artifact_file).read_text(encoding="utf-8", errors="replace")
+        if copy_capped(Path(args.artifact_file), artifact_file, max_bytes):
+            log_event(f"debate: warning artifact_truncated file={args.artifact_file} max_bytes={max_bytes}")
+        text = artifact_file.read_text(encoding="utf-8", errors="replace")
         target = args.target if args.target != "auto" else classify_text_target(text)
-        return target, text, "text"
+        return target, text, "text", []
 
+    diff_file = session_dir / "artifact.diff"
+    files: List[Dict] = []
+    collected: Optional[Tuple[List[Dict], str, bool]] = None
+    scope = args.scope
     if git_root and (args.target in ("auto", "code", "mixed")):
         scope = args.scope or "uncommitted"
-        diff = run_cmd(["git", "diff"], cwd=git_root).stdout
-        if args.target == "code" or diff.strip():
-            text, _stat, artifact_kind = collect_code_artifact(git_root, scope, session_dir)
-            target = "code" if args.target == "auto" else args.target
-            return target, text, artifact_kind
+        # The collection doubles as the "are there changes?" probe for auto/mixed targets.
+        collected = collect_code_artifact(git_root, scope, diff_file, max_bytes=max_bytes)
+        if args.target != "code" and not file_has_content(diff_file):
+            diff_file.unlink()
+            collected = None
     elif not git_root and args.target == "code":
         scope = args.scope or "snippet"
         kind, _value = parse_scope(scope)
         if kind == "file":
-            text, _stat, artifact_kind = collect_non_git_code_artifact(workspace_root, scope, session_dir)
-            return "code", text, artifact_kind
-        if kind not in ("snippet",):
+            collected = collect_non_git_code_artifact(workspace_root, scope, diff_file, max_bytes=max_bytes)
+        elif kind not in ("snippet",):
             raise RuntimeError(
                 f"Unsupported code scope in non-git workspace: {scope}. "
                 "Use file:<path> or provide explicit snippet content."
             )
+    if collected:
+        files, artifact_kind, truncated = collected
+        if truncated:
+            log_event(f"debate: warning artifact_truncated scope={scope} max_bytes={max_bytes}")
+        write_artifact_stats(session_dir, scope, files, truncated)
+        link_or_copy(diff_file, artifact_file)
+        text = artifact_file.read_text(encoding="utf-8", errors="replace")
+        target = "code" if args.target == "auto" else args.target
+        return target, text, artifact_kind, files
 
     print("No auto-detected artifact. Paste content, then Ctrl-D:", file=sys.stderr)
     pasted = sys.stdin.read()
     if not pasted.strip():
         raise RuntimeError("No artifact content provided.")
+    artifact_file.write_text(pasted, encoding="utf-8")
     if not git_root and args.target == "code":
-        return "code", pasted, "snippet"
+        return "code", pasted, "snippet", []
     target = args.target if args.target != "auto" else classify_text_target(pasted)
-    return target, pasted, "text"
+    return target, pasted, "text", []
 
 
-def split_mixed(text: str) -> Tuple[str, str]:
-    code_blocks = re.findall(r"```[\s\S]*?```", text)
-    code_part = "\n\n".join(code_blocks).strip()
-    without_code = re.sub(r"```[\s\S]*?```", "", text).strip()
-
+def split_mixed(text: str, tokens: Optional[List[MdToken]] = None) -> Tuple[str, str]:
+    tokens = tokenize_markdown(text) if tokens is None else tokens
+    code_blocks: List[str] = []
+    prose_lines: List[str] = []
     proposal_sections: List[str] = []
     current: List[str] = []
     keep = False
-    for line in without_code.splitlines():
-        if re.match(r"(?i)^\s{0,3}#{1,6}\s*(design|proposal|approach|decision|tradeoff|rebuttal|response)\b", line):
-            if current and keep:
-                proposal_sections.append("\n".join(current).strip())
-            current = [line]
-            keep = True
+    for token in tokens:
+        if token.kind == "fence":
+            code_blocks.append(token.raw)
             continue
-        if re.match(r"^\s{0,3}#{1,6}\s+", line):
+        prose_lines.append(token.raw)
+        if token.kind == "heading":
             if current and keep:
                 proposal_sections.append("\n".join(current).strip())
-            current = [line]
-            keep = False
+            current = [token.raw]
+            keep = is_proposal_heading(token)
             continue
-        current.append(line)
+        current.append(token.raw)
 
     if current and keep:
         proposal_sections.append("\n".join(current).strip())
 
+    code_part = "\n\n".join(code_blocks).strip()
     proposal_part = "\n\n".join(s for s in proposal_sections if s).strip()
     if not proposal_part:
-        proposal_part = without_code
+        proposal_part = "\n".join(prose_lines).strip()
     return code_part, proposal_part
 
 
@@ -380,9 +2077,171 @@ def call_backend_review(
     scope: str,
     git_root: Optional[Path],
     timeout: int = 600,
+    runtime: Optional[BackendRuntime] = None,
+    sample: int = 0,
+    full_artifact_file: Optional[Path] = None,
+) -> str:
+    """Ask backend for a structured critique of artifact_file.
+
+    When full_artifact_file is given, artifact_file is a delta review input (see
+    build_delta_review_input) and full_artifact_file is offered as context.
+    """
+    with TRACER.span(
+        "call_backend_review",
+        backend=backend,
+        target=target,
+        bytes_in=artifact_file.stat().st_size,
+        delta=full_artifact_file is not None,
+    ) as span:
+        critique = _call_backend_review_cached(
+            backend,
+            target=target,
+            artifact_file=artifact_file,
+            scope=scope,
+            git_root=git_root,
+            timeout=timeout,
+            runtime=runtime,
+            sample=sample,
+            full_artifact_file=full_artifact_file,
+        )
+        span["bytes_out"] = len(critique)
+    return critique
+
+
+def _call_backend_review_cached(
+    backend: str,
+    *,
+    target: str,
+    artifact_file: Path,
+    scope: str,
+    git_root: Optional[Path],
+    timeout: int,
+    runtime: Optional[BackendRuntime],
+    sample: int,
+    full_artifact_file: Optional[Path],
 ) -> str:
+    cache = runtime.cache if runtime else None
+    if cache is None:
+        critique, _complete = _call_backend_review_uncached(
+            backend,
+            target=target,
+            artifact_file=artifact_file,
+            scope=scope,
+            git_root=git_root,
+            timeout=timeout,
+            runtime=runtime,
+            full_artifact_file=full_artifact_file,
+        )
+        return critique
+
+    key = cache.key(
+        artifact_file=artifact_file,
+        backend=backend,
+        target=target,
+        scope=scope if full_artifact_file is None else f"delta:{scope}",
+        sample=sample,
+    )
+    cached = cache.get(key)
+    TRACER.annotate(cache="hit" if cached is not None else "miss")
+    if cached is not None:
+        log_event(f"debate: cache_hit backend={backend} target={target} key={key[:12]}")
+        return cached
+    critique, complete = _call_backend_review_uncached(
+        backend,
+        target=target,
+        artifact_file=artifact_file,
+        scope=scope,
+        git_root=git_root,
+        timeout=timeout,
+        runtime=runtime,
+        full_artifact_file=full_artifact_file,
+    )
+    if not complete:
+        # A fail-fast partial critique must not be served to later full reviews.
+        return critique
+    try:
+        cache.put(key, critique, backend=backend, target=target, scope=scope)
+    except OSError as exc:
+        log_event(f"debate: warning cache_store_failed error={exc}")
+    return critique
+
+
+def build_review_prompt(target: str, artifact_file: Path, full_artifact_file: Optional[Path] = None) -> str:
+    if full_artifact_file is None:
+        return f"Read {artifact_file}. Review this {target} artifact.\n" + REVIEW_OUTPUT_SECTIONS
+    return (
+        f"Read {artifact_file}. It contains a unified diff of the changes made to a {target} artifact "
+        "since the previous review round, followed by the findings that were still unresolved.\n"
+        "Re-check only the changed parts and state for each listed finding whether it is resolved; "
+        "list unresolved or newly introduced problems under the sections below.\n"
+        f"The full current artifact is at {full_artifact_file} if you need surrounding context.\n"
+        + REVIEW_OUTPUT_SECTIONS
+    )
+
+
+def run_review_cmd(
+    cmd: List[str],
+    *,
+    cwd: Optional[Path],
+    timeout: int,
+    runtime: Optional[BackendRuntime],
+) -> Tuple[CmdResult, Optional[str]]:
+    """Run a review command; with fail-fast enabled, stop it once the round outcome is decided.
+
+    A runtime speculator is fed the parsed stream so it can start the revision early.
+    Returns the command result and the early-stop reason (None if it ran to completion).
+    """
+    threshold = runtime.fail_fast_p1 if runtime else 0
+    speculator = runtime.speculator if runtime else None
+    if not threshold and speculator is None:
+        return run_backend_cmd(cmd, cwd=cwd, timeout=timeout, runtime=runtime), None
+
+    parser = CritiqueStreamParser()
+    reasons: List[str] = []
+    received: List[str] = []
+
+    def on_line(stream: str, line: str) -> Optional[bool]:
+        if stream != "stdout" or reasons:
+            return None
+        parser.feed_line(line)
+        if speculator is not None:
+            received.append(line)
+            speculator.observe(parser, received)
+        if not threshold:
+            return None
+        reason = parser.fail_fast_reason(threshold)
+        if reason:
+            reasons.append(reason)
+            return True
+        return None
+
+    res = run_backend_cmd(cmd, cwd=cwd, timeout=timeout, runtime=runtime, on_line=on_line)
+    if res.stopped_early and reasons:
+        log_event(f"debate: fail_fast stop cmd={cmd[0]} reason={reasons[0]} after={res.duration_seconds}s")
+        return res, reasons[0]
+    return res, None
+
+
+def early_stop_note(reason: str) -> str:
+    return f"\n\n## Early Stop\n- {reason} (--fail-fast)\n"
+
+
+def _call_backend_review_uncached(
+    backend: str,
+    *,
+    target: str,
+    artifact_file: Path,
+    scope: str,
+    git_root: Optional[Path],
+    timeout: int = 600,
+    runtime: Optional[BackendRuntime] = None,
+    full_artifact_file: Optional[Path] = None,
+) -> Tuple[str, bool]:
+    """Return (critique, complete); complete is False when --fail-fast cut the output short."""
+    prompt = build_review_prompt(target, artifact_file, full_artifact_file)
     if backend == "codex":
-        if target == "code" and git_root:
+        # codex review re-reads the whole git scope, so delta rounds go through codex exec.
+        if target == "code" and git_root and full_artifact_file is None:
             kind, value = parse_scope(scope)
             cmd = None
             if kind == "uncommitted":
@@ -392,238 +2251,2759 @@ def call_backend_review(
             elif kind == "base" and value:
                 cmd = ["codex", "review", "--base", value, "--config", "model_reasoning_effort=high"]
             if cmd:
-                res = run_cmd(cmd, cwd=git_root, timeout=timeout)
+                res, early = run_review_cmd(cmd, cwd=git_root, timeout=timeout, runtime=runtime)
+                if early:
+                    return res.stdout + early_stop_note(early), False
                 if res.code == 0:
-                    return res.stdout or res.stderr
-        prompt = (
-            f"Read {artifact_file}. Review this {target} artifact.\n"
-            "Output sections:\n"
-            "## P1 - Must Fix\n## P2 - Should Fix\n## P3 - Nice to Have\n"
-            "## Missing Alternatives\n## Recommended Decision\n"
-            "Include concrete evidence."
-        )
+                    return res.stdout or res.stderr, True
         cmd = ["codex", "exec"]
         if git_root is None:
             cmd.append("--skip-git-repo-check")
         cmd.append(prompt)
-        res = run_cmd(cmd, cwd=git_root, timeout=timeout)
+        res, early = run_review_cmd(cmd, cwd=git_root, timeout=timeout, runtime=runtime)
+        if early:
+            return res.stdout + early_stop_note(early), False
         if res.code != 0:
             raise RuntimeError(f"codex failed: {res.stderr or res.stdout}")
-        return res.stdout
+        return res.stdout, True
 
     if backend == "claude":
-        prompt = (
-            f"Read {artifact_file}. Review this {target} artifact.\n"
-            "Output sections:\n"
-            "## P1 - Must Fix\n## P2 - Should Fix\n## P3 - Nice to Have\n"
-            "## Missing Alternatives\n## Recommended Decision\n"
-            "Include concrete evidence."
-        )
-        res = run_cmd(["claude", "-p", prompt], cwd=git_root, timeout=timeout)
+        res, early = run_review_cmd(["claude", "-p", prompt], cwd=git_root, timeout=timeout, runtime=runtime)
+        if early:
+            return res.stdout + early_stop_note(early), False
         if res.code != 0:
             raise RuntimeError(f"claude failed: {res.stderr or res.stdout}")
-        return res.stdout
+        return res.stdout, True
 
     raise RuntimeError(f"Unknown backend: {backend}")
 
 
-def is_no_issue_marker(item: str) -> bool:
-    normalized = re.sub(r"[*_`]+", "", item).strip().lower()
-    return normalized in {"none", "none.", "no issues"} or normalized.startswith("none identified")
+def build_delta_review_input(
+    previous: str,
+    current: str,
+    *,
+    previous_round: int,
+    unresolved: List[str],
+) -> str:
+    diff_lines = difflib.unified_diff(
+        previous.splitlines(),
+        current.splitlines(),
+        fromfile=f"round-{previous_round}",
+        tofile=f"round-{previous_round + 1}",
+        lineterm="",
+    )
+    diff = "\n".join(diff_lines)
+    longest_run = max((len(run) for run in re.findall(r"`+", diff)), default=0)
+    fence = "`" * max(3, longest_run + 1)
+    lines = [
+        f"# Changes Since Round {previous_round}",
+        "",
+        f"{fence}diff",
+        diff,
+        fence,
+        "",
+        f"# Unresolved Findings From Round {previous_round}",
+        "",
+    ]
+    lines += unresolved or ["- None"]
+    return "\n".join(lines) + "\n"
 
 
-def parse_critique(text: str) -> ParsedCritique:
-    section = None
-    p1: List[str] = []
-    p2: List[str] = []
-    p3: List[str] = []
-    missing: List[str] = []
-    recommendation = None
-    backend_error = bool(re.search(r"(?im)^#{1,6}\s*Backend Error\b", text))
+def run_reviews_concurrently(
+    calls: Dict[str, Callable[[], str]],
+    *,
+    max_workers: Optional[int] = None,
+) -> Dict[str, ReviewOutcome]:
+    """Run independent review calls in parallel; failures are captured per call."""
 
-    for raw in text.splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        if re.match(r"(?i)^#{1,6}\s*P1\b|^#{1,6}\s*.*Must Fix|^#{1,6}\s*.*Must Reconsider", line):
-            section = "p1"
-            continue
-        if re.match(r"(?i)^#{1,6}\s*P2\b|^#{1,6}\s*.*Should Fix|^#{1,6}\s*.*Should Improve", line):
-            section = "p2"
-            continue
-        if re.match(r"(?i)^#{1,6}\s*P3\b|^#{1,6}\s*.*Nice to Have|^#{1,6}\s*.*Nice to Strengthen", line):
-            section = "p3"
-            continue
-        if re.match(r"(?i)^#{1,6}\s*Missing\b", line):
-            section = "missing"
-            continue
-        if re.match(r"(?i)^#{1,6}\s*Recommended Decision\b", line):
-            section = "recommendation"
-            continue
+    def timed(name: str, fn: Callable[[], str]) -> ReviewOutcome:
+        started = time.monotonic()
+        try:
+            critique = fn()
+        except Exception as exc:
+            return ReviewOutcome(
+                name,
+                None,
+                str(exc) or exc.__class__.__name__,
+                round(time.monotonic() - started, 3),
+                exception=exc,
+            )
+        return ReviewOutcome(name, critique, None, round(time.monotonic() - started, 3))
 
-        if line.startswith(("-", "*")):
-            item = line[1:].strip()
-            if section in {"p1", "p2", "p3"} and is_no_issue_marker(item):
-                continue
-            if section == "p1":
-                p1.append(item)
-            elif section == "p2":
-                p2.append(item)
-            elif section == "p3":
-                p3.append(item)
-            elif section == "missing":
-                missing.append(item)
-            elif section == "recommendation" and not recommendation:
-                recommendation = item
-        elif section in {"p1", "p2", "p3"} and is_no_issue_marker(line):
-            continue
-        elif section == "recommendation" and not recommendation:
-            recommendation = line
+    workers = max_workers or max(1, len(calls))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {name: pool.submit(timed, name, fn) for name, fn in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
 
-    return ParsedCritique(
-        p1=p1,
-        p2=p2,
-        p3=p3,
-        missing=missing,
-        recommendation=recommendation,
-        backend_error=backend_error,
-    )
 
+def merge_mixed_critiques(code: ReviewOutcome, proposal: ReviewOutcome) -> str:
+    if code.error is not None and proposal.error is not None:
+        raise RuntimeError(f"code review failed: {code.error}; proposal review failed: {proposal.error}")
 
-def judge_recommendation(parsed: ParsedCritique) -> Tuple[str, str]:
-    if parsed.backend_error and not (parsed.p1 or parsed.p2 or parsed.p3 or parsed.missing):
-        return "E", "Backend review failed; no structured critique was produced."
-    p1c, p2c, p3c = len(parsed.p1), len(parsed.p2), len(parsed.p3)
-    if p1c > 0:
-        return "B", f"Detected {p1c} P1 issue(s); accepting opposite recommendation is safer."
-    if p2c >= 2:
-        return "C", f"Detected {p2c} P2 issue(s); compromise likely balances tradeoffs."
-    if p1c == 0 and p2c == 0 and p3c == 0:
-        return "A", "No material concerns detected."
-    return "D", "There are unresolved concerns; continue one more round."
+    def body(outcome: ReviewOutcome) -> str:
+        if outcome.error is not None:
+            return f"### Backend Error\n- {outcome.error}\n"
+        return outcome.critique or ""
 
+    return "## Code Critique\n\n" + body(code) + "\n\n## Proposal Critique\n\n" + body(proposal)
 
-def detect_agreement_signal(text: str) -> bool:
-    lower = text.lower()
-    markers = [
-        "lgtm",
-        "looks good",
-        "no concerns",
-        "no critical issues",
-        "approved",
-    ]
-    return any(m in lower for m in markers)
 
+def is_structured_critique(text: str) -> bool:
+    """True when text has at least one critique section heading and no backend error."""
+    parser = CritiqueStreamParser()
+    seen_section = False
+    for token in tokenize_markdown(text):
+        parser.feed_token(token)
+        seen_section = seen_section or parser.section is not None
+    return seen_section and not parser.backend_error
 
-def choose_interactive(default_choice: str) -> str:
-    options = {"A", "B", "C", "D", "E"}
-    prompt = f"Choose [A/B/C/D/E] (default {default_choice}): "
-    try:
-        val = input(prompt).strip().upper()
-    except EOFError:
-        print("Input stream closed. Using default.", file=sys.stderr)
-        return default_choice
-    if not val:
-        return default_choice
-    if val not in options:
-        print("Invalid choice. Using default.", file=sys.stderr)
-        return default_choice
-    return val
 
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
 
-def generate_compromise(
-    local_backend: str,
-    current: str,
-    critique: str,
-    cwd: Optional[Path],
-    timeout_seconds: int,
+
+def load_latency_samples(
+    session_base_dir: Path,
     *,
-    allow_stdin_fallback: bool,
-) -> str:
-    prompt = (
-        "Generate a compromise revision that addresses the critique while preserving valid parts "
-        "of the original. Output only revised artifact content.\n\n"
-        f"Original:\n{current}\n\nCritique:\n{critique}\n"
-    )
-    try:
-        if local_backend == "codex":
-            cmd = ["codex", "exec"]
-            if cwd is None:
-                cmd.append("--skip-git-repo-check")
-            cmd.append(prompt)
-            res = run_cmd(cmd, cwd=cwd, timeout=timeout_seconds)
-        else:
-            res = run_cmd(["claude", "-p", prompt], cwd=cwd, timeout=timeout_seconds)
-        if res.code == 0 and res.stdout.strip():
-            return res.stdout.strip()
-    except Exception:
-        pass
+    span_names: Tuple[str, ...],
+    backend: str,
+    targets: Optional[Tuple[str, ...]] = None,
+    exclude_session: Optional[str] = None,
+    max_sessions: int = LATENCY_HISTORY_SESSIONS,
+    censored_errors: Tuple[str, ...] = LATENCY_CENSORED_ERRORS,
+) -> Tuple[List[Tuple[int, float]], int]:
+    """Return ((bytes_in, seconds) samples, censored count) from the newest sessions' trace.jsonl.
 
-    if not allow_stdin_fallback:
-        return current
-    print("Compromise generation failed; paste compromise content, then Ctrl-D:", file=sys.stderr)
-    user_text = sys.stdin.read().strip()
-    if not user_text:
-        return current
-    return user_text
+    Samples are completed, uncached spans plus censored ones (an error matching censored_errors,
+    e.g. timeouts) at their elapsed time: dropping those would bias high percentiles downward.
+    """
+    samples: List[Tuple[int, float]] = []
+    censored = 0
+    scanned = 0
+    for entry in reversed(list_stored_sessions(session_base_dir)):
+        if entry.session_id == exclude_session:
+            continue
+        if scanned >= max_sessions:
+            break
+        scanned += 1
+        text = read_stored_file(entry, "trace.jsonl")
+        for line in (text or "").splitlines():
+            try:
+                span = json.loads(line)
+            except ValueError:
+                continue
+            attrs = span.get("attrs") or {}
+            if (
+                span.get("name") not in span_names
+                or attrs.get("backend") != backend
+                or (targets is not None and attrs.get("target") not in targets)
+                or attrs.get("cache") == "hit"
+            ):
+                continue
+            if "error" in attrs:
+                if not any(marker in str(attrs["error"]) for marker in censored_errors):
+                    continue
+                censored += 1
+            samples.append((int(attrs.get("bytes_in") or 0), float(span.get("duration_seconds", 0.0))))
+    return samples, censored
 
 
-def accept_opposite_revision(
-    local_backend: str,
-    current: str,
-    critique: str,
-    cwd: Optional[Path],
-    timeout_seconds: int,
-) -> str:
-    prompt = (
-        "Apply the opposite model's review feedback to the artifact.\n"
-        "Output only the revised artifact content.\n\n"
-        f"Current Artifact:\n{current}\n\nCritique:\n{critique}\n"
+def resolve_hedge_threshold(
+    raw: str,
+    *,
+    session_base_dir: Path,
+    backend: str,
+    target: str,
+    session_id: str,
+) -> Tuple[float, str]:
+    """Return (seconds, source) for --hedge-after-seconds (a number or 'auto')."""
+    if raw != "auto":
+        return float(raw), "static"
+    # A hedged primary that lost is cancelled: without it, every hedge lowers the next threshold.
+    history, censored = load_latency_samples(
+        session_base_dir,
+        span_names=("call_backend_review",),
+        backend=backend,
+        targets=(target,),
+        exclude_session=session_id,
+        censored_errors=HEDGE_CENSORED_ERRORS,
     )
-    try:
-        if local_backend == "codex":
-            cmd = ["codex", "exec"]
-            if cwd is None:
-                cmd.append("--skip-git-repo-check")
-            cmd.append(prompt)
-            res = run_cmd(cmd, cwd=cwd, timeout=timeout_seconds)
+    samples = [seconds for _size, seconds in history]
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return DEFAULT_HEDGE_AFTER_SECONDS, f"default ({len(samples)} samples < {HEDGE_MIN_SAMPLES})"
+    source = f"p{HEDGE_PERCENTILE} of {len(samples)} past reviews"
+    if censored:
+        source += f" ({censored} cut short by a timeout or hedge, counted at their elapsed time)"
+    return round(percentile(samples, HEDGE_PERCENTILE), 3), source
+
+
+def hedged_review(
+    review: Callable[[str, BackendRuntime], str],
+    *,
+    primary: str,
+    fallback: str,
+    hedge_after: float,
+    runtime: BackendRuntime,
+) -> Tuple[str, Dict]:
+    """Run review(primary); if it is still running after hedge_after seconds, race review(fallback).
+
+    The first call to return a structured critique wins and the other one is killed.
+    Returns the critique and the round's hedge entry (winner, timings). Errors of a
+    primary that finishes before the threshold propagate unchanged; if both racing
+    calls fail, HedgeFailedError is raised.
+    """
+    started = time.monotonic()
+    entry: Dict = {
+        "primary": primary,
+        "fallback": fallback,
+        "threshold_seconds": round(hedge_after, 3),
+        "hedged": False,
+    }
+    runtimes = {primary: dataclasses.replace(runtime, cancel=threading.Event())}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {pool.submit(review, primary, runtimes[primary]): primary}
+        done, _pending = concurrent.futures.wait(futures, timeout=hedge_after)
+        if done:
+            critique = next(iter(done)).result()
+            entry.update(winner=primary, winner_seconds=round(time.monotonic() - started, 3))
+            return critique, entry
+
+        entry.update(hedged=True, hedge_started_seconds=round(time.monotonic() - started, 3))
+        log_event(f"debate: hedge start primary={primary} fallback={fallback} after={entry['hedge_started_seconds']}s")
+        runtimes[fallback] = dataclasses.replace(runtime, cancel=threading.Event())
+        futures[pool.submit(review, fallback, runtimes[fallback])] = fallback
+        errors: Dict[str, BaseException] = {}
+        pending = set(futures)
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = futures[future]
+                try:
+                    critique = future.result()
+                except Exception as exc:
+                    errors[name] = exc
+                    continue
+                if not is_structured_critique(critique):
+                    errors[name] = RuntimeError(f"{name} returned an unstructured critique")
+                    continue
+                loser = fallback if name == primary else primary
+                runtimes[loser].cancel.set()  # type: ignore[union-attr]
+                entry.update(
+                    winner=name,
+                    winner_seconds=round(time.monotonic() - started, 3),
+                    loser=loser,
+                    loser_status=f"error: {errors[loser]}" if loser in errors else "cancelled",
+                )
+                return critique, entry
+    for exc in errors.values():
+        if isinstance(exc, BudgetExceededError):
+            raise exc
+    raise HedgeFailedError("; ".join(f"{name}: {exc}" for name, exc in errors.items()))
+
+
+def fanout_reviews(
+    reviewers: List[Tuple[str, int]],
+    *,
+    target: str,
+    artifact_file: Path,
+    scope: str,
+    git_root: Optional[Path],
+    timeout: int,
+    runtime: Optional[BackendRuntime],
+    session_dir: Path,
+    round_no: int,
+    full_artifact_file: Optional[Path] = None,
+) -> Tuple[str, ParsedCritique, List[Dict]]:
+    """Send one review to several (backend, sample) reviewers in parallel and merge the results."""
+    calls: Dict[str, Callable[[], str]] = {}
+    for reviewer_backend, sample in reviewers:
+
+        def call(reviewer_backend: str = reviewer_backend, sample: int = sample) -> str:
+            return call_backend_review(
+                reviewer_backend,
+                target=target,
+                artifact_file=artifact_file,
+                scope=scope,
+                git_root=git_root,
+                timeout=timeout,
+                runtime=runtime,
+                sample=sample,
+                full_artifact_file=full_artifact_file,
+            )
+
+        calls[f"{reviewer_backend}-{sample + 1}"] = call
+    outcomes = run_reviews_concurrently(calls)
+
+    for outcome in outcomes.values():
+        if isinstance(outcome.exception, BudgetExceededError):
+            raise outcome.exception
+    succeeded = [outcome for outcome in outcomes.values() if outcome.error is None]
+    if not succeeded:
+        errors = "; ".join(f"{o.name}: {o.error}" for o in outcomes.values())
+        raise RuntimeError(f"all fan-out reviewers failed: {errors}")
+
+    entries: List[Dict] = []
+    header = ["## Fan-out Reviewers"]
+    for name, outcome in outcomes.items():
+        entry = {"reviewer": name, **outcome.timing_entry()}
+        entries.append(entry)
+        if outcome.error is None:
+            (session_dir / f"round-{round_no}-critique-{name}.md").write_text(outcome.critique or "", encoding="utf-8")
+            header.append(f"- {name}: ok ({outcome.duration_seconds}s)")
         else:
-            res = run_cmd(["claude", "-p", prompt], cwd=cwd, timeout=timeout_seconds)
-        if res.code == 0 and res.stdout.strip():
-            return res.stdout.strip()
-    except Exception:
-        pass
-    return current
+            header.append(f"- {name}: failed ({outcome.error})")
+    header.append("")
 
+    merged = merge_critiques([parse_critique(outcome.critique or "") for outcome in succeeded])
+    return render_critique(merged, header=header), merged, entries
 
-def write_json(path: Path, data: Dict) -> None:
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
 
+def split_hunk(hunk: List[str], max_bytes: int) -> List[str]:
+    """Split one oversized hunk into smaller hunks with recomputed @@ headers."""
+    match = HUNK_HEADER_PATTERN.match(hunk[0].rstrip("\n"))
+    if not match:
+        return ["".join(hunk)]
+    old_line, new_line = int(match.group(1)), int(match.group(3))
+    context = match.group(5)
+    parts: List[str] = []
+    body: List[str] = []
+    size = 0
+    old_count = new_count = 0
 
-def explicit_intensity_overrides(args: argparse.Namespace) -> List[str]:
-    mapping = {
-        "max_rounds": "--max-rounds",
-        "budget_minutes": "--budget-minutes",
-        "backend_timeout_seconds": "--backend-timeout-seconds",
-    }
-    return [flag for attr, flag in mapping.items() if getattr(args, attr) is not None]
+    def flush() -> None:
+        header = f"@@ -{old_line},{old_count} +{new_line},{new_count} @@{context}\n"
+        parts.append(header + "".join(body))
 
+    for line in hunk[1:]:
+        line_size = len(line.encode("utf-8"))
+        if body and size + line_size > max_bytes:
+            flush()
+            old_line, new_line = old_line + old_count, new_line + new_count
+            body, size, old_count, new_count = [], 0, 0, 0
+        body.append(line)
+        size += line_size
+        if line.startswith("-"):
+            old_count += 1
+        elif line.startswith("+"):
+            new_count += 1
+        elif not line.startswith("\\"):
+            old_count += 1
+            new_count += 1
+    if body:
+        flush()
+    return parts
 
-def apply_intensity_defaults(args: argparse.Namespace) -> None:
-    profile = INTENSITY_PROFILES.get(args.intensity)
-    if profile is None:
-        allowed = ", ".join(sorted(INTENSITY_PROFILES))
+
+def split_diff_chunks(diff: str, max_bytes: int) -> List[DiffChunk]:
+    """Split a unified diff into per-file chunks packed under max_bytes.
+
+    Files larger than the budget are split into groups of hunks, each carrying the file
+    header; a single hunk larger than the budget is split with recomputed @@ headers. Text before the first file header (e.g. the git show commit message)
+    is repeated at the top of every chunk as context.
+    """
+    preamble: List[str] = []
+    files: List[Tuple[str, List[str]]] = []
+    for line in diff.splitlines(keepends=True):
+        match = DIFF_FILE_HEADER_PATTERN.match(line.rstrip("\n"))
+        if match:
+            files.append((match.group(2), [line]))
+        elif files:
+            files[-1][1].append(line)
+        else:
+            preamble.append(line)
+    prefix = "".join(preamble)
+
+    pieces: List[Tuple[str, str]] = []
+    for path, lines in files:
+        text = "".join(lines)
+        if len(text.encode("utf-8")) <= max_bytes:
+            pieces.append((path, text))
+            continue
+        header: List[str] = []
+        hunks: List[List[str]] = []
+        for line in lines:
+            if line.startswith("@@"):
+                hunks.append([line])
+            elif hunks:
+                hunks[-1].append(line)
+            else:
+                header.append(line)
+        group: List[str] = []
+        header_size = len("".join(header).encode("utf-8"))
+        for hunk_text in [part for hunk in hunks for part in split_hunk(hunk, max(1, max_bytes - header_size))]:
+            if group and len("".join(header + group + [hunk_text]).encode("utf-8")) > max_bytes:
+                pieces.append((path, "".join(header + group)))
+                group = []
+            group.append(hunk_text)
+        if group or not hunks:
+            pieces.append((path, "".join(header + group)))
+
+    chunks: List[DiffChunk] = []
+    current_files: List[str] = []
+    current_text: List[str] = []
+    current_size = 0
+    for path, text in pieces:
+        size = len(text.encode("utf-8"))
+        if current_text and current_size + size > max_bytes:
+            chunks.append(DiffChunk(current_files, prefix + "".join(current_text)))
+            current_files, current_text, current_size = [], [], 0
+        if path not in current_files:
+            current_files.append(path)
+        current_text.append(text)
+        current_size += size
+    if current_text:
+        chunks.append(DiffChunk(current_files, prefix + "".join(current_text)))
+    return chunks
+
+
+def attribute_findings(parsed: ParsedCritique, files: List[str]) -> ParsedCritique:
+    label = ", ".join(files)
+
+    def tag(items: List[str]) -> List[str]:
+        return [item if any(path in item for path in files) else f"[{label}] {item}" for item in items]
+
+    return dataclasses.replace(
+        parsed,
+        p1=tag(parsed.p1),
+        p2=tag(parsed.p2),
+        p3=tag(parsed.p3),
+        missing=tag(parsed.missing),
+    )
+
+
+def chunked_review(
+    backend: str,
+    chunks: List[DiffChunk],
+    *,
+    git_root: Optional[Path],
+    timeout: int,
+    runtime: Optional[BackendRuntime],
+    session_dir: Path,
+    round_no: int,
+    max_workers: int,
+) -> Tuple[str, ParsedCritique, List[Dict]]:
+    """Review diff chunks in parallel and merge them into one critique with file attribution."""
+    calls: Dict[str, Callable[[], str]] = {}
+    chunk_files: Dict[str, List[str]] = {}
+    for index, chunk in enumerate(chunks, start=1):
+        name = f"chunk-{index}"
+        chunk_file = session_dir / f"round-{round_no}-{name}.diff"
+        chunk_file.write_text(chunk.text, encoding="utf-8")
+        chunk_files[name] = chunk.files
+
+        def call(chunk_file: Path = chunk_file) -> str:
+            # scope=snippet: review the chunk file itself, not the whole git scope.
+            return call_backend_review(
+                backend,
+                target="code",
+                artifact_file=chunk_file,
+                scope="snippet",
+                git_root=git_root,
+                timeout=timeout,
+                runtime=runtime,
+            )
+
+        calls[name] = call
+    outcomes = run_reviews_concurrently(calls, max_workers=max_workers)
+
+    for outcome in outcomes.values():
+        if isinstance(outcome.exception, BudgetExceededError):
+            raise outcome.exception
+    succeeded = [outcome for outcome in outcomes.values() if outcome.error is None]
+    if not succeeded:
+        errors = "; ".join(f"{o.name}: {o.error}" for o in outcomes.values())
+        raise RuntimeError(f"all diff chunk reviews failed: {errors}")
+
+    entries: List[Dict] = []
+    header = ["## Chunk Reviews"]
+    for name, outcome in outcomes.items():
+        entries.append({"chunk": name, "files": chunk_files[name], **outcome.timing_entry()})
+        status = f"ok ({outcome.duration_seconds}s)" if outcome.error is None else f"failed ({outcome.error})"
+        header.append(f"- {name} [{', '.join(chunk_files[name])}]: {status}")
+    header.append("")
+
+    merged = merge_critiques(
+        [attribute_findings(parse_critique(o.critique or ""), chunk_files[o.name]) for o in succeeded]
+    )
+    # Chunks review disjoint code, so support counts are not reviewer consensus.
+    merged = dataclasses.replace(
+        merged,
+        reviewers=1,
+        support={},
+        backend_error=merged.backend_error or len(succeeded) < len(outcomes),
+    )
+    return render_critique(merged, header=header), merged, entries
+
+
+def is_no_issue_marker(item: str) -> bool:
+    normalized = NO_ISSUE_STRIP_PATTERN.sub("", item).strip().lower()
+    return normalized in {"none", "none.", "no issues"} or normalized.startswith("none identified")
+
+
+class CritiqueStreamParser:
+    """Incremental P1/P2/P3/Missing/Recommended Decision parser.
+
+    Feed backend output one line at a time (e.g. while it streams); result() returns
+    the ParsedCritique for everything fed so far. Lines are classified by the shared
+    MarkdownTokenizer, so bullets inside fenced blocks are not counted as findings.
+    """
+
+    def __init__(self) -> None:
+        self.tokenizer = MarkdownTokenizer()
+        self.section: Optional[str] = None
+        self.p1: List[str] = []
+        self.p2: List[str] = []
+        self.p3: List[str] = []
+        self.missing: List[str] = []
+        self.recommendation: Optional[str] = None
+        self.backend_error = False
+        self.early_stop_reason: Optional[str] = None
+        self.agreement_seen = False
+        self.sections_seen: Set[str] = set()
+
+    def feed_line(self, raw: str) -> None:
+        token = self.tokenizer.feed_line(raw)
+        if token is not None:
+            self.feed_token(token)
+
+    def feed_token(self, token: MdToken) -> None:
+        if token.kind == "fence":
+            return
+        if token.kind == "heading":
+            match = CRITIQUE_HEADING_PATTERN.match(token.body)
+            if match:
+                section = match.lastgroup
+                if section == "reset":
+                    if token.body[:13].lower() == "backend error":
+                        self.backend_error = True
+                    section = None
+                self.section = section
+                if section:
+                    self.sections_seen.add(section)
+                return
+        line = token.raw.strip()
+        if not line:
+            return
+        section = self.section
+        # Agreement only counts in the verdict, once P1 and P2 have both been emitted and closed;
+        # preamble like "looks good overall" may still be followed by a P1.
+        if (
+            section == "recommendation"
+            and {"p1", "p2"} <= self.sections_seen
+            and detect_agreement_signal(line)
+        ):
+            self.agreement_seen = True
+
+        if token.kind == "bullet":
+            item = token.body
+            if section in {"p1", "p2", "p3"} and is_no_issue_marker(item):
+                return
+            if section == "p1":
+                self.p1.append(item)
+            elif section == "p2":
+                self.p2.append(item)
+            elif section == "p3":
+                self.p3.append(item)
+            elif section == "missing":
+                self.missing.append(item)
+            elif section == "recommendation" and not self.recommendation:
+                self.recommendation = item
+            elif section == "early_stop" and not self.early_stop_reason:
+                self.early_stop_reason = item
+        elif section in {"p1", "p2", "p3"} and is_no_issue_marker(line):
+            return
+        elif section == "recommendation" and not self.recommendation:
+            self.recommendation = line
+
+    def fail_fast_reason(self, p1_threshold: int) -> Optional[str]:
+        """Return why the round outcome is already decided, or None to keep streaming."""
+        if len(self.p1) >= p1_threshold:
+            return f"{len(self.p1)} P1 finding(s) received"
+        if self.agreement_seen and not (self.p1 or self.p2):
+            return "agreement signal with no P1/P2 findings"
+        return None
+
+    def result(self) -> ParsedCritique:
+        return ParsedCritique(
+            p1=list(self.p1),
+            p2=list(self.p2),
+            p3=list(self.p3),
+            missing=list(self.missing),
+            recommendation=self.recommendation,
+            backend_error=self.backend_error,
+            early_stop_reason=self.early_stop_reason,
+        )
+
+
+def parse_critique(text: str) -> ParsedCritique:
+    with TRACER.span("parse_critique", bytes_in=len(text)) as span:
+        parser = CritiqueStreamParser()
+        for token in tokenize_markdown(text):
+            parser.feed_token(token)
+        parsed = parser.result()
+        span.update(p1=len(parsed.p1), p2=len(parsed.p2), p3=len(parsed.p3))
+    return parsed
+
+
+def finding_tokens(item: str) -> frozenset:
+    normalized = re.sub(r"[*_`]+", "", item).lower()
+    return frozenset(re.findall(r"[a-z0-9][a-z0-9_./:-]*", normalized))
+
+
+def finding_similarity(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def finding_shingles(item: str) -> frozenset:
+    """Word unigrams and bigrams of a finding, normalized so rewordings still overlap."""
+    text = re.sub(r"[*_`]+", "", item).lower()
+    text = FINDING_LINE_SUFFIX_PATTERN.sub("", text)
+    words = []
+    for word in re.findall(r"[a-z0-9][a-z0-9_./-]*", text):
+        if word in FINGERPRINT_STOPWORDS:
+            continue
+        for suffix in ("ing", "ed", "es", "s"):
+            if len(word) > len(suffix) + 3 and word.endswith(suffix):
+                word = word[: -len(suffix)]
+                break
+        words.append(word)
+    return frozenset(words) | frozenset(f"{a} {b}" for a, b in zip(words, words[1:]))
+
+
+def minhash_signature(shingles: frozenset) -> Tuple[int, ...]:
+    if not shingles:
+        return ()
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingles]
+    return tuple(min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in MINHASH_COEFFICIENTS)
+
+
+def signature_similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """MinHash estimate of the Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+class FindingIndex:
+    """MinHash fingerprints of every finding in a session, matched across rounds.
+
+    observe() classifies a round's P1/P2/P3 items as new (no earlier finding within
+    FINGERPRINT_MATCH_THRESHOLD), recurring, or resolved (raised last round, absent now).
+    A recurring finding raised to P1/P2 from a lower severity counts as escalated, and
+    escalations are material just like new P1/P2 findings.
+    """
+
+    def __init__(self) -> None:
+        self.entries: List[Dict] = []
+        self.last_round: Optional[int] = None
+
+    def observe(self, round_no: int, findings: Dict[str, List[str]]) -> Dict:
+        active_before = {id(entry) for entry in self.entries if entry["last_round"] == self.last_round}
+        seen: List[Dict] = []
+        new: List[Dict] = []
+        escalated: List[Dict] = []
+        for section in SEVERITY_SECTIONS:
+            for item in findings.get(section) or []:
+                signature = minhash_signature(finding_shingles(item))
+                best, best_score = None, 0.0
+                for entry in self.entries:
+                    score = signature_similarity(signature, entry["signature"])
+                    if score >= FINGERPRINT_MATCH_THRESHOLD and score > best_score:
+                        best, best_score = entry, score
+                if best is None:
+                    best = {"severity": section, "text": item, "signature": signature, "first_round": round_no}
+                    self.entries.append(best)
+                    new.append(best)
+                elif SEVERITY_SECTIONS.index(section) < SEVERITY_SECTIONS.index(best["severity"]):
+                    best["severity"] = section
+                    if section in ("p1", "p2") and all(entry is not best for entry in escalated + seen):
+                        escalated.append(best)
+                best["last_round"] = round_no
+                if all(entry is not best for entry in seen):
+                    seen.append(best)
+        self.last_round = round_no
+        seen_ids = {id(entry) for entry in seen}
+        resolved = [entry for entry in self.entries if id(entry) in active_before and id(entry) not in seen_ids]
+        recurring = [entry for entry in seen if entry["first_round"] < round_no]
+
+        def label(entry: Dict) -> str:
+            return f"[{entry['severity'].upper()}] {entry['text']}"
+
+        return {
+            "new": len(new),
+            "recurring": len(recurring),
+            "resolved": len(resolved),
+            "escalated": len(escalated),
+            "new_material": sum(1 for entry in new if entry["severity"] in ("p1", "p2")) + len(escalated),
+            "new_items": [label(entry) for entry in new],
+            "escalated_items": [label(entry) for entry in escalated],
+            "resolved_items": [label(entry) for entry in resolved],
+        }
+
+
+def merge_critiques(parsed_list: List[ParsedCritique]) -> ParsedCritique:
+    """Merge critiques from several reviewers into one.
+
+    Near-duplicate findings (token Jaccard >= FINDING_DUPLICATE_THRESHOLD) collapse into
+    one item that keeps the highest severity any reviewer gave it; support records how
+    many distinct reviewers raised it.
+    """
+    clusters: List[Dict] = []
+    missing_clusters: List[Dict] = []
+
+    def absorb(pool: List[Dict], item: str, reviewer: int, rank: int) -> None:
+        tokens = finding_tokens(item)
+        best = None
+        best_score = 0.0
+        for cluster in pool:
+            score = finding_similarity(tokens, cluster["tokens"])
+            if score >= FINDING_DUPLICATE_THRESHOLD and score > best_score:
+                best, best_score = cluster, score
+        if best is None:
+            pool.append({"text": item, "tokens": tokens, "rank": rank, "reviewers": {reviewer}})
+            return
+        best["reviewers"].add(reviewer)
+        if rank < best["rank"]:
+            best["rank"] = rank
+            best["text"] = item
+
+    recommendations: List[str] = []
+    for reviewer, parsed in enumerate(parsed_list):
+        for rank, section in enumerate(SEVERITY_SECTIONS):
+            for item in getattr(parsed, section):
+                absorb(clusters, item, reviewer, rank)
+        for item in parsed.missing:
+            absorb(missing_clusters, item, reviewer, 0)
+        if parsed.recommendation:
+            recommendations.append(parsed.recommendation)
+
+    merged: Dict[str, List[str]] = {section: [] for section in SEVERITY_SECTIONS}
+    support: Dict[str, int] = {}
+    for cluster in sorted(clusters, key=lambda c: (c["rank"], -len(c["reviewers"]))):
+        merged[SEVERITY_SECTIONS[cluster["rank"]]].append(cluster["text"])
+        support[cluster["text"]] = len(cluster["reviewers"])
+    missing: List[str] = []
+    for cluster in sorted(missing_clusters, key=lambda c: -len(c["reviewers"])):
+        missing.append(cluster["text"])
+        support[cluster["text"]] = len(cluster["reviewers"])
+
+    recommendation = None
+    if recommendations:
+        recommendation = max(recommendations, key=recommendations.count)
+    return ParsedCritique(
+        p1=merged["p1"],
+        p2=merged["p2"],
+        p3=merged["p3"],
+        missing=missing,
+        recommendation=recommendation,
+        backend_error=any(p.backend_error for p in parsed_list),
+        reviewers=len(parsed_list),
+        support=support,
+        early_stop_reason=next((p.early_stop_reason for p in parsed_list if p.early_stop_reason), None),
+    )
+
+
+def render_critique(parsed: ParsedCritique, *, header: Optional[List[str]] = None) -> str:
+    def items(values: List[str]) -> List[str]:
+        if not values:
+            return ["- None"]
+        lines = []
+        for value in values:
+            count = parsed.support.get(value)
+            suffix = f" _(raised by {count}/{parsed.reviewers} reviewers)_" if count and parsed.reviewers > 1 else ""
+            lines.append(f"- {value}{suffix}")
+        return lines
+
+    lines: List[str] = list(header or [])
+    for title, values in (
+        ("## P1 - Must Fix", parsed.p1),
+        ("## P2 - Should Fix", parsed.p2),
+        ("## P3 - Nice to Have", parsed.p3),
+        ("## Missing Alternatives", parsed.missing),
+    ):
+        lines += [title, *items(values), ""]
+    lines += ["## Recommended Decision", f"- {parsed.recommendation or 'None'}", ""]
+    return "\n".join(lines)
+
+
+def judge_recommendation(parsed: ParsedCritique, *, consensus_min: int = 1) -> Tuple[str, str]:
+    if parsed.backend_error and not (parsed.p1 or parsed.p2 or parsed.p3 or parsed.missing):
+        return "E", "Backend review failed; no structured critique was produced."
+    p1c, p2c, p3c = len(parsed.p1), len(parsed.p2), len(parsed.p3)
+    if consensus_min > 1 and parsed.reviewers > 1:
+        # P1s raised by too few reviewers are weighed as P2s.
+        weak = sum(1 for item in parsed.p1 if parsed.support.get(item, 1) < consensus_min)
+        p1c, p2c = p1c - weak, p2c + weak
+        if p1c > 0:
+            return "B", (
+                f"Detected {p1c} consensus P1 issue(s) raised by >={consensus_min} of {parsed.reviewers} "
+                "reviewers; accepting opposite recommendation is safer."
+            )
+    if p1c > 0:
+        return "B", f"Detected {p1c} P1 issue(s); accepting opposite recommendation is safer."
+    if p2c >= 2:
+        return "C", f"Detected {p2c} P2 issue(s); compromise likely balances tradeoffs."
+    if p1c == 0 and p2c == 0 and p3c == 0:
+        return "A", "No material concerns detected."
+    return "D", "There are unresolved concerns; continue one more round."
+
+
+def detect_agreement_signal(text: str) -> bool:
+    for line in text.lower().splitlines():
+        for match in AGREEMENT_SIGNAL_PATTERN.finditer(line):
+            if AGREEMENT_NEGATION_PATTERN.search(line[: match.start()]):
+                continue
+            if AGREEMENT_CONTRAST_PATTERN.match(line[match.end() :]):
+                continue
+            return True
+    return False
+
+
+def choose_interactive(default_choice: str) -> str:
+    options = {"A", "B", "C", "D", "E"}
+    prompt = f"Choose [A/B/C/D/E] (default {default_choice}): "
+    try:
+        val = input(prompt).strip().upper()
+    except EOFError:
+        print("Input stream closed. Using default.", file=sys.stderr)
+        return default_choice
+    if not val:
+        return default_choice
+    if val not in options:
+        print("Invalid choice. Using default.", file=sys.stderr)
+        return default_choice
+    return val
+
+
+def run_revision_call(
+    phase: str,
+    local_backend: str,
+    prompt: str,
+    cwd: Optional[Path],
+    timeout_seconds: int,
+    *,
+    runtime: Optional[BackendRuntime] = None,
+) -> Optional[str]:
+    """Run a revision prompt on the local model; return the revised content, or None on failure."""
+    with TRACER.span(phase, backend=local_backend, bytes_in=len(prompt)) as span:
+        try:
+            if local_backend == "codex":
+                cmd = ["codex", "exec"]
+                if cwd is None:
+                    cmd.append("--skip-git-repo-check")
+                cmd.append(prompt)
+                res = run_backend_cmd(cmd, cwd=cwd, timeout=timeout_seconds, runtime=runtime)
+            else:
+                res = run_backend_cmd(["claude", "-p", prompt], cwd=cwd, timeout=timeout_seconds, runtime=runtime)
+            if res.code == 0 and res.stdout.strip():
+                span["bytes_out"] = len(res.stdout)
+                return res.stdout.strip()
+        except Exception as exc:
+            span["error"] = str(exc) or exc.__class__.__name__
+    return None
+
+
+def compromise_prompt(current: str, critique: str) -> str:
+    return (
+        "Generate a compromise revision that addresses the critique while preserving valid parts "
+        "of the original. Output only revised artifact content.\n\n"
+        f"Original:\n{current}\n\nCritique:\n{critique}\n"
+    )
+
+
+def opposite_revision_prompt(current: str, critique: str) -> str:
+    return (
+        "Apply the opposite model's review feedback to the artifact.\n"
+        "Output only the revised artifact content.\n\n"
+        f"Current Artifact:\n{current}\n\nCritique:\n{critique}\n"
+    )
+
+
+class RevisionSpeculator:
+    """Starts a round's revision call while its critique is still streaming.
+
+    observe() sees the streaming parser; once it is past the P1/P2 sections and the
+    partial critique already judges to B or C, the matching revision prompt starts on a
+    background thread with the critique received so far. claim() returns that revision only
+    if the final choice and P1/P2 findings match the snapshot and the rest of the critique
+    adds nothing the prompt lacked (no P3 or Missing items, no text past the snapshot);
+    anything else cancels the call and counts it as wasted.
+    """
+
+    def __init__(
+        self,
+        *,
+        local_backend: str,
+        current: str,
+        cwd: Optional[Path],
+        timeout_seconds: int,
+        runtime: BackendRuntime,
+        choices: Tuple[str, ...] = ("B", "C"),
+    ) -> None:
+        self.local_backend = local_backend
+        self.current = current
+        self.cwd = cwd
+        self.timeout_seconds = timeout_seconds
+        self.runtime = dataclasses.replace(runtime, cancel=threading.Event(), speculator=None)
+        self.choices = choices
+        self.created = time.monotonic()
+        self.choice: Optional[str] = None
+        self.findings: Optional[Tuple[List[str], List[str]]] = None
+        self.critique = ""
+        self.critique_bytes = 0
+        self.started_at = 0.0
+        self.finished_at: Optional[float] = None
+        self.result: Optional[str] = None
+        self.status: Optional[str] = None
+        self.saved_seconds = 0.0
+        self.wasted_seconds = 0.0
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self.choice is not None
+
+    def observe(self, parser: CritiqueStreamParser, received: List[str]) -> None:
+        if self.started or parser.section not in ("p3", "missing", "recommendation"):
+            return
+        partial = parser.result()
+        choice, _reason = judge_recommendation(partial)
+        if choice not in self.choices:
+            return
+        with self._lock:
+            if self.started:
+                return
+            self.choice = choice
+            self.findings = (partial.p1, partial.p2)
+            self.started_at = time.monotonic()
+        critique = "\n".join(received)
+        self.critique = critique
+        self.critique_bytes = len(critique)
+        if choice == "B":
+            phase, prompt = "speculative_accept_opposite_revision", opposite_revision_prompt(self.current, critique)
+        else:
+            phase, prompt = "speculative_generate_compromise", compromise_prompt(self.current, critique)
+        log_event(
+            f"debate: speculative_start choice={choice} backend={self.local_backend} "
+            f"p1={len(partial.p1)} p2={len(partial.p2)}"
+        )
+
+        def run() -> None:
+            try:
+                self.result = run_revision_call(
+                    phase, self.local_backend, prompt, self.cwd, self.timeout_seconds, runtime=self.runtime
+                )
+            finally:
+                self.finished_at = time.monotonic()
+                self._done.set()
+
+        threading.Thread(target=run, name="speculative-revision", daemon=True).start()
+
+    def claim(self, choice: str, parsed: ParsedCritique, critique: str) -> Optional[str]:
+        """Return the speculative revision for the final choice, or None (caller runs it normally)."""
+        if not self.started or self.status is not None:
+            return None
+        reason = None
+        if choice != self.choice:
+            reason = f"final choice {choice} differs"
+        elif (parsed.p1, parsed.p2) != self.findings:
+            reason = "P1/P2 changed"
+        elif parsed.p3 or [item for item in parsed.missing if not is_no_issue_marker(item)]:
+            reason = "P3 or Missing Alternatives findings arrived after the snapshot"
+        elif critique_has_material_after(critique, self.critique):
+            reason = "critique text arrived after the snapshot"
+        if reason:
+            self.discard(reason)
+            return None
+        claimed_at = time.monotonic()
+        self._done.wait()
+        assert self.finished_at is not None
+        if self.result is None:
+            self.status = "failed"
+            self.wasted_seconds = round(self.finished_at - self.started_at, 3)
+            return None
+        self.status = "used"
+        # Without speculation the call would have started at claim time and run just as long.
+        self.saved_seconds = round(min(self.finished_at, claimed_at) - self.started_at, 3)
+        log_event(f"debate: speculative_used choice={choice} saved={self.saved_seconds}s")
+        return self.result
+
+    def discard(self, reason: str) -> None:
+        if not self.started or self.status is not None:
+            return
+        self.runtime.cancel.set()  # type: ignore[union-attr]
+        self._done.wait()
+        assert self.finished_at is not None
+        self.status = "wasted"
+        self.wasted_seconds = round(self.finished_at - self.started_at, 3)
+        log_event(f"debate: speculative_wasted choice={self.choice} reason={reason} wasted={self.wasted_seconds}s")
+
+    def entry(self) -> Dict:
+        return {
+            "choice": self.choice,
+            "status": self.status,
+            "started_after_seconds": round(self.started_at - self.created, 3),
+            "saved_seconds": self.saved_seconds,
+            "wasted_seconds": self.wasted_seconds,
+            "partial_critique": True,
+            "critique_bytes": self.critique_bytes,
+        }
+
+
+def critique_has_material_after(critique: str, snapshot: str) -> bool:
+    """True when critique has content past the snapshot prefix other than headings and "None" items."""
+    final, seen = critique.strip(), snapshot.strip()
+    if not final.startswith(seen):
+        return True
+    for line in final[len(seen):].splitlines():
+        body = line.strip()
+        if not body or body.startswith("#"):
+            continue
+        if not is_no_issue_marker(body.lstrip("-*+ ")):
+            return True
+    return False
+
+
+def generate_compromise(
+    local_backend: str,
+    current: str,
+    critique: str,
+    cwd: Optional[Path],
+    timeout_seconds: int,
+    *,
+    allow_stdin_fallback: bool,
+    runtime: Optional[BackendRuntime] = None,
+) -> str:
+    revised = run_revision_call(
+        "generate_compromise",
+        local_backend,
+        compromise_prompt(current, critique),
+        cwd,
+        timeout_seconds,
+        runtime=runtime,
+    )
+    if revised is not None:
+        return revised
+
+    if not allow_stdin_fallback:
+        return current
+    print("Compromise generation failed; paste compromise content, then Ctrl-D:", file=sys.stderr)
+    user_text = sys.stdin.read().strip()
+    if not user_text:
+        return current
+    return user_text
+
+
+def accept_opposite_revision(
+    local_backend: str,
+    current: str,
+    critique: str,
+    cwd: Optional[Path],
+    timeout_seconds: int,
+    *,
+    runtime: Optional[BackendRuntime] = None,
+) -> str:
+    revised = run_revision_call(
+        "accept_opposite_revision",
+        local_backend,
+        opposite_revision_prompt(current, critique),
+        cwd,
+        timeout_seconds,
+        runtime=runtime,
+    )
+    return revised if revised is not None else current
+
+
+def write_json(path: Path, data: Dict) -> None:
+    """Write JSON atomically (temp file + rename) so readers never see a partial file."""
+    tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def decision_label(final_decision: str) -> str:
+    """Low-cardinality label for a final decision ("Stopped (budget exceeded)" -> stopped_budget_exceeded)."""
+    head, _, detail = final_decision.partition(" (")
+    label = re.sub(r"[^a-z0-9]+", "_", head.lower()).strip("_")
+    if head == "Stopped" and detail:
+        label += "_" + re.sub(r"[^a-z0-9]+", "_", detail.split(" - ")[0].rstrip(")").lower()).strip("_")
+    return label or "unknown"
+
+
+def metric_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{key}="{escape(str(value))}"' for key, value in sorted(labels.items())) + "}"
+
+
+class MetricsTextfile:
+    """Cross-session counters and histograms exported as a Prometheus textfile.
+
+    Running totals live in <path>.state.json. flush() merges this session's observations
+    into them under an flock on <path>.lock and rewrites the textfile via temp file + rename,
+    so concurrent sessions neither lose updates nor expose a half-written file to the
+    node-exporter textfile collector.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.counters: Dict[str, Dict[str, float]] = {}
+        self.histograms: Dict[str, Dict[str, Dict]] = {}
+        self.gauges: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _key(labels: Dict[str, str]) -> str:
+        return json.dumps({key: str(value) for key, value in labels.items()}, sort_keys=True)
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1.0) -> None:
+        series = self.counters.setdefault(name, {})
+        key = self._key(labels)
+        series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, labels: Dict[str, str], value: float) -> None:
+        self.gauges.setdefault(name, {})[self._key(labels)] = value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        bounds = METRICS_HISTOGRAMS[name][1]
+        entry = self.histograms.setdefault(name, {}).setdefault(
+            self._key(labels), {"buckets": [0] * (len(bounds) + 1), "sum": 0.0, "count": 0}
+        )
+        entry["buckets"][bisect.bisect_left(bounds, value)] += 1
+        entry["sum"] += value
+        entry["count"] += 1
+
+    def _merge(self, state: Dict) -> None:
+        for name, series in self.counters.items():
+            totals = state.setdefault("counters", {}).setdefault(name, {})
+            for key, value in series.items():
+                totals[key] = totals.get(key, 0.0) + value
+        for name, series in self.gauges.items():
+            state.setdefault("gauges", {}).setdefault(name, {}).update(series)
+        for name, series in self.histograms.items():
+            totals = state.setdefault("histograms", {}).setdefault(name, {})
+            for key, entry in series.items():
+                total = totals.get(key)
+                if total is None or len(total["buckets"]) != len(entry["buckets"]):
+                    totals[key] = dict(entry, buckets=list(entry["buckets"]))
+                    continue
+                total["buckets"] = [a + b for a, b in zip(total["buckets"], entry["buckets"])]
+                total["sum"] += entry["sum"]
+                total["count"] += entry["count"]
+
+    @staticmethod
+    def render(state: Dict) -> str:
+        lines: List[str] = []
+        for name, help_text in METRICS_COUNTERS.items():
+            series = state.get("counters", {}).get(name)
+            if not series:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{metric_labels(json.loads(key))} {value:g}")
+        for name, help_text in METRICS_GAUGES.items():
+            series = state.get("gauges", {}).get(name)
+            if not series:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{metric_labels(json.loads(key))} {value:.3f}")
+        for name, (help_text, bounds) in METRICS_HISTOGRAMS.items():
+            series = state.get("histograms", {}).get(name)
+            if not series:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for key, entry in sorted(series.items()):
+                labels = json.loads(key)
+                cumulative = 0
+                for bound, count in zip([*map(str, bounds), "+Inf"], entry["buckets"]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{metric_labels({**labels, 'le': bound})} {cumulative}")
+                lines.append(f"{name}_sum{metric_labels(labels)} {entry['sum']:.6g}")
+                lines.append(f"{name}_count{metric_labels(labels)} {entry['count']}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state_file = self.path.with_name(self.path.name + ".state.json")
+        with self.path.with_name(self.path.name + ".lock").open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                state = json.loads(state_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                state = {}
+            self._merge(state)
+            write_json(state_file, state)
+            tmp = self.path.with_name(f".{self.path.name}.tmp-{os.getpid()}")
+            tmp.write_text(self.render(state), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+def collect_session_metrics(metrics: MetricsTextfile, session_state: Dict, spans: List[Dict]) -> None:
+    """Add one finished session's backend latencies and outcomes to metrics."""
+    target = session_state.get("target") or "unknown"
+    backend = session_state.get("backend") or "unknown"
+    for span in spans:
+        attrs = span.get("attrs", {})
+        if span.get("name") == "call_backend_review":
+            phase = "review"
+        elif span.get("name") in ("generate_compromise", "accept_opposite_revision"):
+            phase = "revision"
+        else:
+            continue
+        error = str(attrs.get("error") or "")
+        if attrs.get("cache") == "hit" or "cancelled" in error:
+            continue
+        call_backend = attrs.get("backend") or backend
+        metrics.observe(
+            "debate_backend_call_duration_seconds",
+            {"backend": call_backend, "target": attrs.get("target") or target, "phase": phase},
+            span.get("duration_seconds", 0.0),
+        )
+        if "timed out" in error:
+            metrics.inc("debate_backend_timeouts_total", {"backend": call_backend, "phase": phase})
+
+    rounds = session_state.get("rounds", [])
+    for entry in rounds:
+        choice = entry.get("choice") or "unknown"
+        metrics.inc("debate_round_choices_total", {"choice": choice})
+        if choice == "AUTO_STOP":
+            metrics.inc("debate_auto_stops_total", {"reason": entry.get("auto_stop") or "unknown"})
+        if entry.get("backend_error"):
+            metrics.inc("debate_backend_errors_total", {"backend": entry.get("backend_used") or backend})
+        if entry.get("backend_unavailable"):
+            metrics.inc("debate_fallbacks_total", {"cause": "backend_error"})
+        hedge = entry.get("hedge")
+        if hedge and hedge.get("winner") and hedge.get("winner") != backend:
+            metrics.inc("debate_fallbacks_total", {"cause": "hedge"})
+    if session_state.get("fallback_local_backend"):
+        metrics.inc("debate_fallbacks_total", {"cause": "opposite_unavailable"})
+
+    metrics.inc(
+        "debate_sessions_total",
+        {"decision": decision_label(session_state.get("final_decision") or ""), "target": target},
+    )
+    metrics.observe("debate_session_rounds", {"target": target}, len(rounds))
+    metrics.observe("debate_artifact_bytes", {"target": target}, session_state.get("artifact_bytes") or 0)
+    metrics.observe(
+        "debate_session_duration_seconds", {"target": target}, session_state.get("total_duration_seconds") or 0.0
+    )
+    metrics.set("debate_last_session_timestamp_seconds", {}, time.time())
+
+
+def open_session_index(session_base_dir: Path) -> Optional[SessionIndex]:
+    try:
+        return SessionIndex(session_base_dir / SESSION_INDEX_FILE)
+    except sqlite3.Error as exc:
+        log_event(f"debate: warning session_index_unavailable error={exc}")
+        return None
+
+
+def explicit_intensity_overrides(args: argparse.Namespace) -> List[str]:
+    mapping = {
+        "max_rounds": "--max-rounds",
+        "budget_minutes": "--budget-minutes",
+        "backend_timeout_seconds": "--backend-timeout-seconds",
+    }
+    return [flag for attr, flag in mapping.items() if getattr(args, attr) is not None]
+
+
+def apply_intensity_defaults(args: argparse.Namespace) -> None:
+    # adaptive starts from its base profile; plan_adaptive_intensity refines it once the artifact is known.
+    profile = INTENSITY_PROFILES.get(ADAPTIVE_BASE_INTENSITY if args.intensity == "adaptive" else args.intensity)
+    if profile is None:
+        allowed = ", ".join(sorted([*INTENSITY_PROFILES, "adaptive"]))
         raise ValueError(f"invalid --intensity '{args.intensity}'. Allowed: {allowed}")
 
-    if args.max_rounds is None:
-        args.max_rounds = profile["max_rounds"]
-    if args.budget_minutes is None:
-        args.budget_minutes = profile["budget_minutes"]
-    if args.backend_timeout_seconds is None:
-        args.backend_timeout_seconds = profile["backend_timeout_seconds"]
+    if args.max_rounds is None:
+        args.max_rounds = profile["max_rounds"]
+    if args.budget_minutes is None:
+        args.budget_minutes = profile["budget_minutes"]
+    if args.backend_timeout_seconds is None:
+        args.backend_timeout_seconds = profile["backend_timeout_seconds"]
+
+
+@dataclasses.dataclass
+class LatencyModel:
+    """Least-squares fit of call seconds against input bytes for one backend and target."""
+
+    intercept: float
+    slope: float
+    samples: List[Tuple[int, float]]
+
+    @classmethod
+    def fit(cls, samples: List[Tuple[int, float]]) -> "LatencyModel":
+        count = len(samples)
+        mean_x = sum(size for size, _ in samples) / count
+        mean_y = sum(seconds for _, seconds in samples) / count
+        var_x = sum((size - mean_x) ** 2 for size, _ in samples)
+        cov = sum((size - mean_x) * (seconds - mean_y) for size, seconds in samples)
+        # Bigger inputs never get a smaller prediction.
+        slope = max(cov / var_x, 0.0) if var_x else 0.0
+        return cls(intercept=mean_y - slope * mean_x, slope=slope, samples=samples)
+
+    def predict(self, size: int) -> float:
+        return max(self.intercept + self.slope * size, ADAPTIVE_MIN_PREDICTED_SECONDS)
+
+    def percentile_at(self, size: int, pct: float) -> float:
+        """pct-th percentile of past durations, each rescaled to an input of `size` bytes."""
+        target = self.predict(size)
+        return percentile([seconds * target / self.predict(past) for past, seconds in self.samples], pct)
+
+
+def plan_adaptive_intensity(
+    args: argparse.Namespace,
+    *,
+    overridden: List[str],
+    session_base_dir: Path,
+    backend: str,
+    local_backend: str,
+    target: str,
+    artifact_bytes: int,
+    session_id: str,
+) -> Dict:
+    """Refine the provisional --intensity adaptive values from past backend latency.
+
+    Sets args.backend_timeout_seconds and args.max_rounds unless given explicitly, and
+    returns the plan (inputs, percentiles, chosen values, reasons) for the session metadata.
+    """
+    targets = ("code", "proposal") if target == "mixed" else (target,)
+    reviews, review_timeouts = load_latency_samples(
+        session_base_dir,
+        span_names=("call_backend_review",),
+        backend=backend,
+        targets=targets,
+        exclude_session=session_id,
+    )
+    revisions, _revision_timeouts = load_latency_samples(
+        session_base_dir,
+        span_names=("generate_compromise", "accept_opposite_revision"),
+        backend=local_backend,
+        exclude_session=session_id,
+    )
+    plan: Dict = {
+        "backend": backend,
+        "target": target,
+        "artifact_bytes": artifact_bytes,
+        "review_samples": len(reviews),
+        "review_timeouts": review_timeouts,
+        "revision_samples": len(revisions),
+        "fitted": False,
+        "reasons": [],
+    }
+    reasons: List[str] = plan["reasons"]
+    if len(reviews) < ADAPTIVE_MIN_SAMPLES:
+        reasons.append(
+            f"{len(reviews)} past {backend}/{'+'.join(targets)} reviews (< {ADAPTIVE_MIN_SAMPLES}); "
+            f"keeping {ADAPTIVE_BASE_INTENSITY} timeout={args.backend_timeout_seconds}s rounds={args.max_rounds}"
+        )
+    else:
+        model = LatencyModel.fit(reviews)
+        review_p50 = model.percentile_at(artifact_bytes, 50)
+        review_p90 = model.percentile_at(artifact_bytes, 90)
+        review_p95 = model.percentile_at(artifact_bytes, ADAPTIVE_TIMEOUT_PERCENTILE)
+        revision_p50 = percentile([seconds for _, seconds in revisions], 50) if revisions else review_p50
+        round_seconds = max(review_p90 + revision_p50, ADAPTIVE_MIN_PREDICTED_SECONDS)
+        if revisions:
+            round_basis = f"review p90 + {local_backend} revision p50"
+        else:
+            round_basis = "review p90 + p50, no revision history"
+        plan.update(
+            fitted=True,
+            model={"intercept_seconds": round(model.intercept, 3), "seconds_per_kib": round(model.slope * 1024, 6)},
+            review_p50_seconds=round(review_p50, 3),
+            review_p90_seconds=round(review_p90, 3),
+            review_p95_seconds=round(review_p95, 3),
+            revision_p50_seconds=round(revision_p50, 3),
+            round_seconds=round(round_seconds, 3),
+        )
+        reasons.append(
+            f"{len(reviews)} past reviews scaled to {artifact_bytes} bytes: "
+            f"p50={review_p50:.1f}s p90={review_p90:.1f}s p{ADAPTIVE_TIMEOUT_PERCENTILE}={review_p95:.1f}s"
+        )
+        if "--backend-timeout-seconds" in overridden:
+            reasons.append(f"timeout={args.backend_timeout_seconds}s kept (explicit --backend-timeout-seconds)")
+        else:
+            timeout = math.ceil(review_p95 * ADAPTIVE_TIMEOUT_MARGIN)
+            # Timed-out samples only bound latency from below, so never plan a shorter timeout
+            # than the one those calls already ran out of.
+            floor = INTENSITY_PROFILES[ADAPTIVE_BASE_INTENSITY]["backend_timeout_seconds"] if review_timeouts else 0
+            args.backend_timeout_seconds = min(
+                max(timeout, floor, ADAPTIVE_MIN_TIMEOUT_SECONDS), ADAPTIVE_MAX_TIMEOUT_SECONDS
+            )
+            reasons.append(
+                f"timeout={args.backend_timeout_seconds}s from p{ADAPTIVE_TIMEOUT_PERCENTILE} "
+                f"x {ADAPTIVE_TIMEOUT_MARGIN} (clamped to "
+                f"{ADAPTIVE_MIN_TIMEOUT_SECONDS}..{ADAPTIVE_MAX_TIMEOUT_SECONDS}s"
+                + (f", at least {floor}s after {review_timeouts} timeouts" if review_timeouts else "")
+                + ")"
+            )
+        if "--max-rounds" in overridden:
+            reasons.append(f"rounds={args.max_rounds} kept (explicit --max-rounds)")
+        else:
+            fit = int(args.budget_minutes * 60 // round_seconds)
+            args.max_rounds = min(max(fit, 1), 5)
+            reasons.append(
+                f"rounds={args.max_rounds}: budget {args.budget_minutes}m / round "
+                f"{round_seconds:.1f}s ({round_basis}) fits {fit}, capped to 1..5"
+            )
+    plan.update(backend_timeout_seconds=args.backend_timeout_seconds, max_rounds=args.max_rounds)
+    for reason in reasons:
+        log_event(f"debate: adaptive {reason}")
+    return plan
+
+
+@dataclasses.dataclass
+class BatchItem:
+    index: int
+    kind: str
+    source: str
+    session_args: List[str]
+    # Every backend the session may call; run_batch_item holds a --backend-cap slot for each.
+    backends: Tuple[str, ...]
+
+
+def batch_session_backends(passthrough: List[str], env_name: str) -> Tuple[str, ...]:
+    """Backends a batch session will call: its reviewers plus the local model that writes revisions."""
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--fanout-backends")
+    parser.add_argument("--replay")
+    known, _ = parser.parse_known_args(passthrough)
+    if known.replay:
+        return ()
+    reviewer = opposite_backend(env_name)
+    if not known.fanout_backends and not require_tool(reviewer):
+        reviewer = env_name
+    reviewers = [name.strip() for name in (known.fanout_backends or reviewer).split(",") if name.strip()]
+    return tuple(sorted({*reviewers, env_name}))
+
+
+def parse_backend_caps(raw: List[str]) -> Dict[str, int]:
+    caps: Dict[str, int] = {}
+    for spec in raw:
+        for part in spec.split(","):
+            if not part.strip():
+                continue
+            name, sep, value = part.partition("=")
+            if not sep or not value.strip().isdigit() or int(value) <= 0:
+                raise ValueError(f"invalid backend cap '{part}'; expected <backend>=<positive int>")
+            caps[name.strip()] = int(value)
+    return caps
+
+
+def expand_batch_items(
+    artifact_patterns: List[str],
+    scopes: List[str],
+    git_root: Optional[Path],
+    backends: Tuple[str, ...],
+) -> List[BatchItem]:
+    items: List[BatchItem] = []
+
+    def add(kind: str, source: str, session_args: List[str]) -> None:
+        items.append(BatchItem(len(items) + 1, kind, source, session_args, backends))
+
+    for pattern in artifact_patterns:
+        matches = sorted(glob.glob(os.path.expanduser(pattern), recursive=True))
+        if not matches:
+            raise RuntimeError(f"--artifact-file pattern matched nothing: {pattern}")
+        for match in matches:
+            if Path(match).is_file():
+                add("artifact", match, ["--artifact-file", str(Path(match).resolve())])
+
+    for scope in scopes:
+        kind, value = parse_scope(scope)
+        if not value or kind not in ("commit", "range"):
+            raise RuntimeError(f"batch --scope must be commit:<sha> or range:<a>..<b>, got {scope}")
+        if git_root is None:
+            raise RuntimeError(f"batch scope {scope} requires a git repository")
+        if kind == "commit":
+            add("commit", value, ["--target", "code", "--scope", f"commit:{value}"])
+            continue
+        res = run_cmd(["git", "rev-list", "--reverse", value], cwd=git_root)
+        if res.code != 0:
+            raise RuntimeError(f"git rev-list {value} failed: {res.stderr or res.stdout}")
+        for sha in res.stdout.split():
+            add("commit", sha, ["--target", "code", "--scope", f"commit:{sha}"])
+    return items
+
+
+def run_batch_item(
+    item: BatchItem,
+    *,
+    common_args: List[str],
+    batch_dir: Path,
+    backend_slots: Dict[str, threading.Semaphore],
+) -> Dict:
+    cmd = [sys.executable, str(Path(__file__).resolve()), *item.session_args, *common_args]
+    log_file = batch_dir / f"item-{item.index:04d}.log"
+    # Sorted acquisition order, so items holding several caps cannot deadlock each other.
+    slots = [backend_slots[name] for name in sorted(item.backends) if name in backend_slots]
+    started = time.monotonic()
+    with contextlib.ExitStack() as held:
+        for slot in slots:
+            held.enter_context(slot)
+        with log_file.open("w", encoding="utf-8") as log:
+            proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=log, text=True)
+            log.write(proc.stdout)
+
+    entry: Dict = {
+        "index": item.index,
+        "kind": item.kind,
+        "source": item.source,
+        "exit_code": proc.returncode,
+        "duration_seconds": round(time.monotonic() - started, 3),
+        "log_file": str(log_file),
+    }
+    entry.update(read_session_outcome(proc.stdout))
+    return entry
+
+
+def read_session_outcome(stdout: str) -> Dict:
+    """Locate a finished session from its 'Saved: <dir>' line and summarize decision.json."""
+    outcome: Dict = {}
+    saved = [line[len("Saved: "):].strip() for line in stdout.splitlines() if line.startswith("Saved: ")]
+    if not saved:
+        outcome["error"] = "session did not report a session dir"
+        return outcome
+    session_dir = Path(saved[-1])
+    decision_file = session_dir / "decision.json"
+    outcome["session_dir"] = str(session_dir)
+    outcome["decision_file"] = str(decision_file)
+    try:
+        decision = json.loads(decision_file.read_text(encoding="utf-8"))
+        outcome["session_id"] = decision.get("session_id")
+        outcome["final_decision"] = decision.get("final_decision")
+        outcome["rounds"] = decision.get("rounds")
+    except (OSError, ValueError) as exc:
+        outcome["error"] = f"unreadable decision.json: {exc}"
+    return outcome
+
+
+def batch_main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="debate.py batch",
+        description=(
+            "Run many debate sessions in parallel. Arguments after '--' are passed to every session; "
+            "sessions always run with --mode auto."
+        ),
+    )
+    parser.add_argument(
+        "--artifact-file",
+        action="append",
+        default=[],
+        help="Artifact file or glob pattern (repeatable; '**' is recursive).",
+    )
+    parser.add_argument(
+        "--scope",
+        action="append",
+        default=[],
+        help="commit:<sha> or range:<a>..<b> (expanded to one session per commit). Repeatable.",
+    )
+    parser.add_argument("--jobs", type=int, default=4, help="Max concurrent sessions (default 4).")
+    parser.add_argument(
+        "--backend-cap",
+        action="append",
+        default=[],
+        help="Per-backend concurrency cap, e.g. codex=2,claude=1 (repeatable).",
+    )
+    parser.add_argument("--state-dir", help="Session state root shared by all sessions in the batch.")
+    parser.add_argument("--output", help="Path for batch-decision.json (default: <batch dir>/batch-decision.json).")
+    if "--" in argv:
+        split_at = argv.index("--")
+        own_args, passthrough = argv[:split_at], argv[split_at + 1 :]
+    else:
+        own_args, passthrough = argv, []
+    args = parser.parse_args(own_args)
+
+    if args.jobs <= 0:
+        print("error: --jobs must be > 0", file=sys.stderr)
+        return 2
+    try:
+        backend_caps = parse_backend_caps(args.backend_cap)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    git_root = get_git_root()
+    workspace_root = (git_root if git_root else Path.cwd()).resolve()
+    backends = batch_session_backends(passthrough, detect_env())
+    try:
+        items = expand_batch_items(args.artifact_file, args.scope, git_root, backends)
+    except RuntimeError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    if not items:
+        print("error: batch needs at least one --artifact-file or --scope", file=sys.stderr)
+        return 2
+
+    session_base_dir = resolve_session_base_dir(
+        git_root=git_root,
+        workspace_root=workspace_root,
+        explicit_state_dir=args.state_dir,
+    )
+    batch_id = f"batch-{now_stamp()}-{os.getpid()}"
+    batch_dir = session_base_dir / batch_id
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    common_args = [*passthrough, "--mode", "auto"]
+    if args.state_dir:
+        common_args += ["--state-dir", str(session_base_dir)]
+    backend_slots = {name: threading.Semaphore(cap) for name, cap in backend_caps.items()}
+
+    started_at = dt.datetime.now().isoformat()
+    started = time.monotonic()
+    log_event(
+        f"debate-batch: start items={len(items)} jobs={args.jobs} backends={','.join(backends) or '-'} "
+        f"batch_dir={batch_dir}"
+    )
+    results: List[Dict] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [
+            pool.submit(
+                run_batch_item,
+                item,
+                common_args=common_args,
+                batch_dir=batch_dir,
+                backend_slots=backend_slots,
+            )
+            for item in items
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            entry = future.result()
+            results.append(entry)
+            log_event(
+                f"debate-batch: done {len(results)}/{len(items)} item={entry['index']} exit={entry['exit_code']} "
+                f"decision={entry.get('final_decision')} duration={entry['duration_seconds']}s"
+            )
+
+    results.sort(key=lambda entry: entry["index"])
+    decisions: Dict[str, int] = {}
+    for entry in results:
+        key = entry.get("final_decision") or "Failed"
+        decisions[key] = decisions.get(key, 0) + 1
+    failed = sum(1 for entry in results if entry["exit_code"] != 0 or "error" in entry)
+    batch = {
+        "batch_id": batch_id,
+        "started_at": started_at,
+        "completed_at": dt.datetime.now().isoformat(),
+        "total_duration_seconds": round(time.monotonic() - started, 3),
+        "jobs": args.jobs,
+        "backends": list(backends),
+        "backend_caps": backend_caps,
+        "session_args": common_args,
+        "items": len(results),
+        "failed": failed,
+        "decisions": decisions,
+        "sessions": results,
+    }
+    output = Path(args.output).expanduser().resolve() if args.output else batch_dir / "batch-decision.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    write_json(output, batch)
+    print(f"Batch: {len(results)} sessions, {failed} failed")
+    for name, count in sorted(decisions.items()):
+        print(f"- {name}: {count}")
+    print(f"Saved: {output}")
+    return 0 if failed == 0 else 1
+
+
+def save_current_artifact(session_dir: Path, state: Dict, text: str, round_no: int) -> None:
+    """Persist the artifact produced by round_no's choice, the starting point of the next round."""
+    tmp = session_dir / "current-artifact.md.tmp"
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, session_dir / "current-artifact.md")
+    state["artifact_round"] = round_no
+
+
+def load_resume_state(session_id: str, state_dir: Optional[str]) -> Tuple[Optional[Dict], str]:
+    """Return (metadata of an interrupted session, error message)."""
+    git_root = get_git_root()
+    workspace_root = (git_root if git_root else Path.cwd()).resolve()
+    session_base_dir = resolve_session_base_dir(
+        git_root=git_root,
+        workspace_root=workspace_root,
+        explicit_state_dir=state_dir,
+    )
+    session_dir = session_base_dir / session_id
+    state = read_stored_metadata(StoredSession(session_id, session_dir, False)) if session_dir.is_dir() else None
+    if state is None:
+        if (session_base_dir / SESSION_ARCHIVE_DIR_NAME / f"{session_id}.zip").is_file():
+            return None, f"session {session_id} was compacted into the archive and cannot be resumed"
+        return None, f"cannot read session {session_id} in {session_base_dir}"
+    if state.get("status") == "closed":
+        return None, f"session {session_id} already finished: {state.get('final_decision')}"
+    if "argv" not in state:
+        return None, f"session {session_id} predates --resume support (no recorded arguments)"
+    state["session_dir"] = str(session_dir)
+    return state, ""
+
+
+def plan_resume(state: Dict, session_dir: Path) -> Dict:
+    """Work out where an interrupted session continues.
+
+    A C/D round whose revised artifact was saved (artifact_round) is complete. Any later
+    recorded round - a terminal choice, or a C/D whose revision was lost - is redone from
+    its saved input. Its saved critique is reused, so only the choice's follow-up call
+    (compromise, materialization) runs again.
+    """
+    rounds = state.get("rounds", [])
+    artifact_round = int(state.get("artifact_round", 0))
+    completed = [item for item in rounds if item.get("round", 0) <= artifact_round]
+    start_round = len(completed) + 1
+
+    def read(name: str) -> Optional[str]:
+        path = session_dir / name
+        return path.read_text(encoding="utf-8", errors="replace") if path.exists() else None
+
+    # Round 1 starts from artifact.md (round-1-input.md may be a hard link to it).
+    current = read(f"round-{start_round}-input.md") if start_round > 1 else None
+    if current is None and completed:
+        current = read("current-artifact.md")
+    previous = completed[-1] if completed else None
+    return {
+        "start_round": start_round,
+        "current_artifact": current,
+        "critique": read(f"round-{start_round}-critique.md"),
+        "previous_has_material": bool(previous and (previous.get("p1") or previous.get("p2"))),
+        "previous_round_input": read(f"round-{start_round - 1}-input.md") if previous else None,
+        "previous_unresolved": (
+            [f"- [P1] {item}" for item in previous.get("p1", [])] + [f"- [P2] {item}" for item in previous.get("p2", [])]
+            if previous
+            else []
+        ),
+    }
+
+
+@dataclasses.dataclass
+class RoundReview:
+    """What run_round_review() produced for one round: the critique and how it was obtained."""
+
+    critique: str = ""
+    # Set when the critique was merged from several reviews (fan-out, chunks) and is parsed already.
+    parsed_override: Optional[ParsedCritique] = None
+    effective_target: str = ""
+    backend_used: str = ""
+    backend_unavailable: bool = False
+    budget_exhausted: bool = False
+    review_input_entry: Optional[Dict] = None
+    side_timings: Dict[str, Dict] = dataclasses.field(default_factory=dict)
+    hedge_entry: Optional[Dict] = None
+    speculator: Optional[RevisionSpeculator] = None
+    reviewer_entries: List[Dict] = dataclasses.field(default_factory=list)
+    chunk_entries: List[Dict] = dataclasses.field(default_factory=list)
+
+
+def select_review_input(
+    args: argparse.Namespace,
+    *,
+    round_no: int,
+    target: str,
+    current_artifact: str,
+    round_input: Path,
+    previous_round_input: Optional[str],
+    previous_unresolved: List[str],
+    session_dir: Path,
+) -> Tuple[Path, Optional[Path], Optional[Dict]]:
+    """Review the full round input, or a delta against the previous round when it is small enough.
+
+    Returns (review file, full artifact offered as context for a delta, review_input entry).
+    """
+    if previous_round_input is None or args.no_delta_review or target == "mixed":
+        return round_input, None, None
+    delta_text = build_delta_review_input(
+        previous_round_input,
+        current_artifact,
+        previous_round=round_no - 1,
+        unresolved=previous_unresolved,
+    )
+    full_bytes = len(current_artifact.encode("utf-8"))
+    delta_bytes = len(delta_text.encode("utf-8"))
+    entry = {"mode": "full", "delta_bytes": delta_bytes, "full_bytes": full_bytes}
+    review_file, delta_context = round_input, None
+    if delta_bytes <= args.delta_max_ratio * full_bytes:
+        review_file = session_dir / f"round-{round_no}-delta.md"
+        review_file.write_text(delta_text, encoding="utf-8")
+        delta_context = round_input
+        entry["mode"] = "delta"
+    log_event(
+        f"debate: round={round_no} review_input={entry['mode']} "
+        f"delta_bytes={delta_bytes} full_bytes={full_bytes}"
+    )
+    return review_file, delta_context, entry
+
+
+def run_round_review(
+    args: argparse.Namespace,
+    *,
+    round_no: int,
+    target: str,
+    backend: str,
+    local_backend: str,
+    fallback_local_backend: bool,
+    artifact_kind: str,
+    current_artifact: str,
+    round_input: Path,
+    previous_round_input: Optional[str],
+    previous_unresolved: List[str],
+    fanout_reviewers: List[Tuple[str, int]],
+    hedge_after: Optional[float],
+    resumed_critique: Optional[str],
+    git_root: Optional[Path],
+    session_dir: Path,
+    runtime: BackendRuntime,
+) -> RoundReview:
+    """Obtain one round's critique: mixed, chunked, fan-out, hedged, speculative or single review.
+
+    A failed opposite-backend review falls back to the local backend; if that fails too the
+    critique is a `## Backend Error` section. Budget exhaustion is reported, not raised.
+    """
+    review_file, delta_context, review_input_entry = select_review_input(
+        args,
+        round_no=round_no,
+        target=target,
+        current_artifact=current_artifact,
+        round_input=round_input,
+        previous_round_input=previous_round_input,
+        previous_unresolved=previous_unresolved,
+        session_dir=session_dir,
+    )
+    review = RoundReview(
+        effective_target=target,
+        backend_used=backend,
+        backend_unavailable=fallback_local_backend,
+        review_input_entry=review_input_entry,
+    )
+    try:
+        if resumed_critique is not None:
+            # The interrupted run already paid for this review.
+            log_event(f"debate: round={round_no} reuse_critique file=round-{round_no}-critique.md")
+            review.critique = resumed_critique
+        elif target == "mixed":
+            mixed_code_part, mixed_proposal_part = split_mixed(current_artifact)
+            if not mixed_code_part.strip() and mixed_proposal_part.strip():
+                review.effective_target = "proposal"
+            elif mixed_code_part.strip() and not mixed_proposal_part.strip():
+                review.effective_target = "code"
+            else:
+                review.effective_target = "mixed"
+
+            code_file = session_dir / f"round-{round_no}-mixed-code.md"
+            proposal_file = session_dir / f"round-{round_no}-mixed-proposal.md"
+            code_file.write_text(mixed_code_part, encoding="utf-8")
+            proposal_file.write_text(mixed_proposal_part, encoding="utf-8")
+            scope_for_code = "snippet" if artifact_kind in ("text", "snippet") else args.scope
+
+            if review.effective_target == "code":
+                log_event(f"debate: round={round_no} call_backend backend={backend} target=code")
+                review.critique = call_backend_review(
+                    backend,
+                    target="code",
+                    artifact_file=code_file,
+                    scope=scope_for_code,
+                    git_root=git_root,
+                    timeout=args.backend_timeout_seconds,
+                    runtime=runtime,
+                )
+            elif review.effective_target == "proposal":
+                log_event(f"debate: round={round_no} call_backend backend={backend} target=proposal")
+                review.critique = call_backend_review(
+                    backend,
+                    target="proposal",
+                    artifact_file=proposal_file,
+                    scope=args.scope,
+                    git_root=git_root,
+                    timeout=args.backend_timeout_seconds,
+                    runtime=runtime,
+                )
+            else:
+                log_event(
+                    f"debate: round={round_no} call_backend backend={backend} target=mixed parallel=code,proposal"
+                )
+                outcomes = run_reviews_concurrently(
+                    {
+                        "code": lambda: call_backend_review(
+                            backend,
+                            target="code",
+                            artifact_file=code_file,
+                            scope=scope_for_code,
+                            git_root=git_root,
+                            timeout=args.backend_timeout_seconds,
+                            runtime=runtime,
+                        ),
+                        "proposal": lambda: call_backend_review(
+                            backend,
+                            target="proposal",
+                            artifact_file=proposal_file,
+                            scope=args.scope,
+                            git_root=git_root,
+                            timeout=args.backend_timeout_seconds,
+                            runtime=runtime,
+                        ),
+                    }
+                )
+                for side, outcome in outcomes.items():
+                    review.side_timings[side] = outcome.timing_entry()
+                    log_event(
+                        f"debate: round={round_no} side_done side={side} "
+                        f"status={review.side_timings[side]['status']} duration={outcome.duration_seconds}s"
+                    )
+                for outcome in outcomes.values():
+                    if isinstance(outcome.exception, BudgetExceededError):
+                        raise outcome.exception
+                review.critique = merge_mixed_critiques(outcomes["code"], outcomes["proposal"])
+        else:
+            # When artifact is explicit text/snippet, use scope="snippet" for code reviews
+            scope_to_use = args.scope
+            if target == "code" and artifact_kind in ("text", "snippet"):
+                scope_to_use = "snippet"
+            chunks: List[DiffChunk] = []
+            if (
+                target == "code"
+                and artifact_kind == "diff"
+                and delta_context is None
+                and args.chunk_max_bytes > 0
+                and len(current_artifact.encode("utf-8")) > args.chunk_max_bytes
+            ):
+                chunks = split_diff_chunks(current_artifact, args.chunk_max_bytes)
+            if len(chunks) <= 1 and fanout_reviewers:
+                log_event(
+                    f"debate: round={round_no} call_backend fanout="
+                    f"{','.join(f'{name}-{k + 1}' for name, k in fanout_reviewers)} target={target}"
+                )
+            elif len(chunks) <= 1:
+                log_event(f"debate: round={round_no} call_backend backend={backend} target={target}")
+            if len(chunks) > 1:
+                log_event(
+                    f"debate: round={round_no} chunked_review backend={backend} chunks={len(chunks)} "
+                    f"concurrency={args.chunk_concurrency}"
+                )
+                review.critique, review.parsed_override, review.chunk_entries = chunked_review(
+                    backend,
+                    chunks,
+                    git_root=git_root,
+                    timeout=args.backend_timeout_seconds,
+                    runtime=runtime,
+                    session_dir=session_dir,
+                    round_no=round_no,
+                    max_workers=args.chunk_concurrency,
+                )
+            elif fanout_reviewers:
+                review.critique, review.parsed_override, review.reviewer_entries = fanout_reviews(
+                    fanout_reviewers,
+                    target=target,
+                    artifact_file=review_file,
+                    scope=scope_to_use,
+                    git_root=git_root,
+                    timeout=args.backend_timeout_seconds,
+                    runtime=runtime,
+                    session_dir=session_dir,
+                    round_no=round_no,
+                    full_artifact_file=delta_context,
+                )
+            elif hedge_after is not None:
+
+                def call(name: str, call_runtime: BackendRuntime) -> str:
+                    return call_backend_review(
+                        name,
+                        target=target,
+                        artifact_file=review_file,
+                        scope=scope_to_use,
+                        git_root=git_root,
+                        timeout=args.backend_timeout_seconds,
+                        runtime=call_runtime,
+                        full_artifact_file=delta_context,
+                    )
+
+                critique, hedge_entry = hedged_review(
+                    call,
+                    primary=backend,
+                    fallback=local_backend,
+                    hedge_after=hedge_after,
+                    runtime=runtime,
+                )
+                review.hedge_entry = hedge_entry
+                if hedge_entry.get("hedged"):
+                    log_event(
+                        f"debate: round={round_no} hedge winner={hedge_entry['winner']} "
+                        f"after={hedge_entry['winner_seconds']}s loser={hedge_entry['loser_status']}"
+                    )
+                if hedge_entry["winner"] != backend:
+                    review.backend_used = hedge_entry["winner"]
+                    critique = (
+                        "## Backend Fallback\n"
+                        f"- primary_backend: {backend}\n"
+                        f"- hedged: no answer within {hedge_after}s; {review.backend_used} finished first\n\n"
+                        + critique
+                    )
+                review.critique = critique
+            else:
+                review_runtime = runtime
+                if args.speculative_revision:
+                    review.speculator = RevisionSpeculator(
+                        local_backend=local_backend,
+                        current=current_artifact,
+                        cwd=git_root,
+                        timeout_seconds=args.backend_timeout_seconds,
+                        runtime=runtime,
+                        choices=("C",) if args.skip_materialize_opposite else ("B", "C"),
+                    )
+                    review_runtime = dataclasses.replace(runtime, speculator=review.speculator)
+                review.critique = call_backend_review(
+                    backend,
+                    target=target,
+                    artifact_file=review_file,
+                    scope=scope_to_use,
+                    git_root=git_root,
+                    timeout=args.backend_timeout_seconds,
+                    runtime=review_runtime,
+                    full_artifact_file=delta_context,
+                )
+    except BudgetExceededError as exc:
+        log_event(f"debate: round={round_no} budget_exhausted backend={backend} error={exc}")
+        review.budget_exhausted = True
+    except Exception as exc:
+        primary_error = str(exc)
+        # A failed hedge already ran the local backend.
+        if backend != local_backend and not isinstance(exc, HedgeFailedError) and require_tool(local_backend):
+            review.backend_unavailable = True
+            review.backend_used = local_backend
+            log_event(
+                f"debate: round={round_no} backend_failed primary={backend} "
+                f"fallback={local_backend} error={primary_error}"
+            )
+            try:
+                if review.effective_target == "mixed":
+                    # Best-effort fallback: run single proposal review when mixed fallback fails.
+                    fallback_file = session_dir / f"round-{round_no}-fallback-proposal.md"
+                    fallback_file.write_text(current_artifact, encoding="utf-8")
+                    local_critique = call_backend_review(
+                        local_backend,
+                        target="proposal",
+                        artifact_file=fallback_file,
+                        scope=args.scope,
+                        git_root=git_root,
+                        timeout=args.backend_timeout_seconds,
+                        runtime=runtime,
+                    )
+                else:
+                    local_critique = call_backend_review(
+                        local_backend,
+                        target=review.effective_target,
+                        artifact_file=round_input,
+                        scope=args.scope,
+                        git_root=git_root,
+                        timeout=args.backend_timeout_seconds,
+                        runtime=runtime,
+                    )
+                review.critique = (
+                    "## Backend Fallback\n"
+                    f"- primary_backend: {backend}\n"
+                    f"- error: {primary_error}\n\n"
+                    + local_critique
+                )
+            except BudgetExceededError as fallback_exc:
+                log_event(f"debate: round={round_no} budget_exhausted backend={local_backend} error={fallback_exc}")
+                review.budget_exhausted = True
+            except Exception as fallback_exc:
+                review.critique = (
+                    "## Backend Error\n"
+                    f"- primary_backend: {backend}\n"
+                    f"- primary_error: {primary_error}\n"
+                    f"- fallback_backend: {local_backend}\n"
+                    f"- fallback_error: {fallback_exc}\n"
+                )
+        else:
+            log_event(f"debate: round={round_no} backend_error backend={backend} error={exc}")
+            review.critique = f"## Backend Error\n- {exc}\n"
+    return review
+
+
+def build_round_entry(
+    round_no: int,
+    choice: str,
+    *,
+    parsed: ParsedCritique,
+    rec_choice: str,
+    rec_reason: str,
+    review: RoundReview,
+    round_cache: Optional[Dict],
+    round_scheduler: Optional[Dict],
+    fingerprints: Optional[Dict],
+    auto_stop: Optional[str] = None,
+) -> Dict:
+    """The rounds[] record for a judged or auto-stopped round (speculation is added by the caller)."""
+    entry: Dict = {"round": round_no, "choice": choice}
+    if auto_stop is not None:
+        entry["auto_stop"] = auto_stop
+    entry.update(
+        judge_recommendation=rec_choice,
+        judge_reason=rec_reason,
+        target=review.effective_target,
+        backend_used=review.backend_used,
+        backend_unavailable=review.backend_unavailable,
+        backend_error=parsed.backend_error,
+        p1=parsed.p1,
+        p2=parsed.p2,
+        p3=parsed.p3,
+        missing=parsed.missing,
+    )
+    optional = {
+        "side_timings": review.side_timings or None,
+        "cache": round_cache,
+        "scheduler": round_scheduler,
+        "fingerprints": fingerprints,
+        "hedge": review.hedge_entry,
+        "reviewers": review.reviewer_entries or None,
+        "support": parsed.support if review.reviewer_entries else None,
+        "review_input": review.review_input_entry,
+        "chunks": review.chunk_entries or None,
+        "early_stop": parsed.early_stop_reason,
+    }
+    entry.update({key: value for key, value in optional.items() if value is not None})
+    return entry
+
+
+def parse_since(value: str) -> str:
+    """'7d' / '12h' / '30m' relative to now, or an ISO date/datetime; returns an ISO cutoff."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([dhm])", value.strip())
+    if match:
+        amount = float(match.group(1))
+        unit = {"d": "days", "h": "hours", "m": "minutes"}[match.group(2)]
+        return (dt.datetime.now() - dt.timedelta(**{unit: amount})).isoformat()
+    return dt.datetime.fromisoformat(value.strip()).isoformat()
+
+
+def find_stored_session(session_base_dir: Path, session_id: str) -> Optional[StoredSession]:
+    live = session_base_dir / session_id
+    if live.is_dir():
+        return StoredSession(session_id, live, False)
+    archived = session_base_dir / SESSION_ARCHIVE_DIR_NAME / f"{session_id}.zip"
+    if archived.is_file():
+        return StoredSession(session_id, archived, True)
+    return None
+
+
+def load_session_metadata(session_base_dir: Path, session_id: str) -> Optional[Dict]:
+    entry = find_stored_session(session_base_dir, session_id)
+    return read_stored_metadata(entry) if entry else None
+
+
+def add_retention_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--retention-max-age-days",
+        type=float,
+        default=DEFAULT_RETENTION_MAX_AGE_DAYS,
+        help=f"Delete sessions older than this (default {DEFAULT_RETENTION_MAX_AGE_DAYS}).",
+    )
+    parser.add_argument(
+        "--retention-max-mb",
+        type=float,
+        default=DEFAULT_RETENTION_MAX_MB,
+        help=f"Delete the oldest sessions while the store exceeds this size (default {DEFAULT_RETENTION_MAX_MB}).",
+    )
+    parser.add_argument(
+        "--retention-keep-last",
+        type=int,
+        default=DEFAULT_RETENTION_KEEP_LAST,
+        help=f"Never compact or delete the newest N sessions (default {DEFAULT_RETENTION_KEEP_LAST}).",
+    )
+    parser.add_argument(
+        "--compact-after-days",
+        type=float,
+        default=DEFAULT_COMPACT_AFTER_DAYS,
+        help=(
+            "Pack closed sessions older than this into archive/<session_id>.zip "
+            f"(default {DEFAULT_COMPACT_AFTER_DAYS})."
+        ),
+    )
+
+
+def retention_policy_from_args(args: argparse.Namespace) -> RetentionPolicy:
+    if (
+        args.retention_max_age_days <= 0
+        or args.retention_max_mb <= 0
+        or args.retention_keep_last < 0
+        or args.compact_after_days < 0
+    ):
+        raise ValueError("retention limits must be > 0 (--retention-keep-last and --compact-after-days >= 0)")
+    return RetentionPolicy(
+        max_age_days=args.retention_max_age_days,
+        max_bytes=int(args.retention_max_mb * 1024 * 1024),
+        keep_last=args.retention_keep_last,
+        compact_after_days=args.compact_after_days,
+    )
+
+
+def print_session_rows(rows: List[sqlite3.Row]) -> None:
+    for row in rows:
+        print(
+            f"{row['session_id']}  {(row['started_at'] or '')[:19]}  {row['target'] or '-':8}  "
+            f"rounds={row['rounds']} p1={row['p1_total']} p2={row['p2_total']} "
+            f"choice={row['final_choice'] or '-'}  {row['final_decision'] or row['status']}"
+        )
+
+
+def sessions_main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="debate.py sessions", description="Query the session index.")
+    parser.add_argument("--state-dir", help="Session state root (same default as debate.py).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_filters(cmd: argparse.ArgumentParser) -> None:
+        cmd.add_argument("--since", help="Only sessions started after this: 7d, 12h, 30m or an ISO date.")
+        cmd.add_argument("--choice", help="Final round choice (A/B/C/D/E/AUTO_STOP).")
+        cmd.add_argument("--decision", help="Substring of the final decision, e.g. 'Accept Opposite'.")
+        cmd.add_argument("--target", choices=["code", "proposal", "mixed"])
+        cmd.add_argument("--limit", type=int, default=50)
+        cmd.add_argument("--json", action="store_true", help="Print JSON rows.")
+
+    add_filters(sub.add_parser("list", help="List recent sessions."))
+    show = sub.add_parser("show", help="Show one session with its rounds and findings.")
+    show.add_argument("session_id")
+    show.add_argument("--json", action="store_true", help="Print the full metadata.json.")
+    search = sub.add_parser("search", help="Find sessions by findings.")
+    add_filters(search)
+    search.add_argument("--file", help="File path (substring) mentioned by a finding.")
+    search.add_argument("--severity", choices=[*SEVERITY_SECTIONS, "missing"])
+    search.add_argument("--text", help="Substring of the finding text.")
+    sub.add_parser("rebuild", help="Recreate the index from session dirs and archives on disk.")
+    gc = sub.add_parser("gc", help="Apply the retention policy now (compact, then delete).")
+    add_retention_args(gc)
+    gc.add_argument("--dry-run", action="store_true", help="Report what would be compacted or deleted.")
+    args = parser.parse_args(argv)
+
+    git_root = get_git_root()
+    workspace_root = (git_root if git_root else Path.cwd()).resolve()
+    session_base_dir = resolve_session_base_dir(
+        git_root=git_root,
+        workspace_root=workspace_root,
+        explicit_state_dir=args.state_dir,
+    )
+    try:
+        index = SessionIndex(session_base_dir / SESSION_INDEX_FILE)
+    except sqlite3.Error as exc:
+        print(f"error: cannot open session index: {exc}", file=sys.stderr)
+        return 2
+
+    if args.command == "gc":
+        try:
+            policy = retention_policy_from_args(args)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+        stats = run_session_gc(session_base_dir, policy, index=None if args.dry_run else index, dry_run=args.dry_run)
+        prefix = "would " if args.dry_run else ""
+        print(
+            f"{prefix}compact {len(stats['compacted'])}, {prefix}delete {len(stats['deleted'])} sessions; "
+            f"store {round(stats['bytes_before'] / 1048576, 2)} MiB -> {round(stats['bytes_after'] / 1048576, 2)} MiB"
+        )
+        for session_id in stats["compacted"]:
+            print(f"  compact {session_id}")
+        for session_id in stats["deleted"]:
+            print(f"  delete  {session_id}")
+        if stats.get("skipped"):
+            print(f"skipped: {stats['skipped']}")
+        return 0
+
+    if args.command == "rebuild":
+        started = time.monotonic()
+        count = index.rebuild(session_base_dir)
+        print(f"Indexed {count} sessions from {session_base_dir} in {round(time.monotonic() - started, 3)}s")
+        return 0
+
+    if args.command == "show":
+        rows = index.query("SELECT * FROM sessions WHERE session_id = ?", (args.session_id,))
+        metadata = load_session_metadata(session_base_dir, args.session_id)
+        if args.json:
+            if metadata is None and not rows:
+                print(f"error: session not found: {args.session_id}", file=sys.stderr)
+                return 1
+            print(json.dumps(metadata if metadata is not None else dict(rows[0]), ensure_ascii=False, indent=2))
+            return 0
+        if metadata is not None:
+            # The index is refreshed at snapshot time; fold in journal events written since.
+            index.upsert(metadata)
+            rows = index.query("SELECT * FROM sessions WHERE session_id = ?", (args.session_id,))
+        if not rows:
+            print(f"error: session not found: {args.session_id}", file=sys.stderr)
+            return 1
+        session = rows[0]
+        print_session_rows(rows)
+        print(f"{'archive' if str(session['session_dir']).endswith('.zip') else 'dir'}: {session['session_dir']}")
+        for round_row in index.query(
+            "SELECT * FROM rounds WHERE session_id = ? ORDER BY round", (args.session_id,)
+        ):
+            print(
+                f"\nRound {round_row['round']}: choice={round_row['choice']} "
+                f"judge={round_row['judge_recommendation']} ({round_row['judge_reason']})"
+            )
+            for finding in index.query(
+                "SELECT severity, text FROM findings WHERE session_id = ? AND round = ? ORDER BY rowid",
+                (args.session_id, round_row["round"]),
+            ):
+                print(f"  [{finding['severity'].upper()}] {finding['text']}")
+        return 0
+
+    clauses: List[str] = []
+    params: List = []
+    if args.since:
+        try:
+            clauses.append("s.started_at >= ?")
+            params.append(parse_since(args.since))
+        except ValueError:
+            print(f"error: invalid --since value: {args.since}", file=sys.stderr)
+            return 2
+    if args.choice:
+        clauses.append("s.final_choice = ?")
+        params.append(args.choice.upper())
+    if args.decision:
+        clauses.append("s.final_decision LIKE ?")
+        params.append(f"%{args.decision}%")
+    if args.target:
+        clauses.append("s.target = ?")
+        params.append(args.target)
+    if args.command == "search":
+        finding_clauses = ["f.session_id = s.session_id"]
+        if args.file:
+            finding_clauses.append("(f.file LIKE ? OR f.text LIKE ?)")
+            params += [f"%{args.file}%", f"%{args.file}%"]
+        if args.severity:
+            finding_clauses.append("f.severity = ?")
+            params.append(args.severity)
+        if args.text:
+            finding_clauses.append("f.text LIKE ?")
+            params.append(f"%{args.text}%")
+        clauses.append(f"EXISTS (SELECT 1 FROM findings f WHERE {' AND '.join(finding_clauses)})")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = index.query(f"SELECT s.* FROM sessions s {where} ORDER BY s.started_at DESC LIMIT ?", (*params, args.limit))
+    if args.json:
+        print(json.dumps([dict(row) for row in rows], ensure_ascii=False, indent=2))
+    else:
+        print_session_rows(rows)
+        print(f"({len(rows)} sessions)")
+    return 0
+
+
+def default_serve_socket() -> Path:
+    return default_state_root() / "debate" / SERVE_SOCKET_NAME
+
+
+class _QueueLineWriter(io.TextIOBase):
+    """stderr stand-in for daemon workers: forwards each complete line to the job's event queue."""
+
+    def __init__(self, events) -> None:
+        super().__init__()
+        self._events = events
+        self._pending = ""
+        # Backend reader, chunk and hedge threads all log through the same redirected stderr.
+        self._lock = threading.Lock()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._pending += text
+            *lines, self._pending = self._pending.split("\n")
+            for line in lines:
+                self._events.put({"event": "log", "line": line})
+        return len(text)
+
+    def flush_pending(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._events.put({"event": "log", "line": self._pending})
+                self._pending = ""
+
+
+def serve_worker_init() -> None:
+    global PROBE_CACHE
+    PROBE_CACHE = {}
+    # Ctrl-C on the daemon is handled by the parent, which drains running jobs before exiting.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def serve_run_job(argv: List[str], cwd: str, env: Dict[str, str], events) -> Dict:
+    """Run one debate session inside a warm worker process; progress goes to `events`."""
+    for name in SERVE_FORWARDED_ENV:
+        if name in env:
+            os.environ[name] = env[name]
+        else:
+            os.environ.pop(name, None)
+    os.chdir(cwd)
+    TRACER.reset()
+    events.put({"event": "started", "pid": os.getpid()})
+
+    stdout = io.StringIO()
+    stderr = _QueueLineWriter(events)
+    saved_stdin = sys.stdin
+    sys.stdin = io.StringIO("")
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                code = main([*argv, "--mode", "auto"])
+            except SystemExit as exc:  # argparse errors and --help
+                code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+            except Exception as exc:
+                print(f"error: {exc.__class__.__name__}: {exc}", file=sys.stderr)
+                code = 1
+    finally:
+        sys.stdin = saved_stdin
+        stderr.flush_pending()
+    output = stdout.getvalue()
+    return {"exit_code": code, "stdout": output, **read_session_outcome(output)}
+
+
+class DebateServer(socketserver.ThreadingUnixStreamServer):
+    """Unix-socket job server: one NDJSON request per connection, events streamed back.
+
+    Sessions run on a pool of warm worker processes (tool and git-root probes are cached
+    per worker). A job first takes a slot for each backend it may call, then waits for a free worker.
+    """
+
+    # Handler threads are joined on close so shutdown drains queued and running jobs.
+    daemon_threads = False
+    block_on_close = True
+
+    def __init__(self, socket_path: Path, *, workers: int, backend_caps: Dict[str, int]) -> None:
+        context = multiprocessing.get_context("spawn")
+        self.socket_path = socket_path
+        self.workers = workers
+        self.backend_caps = backend_caps
+        self.backend_slots = {name: threading.Semaphore(cap) for name, cap in backend_caps.items()}
+        self.context = context
+        self.manager = context.Manager()
+        self.pool = self.new_pool()
+        self.lock = threading.Lock()
+        self.jobs: Dict[str, Dict] = {}
+        self.completed = 0
+        self.job_counter = 0
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(socket_path), DebateRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def new_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self.context,
+            initializer=serve_worker_init,
+        )
+
+    def replace_broken_pool(self, broken: concurrent.futures.ProcessPoolExecutor) -> None:
+        """Swap in a fresh pool once a worker died; jobs that shared the broken pool race here, one wins."""
+        with self.lock:
+            if self.pool is not broken:
+                return
+            self.pool = self.new_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+        log_event("debate-serve: worker pool broken; started a new pool")
+
+    def submit_job(self, *args) -> Tuple[concurrent.futures.ProcessPoolExecutor, concurrent.futures.Future]:
+        pool = self.pool
+        try:
+            return pool, pool.submit(serve_run_job, *args)
+        except BrokenProcessPool:
+            # Another job's worker crash broke the pool; this job never ran, so submit it again.
+            self.replace_broken_pool(pool)
+            pool = self.pool
+            return pool, pool.submit(serve_run_job, *args)
+
+    def warm_up(self) -> None:
+        for future in [self.pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def status(self) -> Dict:
+        now = time.monotonic()
+        with self.lock:
+            jobs = [
+                {
+                    "job_id": job_id,
+                    "backend": job["backend"],
+                    "state": job["state"],
+                    "age_seconds": round(now - job["submitted"], 3),
+                }
+                for job_id, job in self.jobs.items()
+            ]
+            completed = self.completed
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "workers": self.workers,
+            "backend_caps": self.backend_caps,
+            "jobs": jobs,
+            "completed": completed,
+        }
+
+    def set_job_state(self, job_id: str, state: str) -> None:
+        with self.lock:
+            self.jobs[job_id]["state"] = state
+
+    def run_job(self, request: Dict, send: Callable[[Dict], None]) -> None:
+        argv = request.get("argv")
+        cwd = request.get("cwd")
+        env = request.get("env") or {}
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            send({"event": "error", "message": "submit needs argv as a list of strings"})
+            return
+        if argv and argv[0] in ("batch", "sessions", "serve", "submit"):
+            send({"event": "error", "message": f"daemon jobs must be debate sessions, not '{argv[0]}'"})
+            return
+        if not isinstance(cwd, str) or not Path(cwd).is_dir():
+            send({"event": "error", "message": f"submit cwd is not a directory: {cwd}"})
+            return
+        if not isinstance(env, dict):
+            send({"event": "error", "message": "submit env must be an object"})
+            return
+        env = {name: str(env[name]) for name in SERVE_FORWARDED_ENV if name in env}
+        client_env = "codex" if env.get("CODEX_THREAD_ID") or env.get("CODEX_SANDBOX_ID") else "claude"
+        backend = opposite_backend(client_env)
+        # Every backend the session may call holds a slot, taken in sorted order like run_batch_item.
+        backends = batch_session_backends(argv, client_env)
+        slots = [self.backend_slots[name] for name in backends if name in self.backend_slots]
+
+        with self.lock:
+            self.job_counter += 1
+            job_id = f"job-{now_stamp()}-{self.job_counter:04d}"
+            self.jobs[job_id] = {"backend": backend, "state": "queued", "submitted": time.monotonic()}
+            waiting = sum(1 for job in self.jobs.values() if job["state"] == "queued")
+        send({"event": "accepted", "job_id": job_id, "backend": backend})
+        send({"event": "queued", "job_id": job_id, "waiting": waiting})
+        log_event(f"debate-serve: accepted job={job_id} backend={backend} slots={','.join(backends)} cwd={cwd}")
+
+        started = time.monotonic()
+        events = self.manager.Queue()
+        result: Dict = {}
+        held = contextlib.ExitStack()
+        for slot in slots:
+            held.enter_context(slot)
+        try:
+            pool = self.pool
+            pool, future = self.submit_job(argv, cwd, env, events)
+            while True:
+                try:
+                    event = events.get(timeout=0.2)
+                except queue.Empty:
+                    if future.done():
+                        break
+                    continue
+                if event.get("event") == "started":
+                    self.set_job_state(job_id, "running")
+                    event["queue_wait_seconds"] = round(time.monotonic() - started, 3)
+                send({**event, "job_id": job_id})
+            result = future.result()
+        except BrokenProcessPool as exc:
+            # A worker died (OOM kill, segfault): the executor refuses all further work, so
+            # replace it; jobs that were running on it fail with this same error.
+            self.replace_broken_pool(pool)
+            result = {"exit_code": 1, "stdout": "", "error": f"worker failed: {exc}"}
+        except Exception as exc:
+            result = {"exit_code": 1, "stdout": "", "error": f"worker failed: {exc.__class__.__name__}: {exc}"}
+        finally:
+            held.close()
+            with self.lock:
+                self.jobs.pop(job_id, None)
+                self.completed += 1
+        duration = round(time.monotonic() - started, 3)
+        send({**result, "event": "result", "job_id": job_id, "backend": backend, "duration_seconds": duration})
+        log_event(
+            f"debate-serve: done job={job_id} exit={result.get('exit_code')} "
+            f"decision={result.get('final_decision')} duration={duration}s"
+        )
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=True)
+        self.manager.shutdown()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+class DebateRequestHandler(socketserver.StreamRequestHandler):
+    server: DebateServer
+
+    def send(self, event: Dict) -> None:
+        try:
+            self.wfile.write((json.dumps(event, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+            self.wfile.flush()
+        except OSError:
+            pass  # client went away; the job keeps running and its session is still saved
+
+    def handle(self) -> None:
+        line = self.rfile.readline(SERVE_MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = None
+        if not isinstance(request, dict):
+            self.send({"event": "error", "message": "expected one JSON object per line"})
+            return
+        op = request.get("op")
+        if op == "submit":
+            self.server.run_job(request, self.send)
+        elif op == "status":
+            self.send({"event": "status", **self.server.status()})
+        elif op == "shutdown":
+            self.send({"event": "shutdown", "pid": os.getpid()})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            self.send({"event": "error", "message": f"unknown op: {op}"})
+
+
+def connect_serve_socket(path: Path) -> Optional[socket.socket]:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+def serve_main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="debate.py serve",
+        description=(
+            "Run a debate daemon on a Unix socket. Jobs submitted with `debate.py submit` run on warm "
+            "worker processes, always with --mode auto."
+        ),
+    )
+    parser.add_argument("--socket", help=f"Socket path (default: <state root>/debate/{SERVE_SOCKET_NAME}).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SERVE_WORKERS,
+        help=f"Worker processes, i.e. max concurrent sessions (default {DEFAULT_SERVE_WORKERS}).",
+    )
+    parser.add_argument(
+        "--backend-cap",
+        action="append",
+        default=[],
+        help="Per-backend concurrency cap, e.g. codex=2,claude=1 (repeatable).",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers <= 0:
+        print("error: --workers must be > 0", file=sys.stderr)
+        return 2
+    try:
+        backend_caps = parse_backend_caps(args.backend_cap)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    socket_path = Path(args.socket).expanduser().resolve() if args.socket else default_serve_socket()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        live = connect_serve_socket(socket_path)
+        if live is not None:
+            live.close()
+            print(f"error: a debate daemon is already listening on {socket_path}", file=sys.stderr)
+            return 2
+        socket_path.unlink()  # stale socket from a daemon that did not exit cleanly
+
+    server = DebateServer(socket_path, workers=args.workers, backend_caps=backend_caps)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    try:
+        server.warm_up()
+        log_event(
+            f"debate-serve: listening socket={socket_path} workers={args.workers} "
+            f"backend_caps={backend_caps or '-'} pid={os.getpid()}"
+        )
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        log_event("debate-serve: shutting down; waiting for running jobs")
+        server.server_close()
+    return 0
+
+
+def submit_main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="debate.py submit",
+        description=(
+            "Submit a debate session to a running `debate.py serve` daemon and wait for its result. "
+            "Arguments after '--' are the session arguments."
+        ),
+    )
+    parser.add_argument("--socket", help=f"Socket path (default: <state root>/debate/{SERVE_SOCKET_NAME}).")
+    parser.add_argument("--status", action="store_true", help="Print the daemon's job status instead of submitting.")
+    parser.add_argument("--shutdown", action="store_true", help="Ask the daemon to drain its jobs and exit.")
+    if "--" in argv:
+        split_at = argv.index("--")
+        own_args, passthrough = argv[:split_at], argv[split_at + 1 :]
+    else:
+        own_args, passthrough = argv, []
+    args = parser.parse_args(own_args)
+
+    if args.status:
+        request: Dict = {"op": "status"}
+    elif args.shutdown:
+        request = {"op": "shutdown"}
+    else:
+        request = {
+            "op": "submit",
+            "argv": passthrough,
+            "cwd": os.getcwd(),
+            "env": {name: os.environ[name] for name in SERVE_FORWARDED_ENV if name in os.environ},
+        }
+
+    socket_path = Path(args.socket).expanduser().resolve() if args.socket else default_serve_socket()
+    sock = connect_serve_socket(socket_path)
+    if sock is None:
+        print(
+            f"error: no debate daemon listening on {socket_path}; start one with `debate.py serve`",
+            file=sys.stderr,
+        )
+        return 2
+    with sock, sock.makefile("r", encoding="utf-8") as stream:
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        for line in stream:
+            event = json.loads(line)
+            kind = event.get("event")
+            if kind == "log":
+                print(event.get("line", ""), file=sys.stderr, flush=True)
+            elif kind in ("accepted", "queued", "started"):
+                details = " ".join(f"{key}={value}" for key, value in event.items() if key != "event")
+                log_event(f"debate-submit: {kind} {details}")
+            elif kind == "status":
+                print(json.dumps(event, ensure_ascii=False, indent=2))
+                return 0
+            elif kind == "shutdown":
+                print(f"Daemon {event.get('pid')} is shutting down")
+                return 0
+            elif kind == "result":
+                sys.stdout.write(event.get("stdout", ""))
+                if event.get("error"):
+                    log_event(f"debate-submit: {event['error']}")
+                return int(event.get("exit_code", 1))
+            elif kind == "error":
+                print(f"error: {event.get('message')}", file=sys.stderr)
+                return 2
+    print("error: daemon closed the connection before the job finished", file=sys.stderr)
+    return 1
+
 
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "batch":
+        return batch_main(argv[1:])
+    if argv and argv[0] == "sessions":
+        return sessions_main(argv[1:])
+    if argv and argv[0] == "serve":
+        return serve_main(argv[1:])
+    if argv and argv[0] == "submit":
+        return submit_main(argv[1:])
 
-def main() -> int:
+    invoked_at = time.time()
     parser = argparse.ArgumentParser(description="Cross-model debate orchestrator MVP")
     parser.add_argument("content", nargs="?", help="Explicit artifact content")
     parser.add_argument("--artifact-file", help="Read artifact content from file")
@@ -631,13 +5011,15 @@ def main() -> int:
     parser.add_argument("--scope", default="uncommitted")
     parser.add_argument(
         "--intensity",
-        choices=["quick", "standard", "extensive"],
+        choices=["quick", "standard", "extensive", "adaptive"],
         default="standard",
         help=(
             "Select intensity preset. "
             "Defaults: quick=(rounds=1,budget=10,timeout=180), "
             "standard=(rounds=3,budget=20,timeout=600), "
             "extensive=(rounds=5,budget=40,timeout=900). "
+            "adaptive starts from standard, then sets the timeout and round count from past latency "
+            "of the same backend/target scaled to the artifact size. "
             "Explicit flags override only their corresponding preset value."
         ),
     )
@@ -652,7 +5034,10 @@ def main() -> int:
         "--budget-minutes",
         type=int,
         default=None,
-        help="Overall time budget in minutes. Defaults from --intensity (standard=20).",
+        help=(
+            "Overall wall-clock budget in minutes; in-flight backend calls are cancelled when it runs out. "
+            "Defaults from --intensity (standard=20)."
+        ),
     )
     parser.add_argument(
         "--backend-timeout-seconds",
@@ -671,6 +5056,198 @@ def main() -> int:
             "the opposite recommendation into revised artifact content."
         ),
     )
+    parser.add_argument(
+        "--stream-backend-output",
+        action="store_true",
+        help="Echo backend stdout/stderr lines to stderr as they arrive.",
+    )
+    parser.add_argument(
+        "--fanout-backends",
+        help=(
+            "Comma-separated reviewers for the same round, run in parallel and merged "
+            "(e.g. codex,claude). Not applied to mixed artifacts."
+        ),
+    )
+    parser.add_argument(
+        "--fanout-samples",
+        type=int,
+        default=1,
+        help="Independent critiques per fan-out backend (default 1). >1 alone samples the opposite backend K times.",
+    )
+    parser.add_argument(
+        "--consensus-min",
+        type=int,
+        default=1,
+        help="With fan-out, treat P1 findings raised by fewer reviewers than this as P2 when judging (default 1).",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help=(
+            "Parse backend output while it streams and stop the call once enough P1 findings "
+            "(--fail-fast-p1) or an agreement signal with no P1/P2 have arrived."
+        ),
+    )
+    parser.add_argument(
+        "--fail-fast-p1",
+        type=int,
+        default=1,
+        help="P1 findings that end a --fail-fast review early (default 1).",
+    )
+    parser.add_argument(
+        "--no-delta-review",
+        action="store_true",
+        help="Always send the full artifact in later rounds instead of a diff against the previous round.",
+    )
+    parser.add_argument(
+        "--delta-max-ratio",
+        type=float,
+        default=DEFAULT_DELTA_MAX_RATIO,
+        help=(
+            "Send the full artifact when the delta input exceeds this fraction of the full artifact size "
+            f"(default {DEFAULT_DELTA_MAX_RATIO})."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-max-bytes",
+        type=int,
+        default=DEFAULT_CHUNK_MAX_BYTES,
+        help=(
+            "Split git diffs larger than this into per-file/per-hunk chunks reviewed in parallel "
+            f"(default {DEFAULT_CHUNK_MAX_BYTES}; 0 disables)."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-concurrency",
+        type=int,
+        default=DEFAULT_CHUNK_CONCURRENCY,
+        help=f"Max concurrent chunk reviews (default {DEFAULT_CHUNK_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the critique cache (no reads, no writes).",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached critiques but store fresh results in the cache.",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=DEFAULT_CACHE_TTL_HOURS,
+        help=f"Critique cache entry lifetime in hours (default {DEFAULT_CACHE_TTL_HOURS}).",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_CACHE_MAX_MB,
+        help=(
+            "Critique cache size cap in MiB; least recently used entries are evicted "
+            f"(default {DEFAULT_CACHE_MAX_MB})."
+        ),
+    )
+    parser.add_argument(
+        "--no-fingerprint-convergence",
+        action="store_true",
+        help=(
+            "Do not stop early when a round raises no new P1/P2 findings (findings are matched across "
+            "rounds by MinHash fingerprints; the per-round new/recurring/resolved report is kept)."
+        ),
+    )
+    parser.add_argument(
+        "--speculative-revision",
+        action="store_true",
+        help=(
+            "Start the B/C revision call while the critique is still streaming, as soon as its P1/P2 "
+            "sections imply that choice; the result is discarded if the final judgment differs."
+        ),
+    )
+    parser.add_argument(
+        "--hedge-after-seconds",
+        metavar="SECONDS|auto",
+        help=(
+            "If the opposite backend has not answered a review within this many seconds, start the local "
+            "backend alongside it and keep whichever returns a structured critique first. 'auto' uses the "
+            f"p{HEDGE_PERCENTILE} review latency of recent sessions (default {DEFAULT_HEDGE_AFTER_SECONDS:g}s "
+            "without enough history). Off by default."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-textfile",
+        metavar="PATH",
+        help=(
+            "At the end of the session, merge its backend call latencies and outcomes into cumulative "
+            "Prometheus metrics written atomically to PATH (e.g. a node-exporter textfile collector "
+            "directory, *.prom). Totals are kept in PATH.state.json."
+        ),
+    )
+    parser.add_argument(
+        "--scheduler",
+        action="store_true",
+        help=(
+            "Coordinate backend calls with other debate processes through a shared scheduler under "
+            "$XDG_STATE_HOME/debate/scheduler (max concurrent calls and requests per minute per backend)."
+        ),
+    )
+    parser.add_argument(
+        "--scheduler-max-concurrent",
+        action="append",
+        default=[],
+        help=f"Per-backend concurrent call limit, e.g. codex=2,claude=1 (default {DEFAULT_SCHEDULER_MAX_CONCURRENT}).",
+    )
+    parser.add_argument(
+        "--scheduler-rpm",
+        action="append",
+        default=[],
+        help=f"Per-backend requests per minute, e.g. codex=20 (default {DEFAULT_SCHEDULER_RPM}).",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="SESSION_ID",
+        help=(
+            "Continue an interrupted session with its original arguments, artifact and remaining budget. "
+            "Completed rounds and saved critiques are reused; only --state-dir is read from this command line."
+        ),
+    )
+    parser.add_argument(
+        "--max-artifact-mb",
+        type=float,
+        default=DEFAULT_MAX_ARTIFACT_MB,
+        help=(
+            "Cap on the collected artifact (git diff or file) in MiB; the rest is cut behind a "
+            f"truncation marker (default {DEFAULT_MAX_ARTIFACT_MB})."
+        ),
+    )
+    parser.add_argument(
+        "--max-backend-output-mb",
+        type=float,
+        default=DEFAULT_MAX_BACKEND_OUTPUT_MB,
+        help=(
+            "Cap on captured stdout/stderr per backend call in MiB; the rest is drained and dropped "
+            f"(default {DEFAULT_MAX_BACKEND_OUTPUT_MB})."
+        ),
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Save every backend prompt and response under <session_dir>/recordings for later --replay.",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="SESSION",
+        help=(
+            "Serve backend responses from a session recorded with --record (session id or path) "
+            "instead of calling codex/claude. Reuses that session's artifact unless one is given."
+        ),
+    )
+    add_retention_args(parser)
+    parser.add_argument(
+        "--no-session-gc",
+        action="store_true",
+        help="Skip the opportunistic retention pass (compaction/deletion of old sessions) at session start.",
+    )
     parser.add_argument(
         "--state-dir",
         help=(
@@ -679,7 +5256,17 @@ def main() -> int:
             "${XDG_STATE_HOME:-~/.local/state}/debate/<workspace-key>/review-loop otherwise."
         ),
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    resume_state: Optional[Dict] = None
+    if args.resume:
+        resume_state, error = load_resume_state(args.resume, args.state_dir)
+        if resume_state is None:
+            print(f"error: {error}", file=sys.stderr)
+            return 2
+        argv = list(resume_state.get("argv", []))
+        args = parser.parse_args(argv)
+        args.resume = resume_state["session_id"]
+        args.state_dir = str(Path(resume_state["session_dir"]).parent)
     try:
         validate_intensity_profiles()
         overridden = explicit_intensity_overrides(args)
@@ -704,6 +5291,46 @@ def main() -> int:
     if args.backend_timeout_seconds <= 0:
         print("error: --backend-timeout-seconds must be > 0", file=sys.stderr)
         return 2
+    if args.fail_fast_p1 < 1:
+        print("error: --fail-fast-p1 must be >= 1", file=sys.stderr)
+        return 2
+    if args.fanout_samples < 1 or args.consensus_min < 1:
+        print("error: --fanout-samples and --consensus-min must be >= 1", file=sys.stderr)
+        return 2
+    if args.chunk_max_bytes < 0 or args.chunk_concurrency < 1:
+        print("error: --chunk-max-bytes must be >= 0 and --chunk-concurrency >= 1", file=sys.stderr)
+        return 2
+    if args.delta_max_ratio <= 0:
+        print("error: --delta-max-ratio must be > 0", file=sys.stderr)
+        return 2
+    if args.cache_ttl_hours <= 0 or args.cache_max_mb <= 0:
+        print("error: --cache-ttl-hours and --cache-max-mb must be > 0", file=sys.stderr)
+        return 2
+    if args.max_artifact_mb <= 0 or args.max_backend_output_mb <= 0:
+        print("error: --max-artifact-mb and --max-backend-output-mb must be > 0", file=sys.stderr)
+        return 2
+    try:
+        retention_policy = retention_policy_from_args(args)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    if args.record and args.replay:
+        print("error: --record and --replay are mutually exclusive", file=sys.stderr)
+        return 2
+    if args.hedge_after_seconds not in (None, "auto"):
+        try:
+            hedge_seconds = float(args.hedge_after_seconds)
+        except ValueError:
+            hedge_seconds = -1.0
+        if hedge_seconds <= 0:
+            print("error: --hedge-after-seconds must be a positive number or 'auto'", file=sys.stderr)
+            return 2
+    try:
+        scheduler_max_concurrent = parse_backend_caps(args.scheduler_max_concurrent)
+        scheduler_rpm = parse_backend_caps(args.scheduler_rpm)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
 
     git_root = get_git_root()
     workspace_root = (git_root if git_root else Path.cwd()).resolve()
@@ -713,10 +5340,50 @@ def main() -> int:
         explicit_state_dir=args.state_dir,
     )
 
+    replay_dir: Optional[Path] = None
+    replay_meta: Dict = {}
+    replay_artifact = False
+    if args.replay:
+        replay_dir = Path(args.replay).expanduser()
+        if not replay_dir.is_dir():
+            replay_dir = session_base_dir / args.replay
+        archived = session_base_dir / SESSION_ARCHIVE_DIR_NAME / f"{replay_dir.name}.zip"
+        if not replay_dir.is_dir() and archived.is_file():
+            print(
+                f"error: replay session {replay_dir.name} was compacted; unzip {archived} into {replay_dir} first",
+                file=sys.stderr,
+            )
+            return 2
+        replay_meta = read_stored_metadata(StoredSession(replay_dir.name, replay_dir, False)) or {}
+        if not replay_meta:
+            print(f"error: cannot read replay session {args.replay}", file=sys.stderr)
+            return 2
+        if not (replay_dir / "recordings").is_dir():
+            print(f"error: replay session {replay_dir} has no recordings (run it with --record)", file=sys.stderr)
+            return 2
+        try:
+            recorded_args = parser.parse_args(list(replay_meta.get("argv", [])))
+        except SystemExit:
+            print(f"error: cannot parse the recorded argv of replay session {args.replay}", file=sys.stderr)
+            return 2
+        for name in REPLAY_SHAPING_ARGS:
+            setattr(args, name, getattr(recorded_args, name))
+        # Without an explicit artifact, reuse the recorded one like --resume does, so a git-scoped
+        # code review rebuilds the same `codex review --<scope>` argv instead of a text review.
+        replay_artifact = not args.content and not args.artifact_file
+        # Recorded responses replace the cache, and a cache hit would skip the recording.
+        args.no_cache = True
+    elif args.record:
+        args.no_cache = True
+
     env_name = detect_env()
     backend = opposite_backend(env_name)
     fallback_local_backend = False
-    if not require_tool(backend):
+    if replay_dir:
+        # No tool probes: replay never spawns a backend, and must pick the recorded reviewer.
+        backend = replay_meta.get("backend", backend)
+        fallback_local_backend = bool(replay_meta.get("fallback_local_backend"))
+    elif not require_tool(backend):
         print(
             f"warning: opposite backend '{backend}' unavailable; fallback to local '{env_name}' critique.",
             file=sys.stderr,
@@ -727,31 +5394,148 @@ def main() -> int:
             print(f"error: local backend '{backend}' is unavailable", file=sys.stderr)
             return 2
 
-    session_id, session_dir = make_session_dir(session_base_dir)
+    fanout_reviewers: List[Tuple[str, int]] = []
+    if args.fanout_backends or args.fanout_samples > 1:
+        requested = [name.strip() for name in (args.fanout_backends or backend).split(",") if name.strip()]
+        for name in requested:
+            if name not in ("codex", "claude"):
+                print(f"error: unknown fan-out backend '{name}' (expected codex or claude)", file=sys.stderr)
+                return 2
+            if name != backend and not replay_dir and not require_tool(name):
+                print(f"warning: fan-out backend '{name}' unavailable; skipping it.", file=sys.stderr)
+                continue
+            fanout_reviewers += [(name, sample) for sample in range(args.fanout_samples)]
+        if len(fanout_reviewers) < 2:
+            print("warning: fan-out needs at least two reviewers; using a single review.", file=sys.stderr)
+            fanout_reviewers = []
+
+    if resume_state:
+        session_id = resume_state["session_id"]
+        session_dir = Path(resume_state["session_dir"])
+    else:
+        session_id, session_dir = make_session_dir(session_base_dir)
+    TRACER.attach(session_dir)
+    session_index = open_session_index(session_base_dir)
+    if not args.no_session_gc:
+        maybe_run_session_gc(
+            session_base_dir,
+            retention_policy,
+            index=session_index,
+            exclude=(session_id, replay_dir.name) if replay_dir else (session_id,),
+        )
     if backend == "claude" and is_tmp_path(session_dir):
         log_event(
             "debate: warning session_dir is under /tmp while backend=claude; "
             "claude -p may be unable to read files there. Prefer --state-dir ./.debate-state."
         )
-    started_at = time.time()
+    # A resumed session continues its wall-clock budget where the interrupted run left it.
+    elapsed_before = float(resume_state.get("elapsed_seconds", 0)) if resume_state else 0.0
+    started_at = time.time() - elapsed_before
+    cache = None
+    if not args.no_cache:
+        cache = CritiqueCache(
+            session_base_dir / CRITIQUE_CACHE_DIR_NAME,
+            ttl_seconds=args.cache_ttl_hours * 3600,
+            max_bytes=int(args.cache_max_mb * 1024 * 1024),
+            read_enabled=not args.refresh,
+        )
+    runtime = BackendRuntime(
+        deadline=time.monotonic() + args.budget_minutes * 60 - elapsed_before,
+        stream_output=args.stream_backend_output,
+        cache=cache,
+        fail_fast_p1=args.fail_fast_p1 if args.fail_fast else 0,
+        max_output_bytes=int(args.max_backend_output_mb * 1024 * 1024),
+    )
+    if replay_dir:
+        runtime.recorder = BackendRecorder("replay", replay_dir / "recordings", session_dir)
+    elif args.record:
+        runtime.recorder = BackendRecorder("record", session_dir / "recordings", session_dir)
+    if args.scheduler:
+        runtime.scheduler = BackendScheduler(
+            default_state_root() / "debate" / SCHEDULER_DIR_NAME,
+            session_id=session_id,
+            max_concurrent=scheduler_max_concurrent,
+            rpm=scheduler_rpm,
+        )
     log_event(
         "debate: start "
         f"env={env_name} opposite_backend={backend} target={args.target} session_dir={session_dir}"
+        + (f" replay={replay_dir}" if replay_dir else "")
     )
 
     try:
-        target, artifact_text, artifact_kind = resolve_artifact(args, git_root, workspace_root, session_dir)
-    except RuntimeError as exc:
+        with TRACER.span("resolve_artifact", target=args.target, scope=args.scope) as span:
+            if resume_state:
+                target = resume_state["target"]
+                artifact_kind = resume_state.get("artifact_kind", "text")
+                artifact_text = (session_dir / "artifact.md").read_text(encoding="utf-8", errors="replace")
+                artifact_files = []
+                span["resumed"] = True
+            elif replay_dir and replay_artifact:
+                target = replay_meta.get("target", args.target)
+                artifact_kind = replay_meta.get("artifact_kind", "text")
+                link_or_copy(replay_dir / "artifact.md", session_dir / "artifact.md")
+                artifact_text = (session_dir / "artifact.md").read_text(encoding="utf-8", errors="replace")
+                artifact_files = []
+                span["replayed"] = True
+            else:
+                target, artifact_text, artifact_kind, artifact_files = resolve_artifact(
+                    args, git_root, workspace_root, session_dir
+                )
+            span.update(resolved_target=target, artifact_kind=artifact_kind, bytes_out=len(artifact_text))
+    except (RuntimeError, OSError) as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 2
-    if target in ("proposal", "mixed") and args.backend_timeout_seconds < 120:
+    adaptive_plan: Optional[Dict] = None
+    if args.intensity == "adaptive":
+        if resume_state and resume_state.get("adaptive"):
+            # Keep the values the interrupted run planned with.
+            adaptive_plan = resume_state["adaptive"]
+            args.backend_timeout_seconds = adaptive_plan["backend_timeout_seconds"]
+            args.max_rounds = adaptive_plan["max_rounds"]
+        else:
+            with TRACER.span("plan_adaptive_intensity", target=target) as span:
+                adaptive_plan = plan_adaptive_intensity(
+                    args,
+                    overridden=overridden,
+                    session_base_dir=session_base_dir,
+                    backend=backend,
+                    local_backend=env_name,
+                    target=target,
+                    artifact_bytes=(session_dir / "artifact.md").stat().st_size,
+                    session_id=session_id,
+                )
+                span.update(
+                    review_samples=adaptive_plan["review_samples"],
+                    backend_timeout_seconds=args.backend_timeout_seconds,
+                    max_rounds=args.max_rounds,
+                )
+    adaptive_fitted = bool(adaptive_plan and adaptive_plan.get("fitted"))
+    if target in ("proposal", "mixed") and args.backend_timeout_seconds < 120 and not adaptive_fitted:
         log_event(
             "debate: warning backend-timeout-seconds is low for proposal/mixed reviews; "
             "recommend >=120 (default 600)."
         )
 
     artifact_file = session_dir / "artifact.md"
-    artifact_file.write_text(artifact_text, encoding="utf-8")
+
+    hedge_after: Optional[float] = None
+    hedge_config: Optional[Dict] = None
+    if args.hedge_after_seconds and not replay_dir:
+        if fallback_local_backend or fanout_reviewers or target == "mixed":
+            log_event("debate: hedge disabled (needs a single opposite-backend reviewer and a non-mixed target)")
+        elif not require_tool(env_name):
+            log_event(f"debate: hedge disabled (local backend '{env_name}' unavailable)")
+        else:
+            hedge_after, hedge_source = resolve_hedge_threshold(
+                args.hedge_after_seconds,
+                session_base_dir=session_base_dir,
+                backend=backend,
+                target=target,
+                session_id=session_id,
+            )
+            hedge_config = {"threshold_seconds": hedge_after, "source": hedge_source, "fallback": env_name}
+            log_event(f"debate: hedge threshold={hedge_after}s source={hedge_source} fallback={env_name}")
 
     session_state: Dict = {
         "session_id": session_id,
@@ -766,281 +5550,342 @@ def main() -> int:
         "session_dir": str(session_dir),
         "backend": backend,
         "fallback_local_backend": fallback_local_backend,
+        "argv": list(argv),
+        "artifact_kind": artifact_kind,
+        "artifact_bytes": artifact_file.stat().st_size,
+        "artifact_files": artifact_file_totals(artifact_files) if artifact_files else None,
+        "fanout_reviewers": [f"{name}-{sample + 1}" for name, sample in fanout_reviewers],
+        "consensus_min": args.consensus_min,
         "rounds": [],
         "status": "in_progress",
+        "cache": cache.stats() if cache else {"enabled": False},
     }
-    write_json(session_dir / "metadata.json", session_state)
+    if runtime.recorder:
+        session_state["recording"] = runtime.recorder.stats()
+    if adaptive_plan:
+        session_state["adaptive"] = adaptive_plan
+    if hedge_config:
+        session_state["hedge"] = hedge_config
+    if args.speculative_revision:
+        session_state["speculation"] = {
+            "started": 0,
+            "used": 0,
+            "wasted": 0,
+            "saved_seconds": 0.0,
+            "wasted_seconds": 0.0,
+        }
 
-    current_artifact = artifact_text
-    final_decision = "Stopped"
-    final_artifact = current_artifact
-    previous_has_material = False
+    def record_speculation(round_entry: Dict, speculator: Optional[RevisionSpeculator]) -> None:
+        """Add a settled speculation to the round entry and the session totals."""
+        if not speculator or speculator.status is None or "speculation" in round_entry:
+            return
+        entry = round_entry["speculation"] = speculator.entry()
+        totals = session_state["speculation"]
+        totals["started"] += 1
+        totals["used" if entry["status"] == "used" else "wasted"] += 1
+        totals["saved_seconds"] = round(totals["saved_seconds"] + entry["saved_seconds"], 3)
+        totals["wasted_seconds"] = round(totals["wasted_seconds"] + entry["wasted_seconds"], 3)
+    if runtime.scheduler:
+        session_state["scheduler"] = {
+            **runtime.scheduler.stats(),
+            "limits": {
+                name: dict(zip(("max_concurrent", "rpm"), runtime.scheduler.limits(name)))
+                for name in sorted({backend, env_name})
+            },
+        }
 
-    for round_no in range(1, args.max_rounds + 1):
-        elapsed_min = (time.time() - started_at) / 60.0
-        if elapsed_min >= args.budget_minutes:
-            final_decision = "Stopped (budget exceeded)"
-            break
+    journal = SessionJournal(session_dir, index=session_index, baseline=resume_state)
 
-        round_input = session_dir / f"round-{round_no}-input.md"
-        round_input.write_text(current_artifact, encoding="utf-8")
-        log_event(f"debate: round={round_no} route_start target={target}")
+    def checkpoint(snapshot: bool = False) -> None:
+        session_state["elapsed_seconds"] = round(time.time() - started_at, 3)
+        journal.checkpoint(session_state, snapshot=snapshot)
 
-        backend_unavailable = fallback_local_backend
-        backend_used = backend
-        effective_target = target
-        try:
-            if target == "mixed":
-                mixed_code_part, mixed_proposal_part = split_mixed(current_artifact)
-                if not mixed_code_part.strip() and mixed_proposal_part.strip():
-                    effective_target = "proposal"
-                elif mixed_code_part.strip() and not mixed_proposal_part.strip():
-                    effective_target = "code"
-                else:
-                    effective_target = "mixed"
-
-                code_file = session_dir / f"round-{round_no}-mixed-code.md"
-                proposal_file = session_dir / f"round-{round_no}-mixed-proposal.md"
-                code_file.write_text(mixed_code_part, encoding="utf-8")
-                proposal_file.write_text(mixed_proposal_part, encoding="utf-8")
-
-                if effective_target == "code":
-                    log_event(f"debate: round={round_no} call_backend backend={backend} target=code")
-                    scope_for_code = args.scope
-                    if artifact_kind in ("text", "snippet"):
-                        scope_for_code = "snippet"
-                    critique = call_backend_review(
-                        backend,
-                        target="code",
-                        artifact_file=code_file,
-                        scope=scope_for_code,
-                        git_root=git_root,
-                        timeout=args.backend_timeout_seconds,
-                    )
-                elif effective_target == "proposal":
-                    log_event(f"debate: round={round_no} call_backend backend={backend} target=proposal")
-                    critique = call_backend_review(
-                        backend,
-                        target="proposal",
-                        artifact_file=proposal_file,
-                        scope=args.scope,
-                        git_root=git_root,
-                        timeout=args.backend_timeout_seconds,
-                    )
-                else:
-                    scope_for_code = args.scope
-                    if artifact_kind in ("text", "snippet"):
-                        scope_for_code = "snippet"
-                    critique_code = call_backend_review(
-                        backend,
-                        target="code",
-                        artifact_file=code_file,
-                        scope=scope_for_code,
-                        git_root=git_root,
-                        timeout=args.backend_timeout_seconds,
-                    )
-                    log_event(f"debate: round={round_no} call_backend backend={backend} target=proposal")
-                    critique_proposal = call_backend_review(
-                        backend,
-                        target="proposal",
-                        artifact_file=proposal_file,
-                        scope=args.scope,
-                        git_root=git_root,
-                        timeout=args.backend_timeout_seconds,
-                    )
-                    critique = (
-                        "## Code Critique\n\n"
-                        + critique_code
-                        + "\n\n## Proposal Critique\n\n"
-                        + critique_proposal
-                    )
-            else:
-                log_event(f"debate: round={round_no} call_backend backend={backend} target={target}")
-                # When artifact is explicit text/snippet, use scope="snippet" for code reviews
-                scope_to_use = args.scope
-                if target == "code" and artifact_kind in ("text", "snippet"):
-                    scope_to_use = "snippet"
-                critique = call_backend_review(
-                    backend,
-                    target=target,
-                    artifact_file=round_input,
-                    scope=scope_to_use,
-                    git_root=git_root,
-                    timeout=args.backend_timeout_seconds,
-                )
-        except Exception as exc:
-            primary_error = str(exc)
-            local_backend = env_name
-            if backend != local_backend and require_tool(local_backend):
-                backend_unavailable = True
-                backend_used = local_backend
-                log_event(
-                    f"debate: round={round_no} backend_failed primary={backend} "
-                    f"fallback={local_backend} error={primary_error}"
-                )
-                try:
-                    if effective_target == "mixed":
-                        # Best-effort fallback: run single proposal review when mixed fallback fails.
-                        fallback_file = session_dir / f"round-{round_no}-fallback-proposal.md"
-                        fallback_file.write_text(current_artifact, encoding="utf-8")
-                        local_critique = call_backend_review(
-                            local_backend,
-                            target="proposal",
-                            artifact_file=fallback_file,
-                            scope=args.scope,
-                            git_root=git_root,
-                            timeout=args.backend_timeout_seconds,
-                        )
-                    else:
-                        local_critique = call_backend_review(
-                            local_backend,
-                            target=effective_target,
-                            artifact_file=round_input,
-                            scope=args.scope,
-                            git_root=git_root,
-                            timeout=args.backend_timeout_seconds,
-                        )
-                    critique = (
-                        "## Backend Fallback\n"
-                        f"- primary_backend: {backend}\n"
-                        f"- error: {primary_error}\n\n"
-                        + local_critique
-                    )
-                except Exception as fallback_exc:
-                    critique = (
-                        "## Backend Error\n"
-                        f"- primary_backend: {backend}\n"
-                        f"- primary_error: {primary_error}\n"
-                        f"- fallback_backend: {local_backend}\n"
-                        f"- fallback_error: {fallback_exc}\n"
-                    )
+    # try/finally: serve workers reuse the process, so an exception must not leak the events.jsonl fd.
+    try:
+        current_artifact = artifact_text
+        previous_has_material = False
+        previous_round_input: Optional[str] = None
+        previous_unresolved: List[str] = []
+        start_round = 1
+        resumed_critique: Optional[str] = None
+        if resume_state:
+            resume_point = plan_resume(resume_state, session_dir)
+            start_round = resume_point["start_round"]
+            if resume_point["current_artifact"] is not None:
+                current_artifact = resume_point["current_artifact"]
+            previous_has_material = resume_point["previous_has_material"]
+            previous_round_input = resume_point["previous_round_input"]
+            previous_unresolved = resume_point["previous_unresolved"]
+            resumed_critique = resume_point["critique"]
+            # Keep what the first run recorded about the session; counters (cache, ...) restart.
+            session_state.update(
+                {
+                    key: value
+                    for key, value in resume_state.items()
+                    if key not in session_state or key in ("started_at", "artifact_files")
+                }
+            )
+            session_state["rounds"] = resume_state.get("rounds", [])[: start_round - 1]
+            session_state["resumes"] = [
+                *resume_state.get("resumes", []),
+                {"at": dt.datetime.now().isoformat(), "from_round": start_round, "elapsed_seconds": elapsed_before},
+            ]
+            log_event(
+                f"debate: resume session={session_id} from_round={start_round} "
+                f"reuse_critique={resumed_critique is not None} "
+                f"budget_left={round(args.budget_minutes * 60 - elapsed_before, 1)}s"
+            )
+        checkpoint(snapshot=True)
+
+        finding_index = FindingIndex()
+        for entry in session_state["rounds"]:
+            if not entry.get("backend_error"):
+                finding_index.observe(entry["round"], entry)
+
+        final_decision = "Stopped"
+        final_artifact = current_artifact
+
+        for round_no in range(start_round, args.max_rounds + 1):
+            elapsed_min = (time.time() - started_at) / 60.0
+            if elapsed_min >= args.budget_minutes:
+                final_decision = "Stopped (budget exceeded)"
+                break
+
+            round_artifact = current_artifact
+            round_input = session_dir / f"round-{round_no}-input.md"
+            if current_artifact is artifact_text:
+                # Unchanged since resolution: reuse artifact.md instead of writing the text again.
+                link_or_copy(artifact_file, round_input)
             else:
-                log_event(f"debate: round={round_no} backend_error backend={backend} error={exc}")
-                critique = f"## Backend Error\n- {exc}\n"
+                round_input.write_text(current_artifact, encoding="utf-8")
+            log_event(f"debate: round={round_no} route_start target={target}")
 
-        round_crit = session_dir / f"round-{round_no}-critique.md"
-        round_crit.write_text(critique, encoding="utf-8")
+            cache_before = cache.stats() if cache else None
+            scheduler_before = runtime.scheduler.stats() if runtime.scheduler else None
+            review = run_round_review(
+                args,
+                round_no=round_no,
+                target=target,
+                backend=backend,
+                local_backend=env_name,
+                fallback_local_backend=fallback_local_backend,
+                artifact_kind=artifact_kind,
+                current_artifact=current_artifact,
+                round_input=round_input,
+                previous_round_input=previous_round_input,
+                previous_unresolved=previous_unresolved,
+                fanout_reviewers=fanout_reviewers,
+                hedge_after=hedge_after,
+                resumed_critique=resumed_critique if round_no == start_round else None,
+                git_root=git_root,
+                session_dir=session_dir,
+                runtime=runtime,
+            )
+            speculator = review.speculator
+            if review.budget_exhausted:
+                if speculator:
+                    speculator.discard("budget exhausted")
+                final_decision = "Stopped (budget exceeded)"
+                break
+            critique = review.critique
 
-        parsed = parse_critique(critique)
-        rec_choice, rec_reason = judge_recommendation(parsed)
-        has_material = (len(parsed.p1) + len(parsed.p2)) > 0
-        has_agreement_signal = detect_agreement_signal(critique)
+            round_crit = session_dir / f"round-{round_no}-critique.md"
+            round_crit.write_text(critique, encoding="utf-8")
 
-        print(f"\n=== Round {round_no} ===")
-        print(f"Judge recommendation: {rec_choice} ({rec_reason})")
-        print(f"P1={len(parsed.p1)} P2={len(parsed.p2)} P3={len(parsed.p3)} Missing={len(parsed.missing)}")
+            round_cache: Optional[Dict] = None
+            if cache and cache_before:
+                cache_after = cache.stats()
+                session_state["cache"] = cache_after
+                round_cache = {
+                    "hits": cache_after["hits"] - cache_before["hits"],
+                    "misses": cache_after["misses"] - cache_before["misses"],
+                }
+            round_scheduler: Optional[Dict] = None
+            if runtime.scheduler and scheduler_before:
+                scheduler_after = runtime.scheduler.stats()
+                session_state["scheduler"].update(scheduler_after)
+                round_scheduler = {
+                    key: round(scheduler_after[key] - scheduler_before[key], 3)
+                    for key in ("calls", "queue_wait_seconds", "model_seconds")
+                }
 
-        auto_stop_reason: Optional[str] = None
-        if (
-            round_no > 1
-            and not parsed.backend_error
-            and not has_material
-            and not previous_has_material
-        ):
-            auto_stop_reason = "Converged (two consecutive rounds with no new P1/P2)"
-        elif has_agreement_signal and not has_material and not parsed.backend_error:
-            auto_stop_reason = "Converged (agreement signal from opposite model)"
-
-        if auto_stop_reason:
-            round_entry = {
-                "round": round_no,
-                "choice": "AUTO_STOP",
-                "judge_recommendation": rec_choice,
-                "judge_reason": rec_reason,
-                "backend_error": parsed.backend_error,
-                "p1": parsed.p1,
-                "p2": parsed.p2,
-                "p3": parsed.p3,
-                "missing": parsed.missing,
-            }
-            session_state["rounds"].append(round_entry)
-            write_json(session_dir / "metadata.json", session_state)
-            final_decision = auto_stop_reason
-            final_artifact = current_artifact
-            break
+            parsed = review.parsed_override if review.parsed_override is not None else parse_critique(critique)
+            rec_choice, rec_reason = judge_recommendation(parsed, consensus_min=args.consensus_min)
+            has_material = (len(parsed.p1) + len(parsed.p2)) > 0
+            has_agreement_signal = detect_agreement_signal(critique)
 
-        if args.mode == "auto":
-            choice = rec_choice
-            print(f"Auto mode choice: {choice}")
-        else:
-            choice = choose_interactive(rec_choice)
-
-        round_entry = {
-            "round": round_no,
-            "choice": choice,
-            "judge_recommendation": rec_choice,
-            "judge_reason": rec_reason,
-            "target": effective_target,
-            "backend_used": backend_used,
-            "backend_unavailable": backend_unavailable,
-            "backend_error": parsed.backend_error,
-            "p1": parsed.p1,
-            "p2": parsed.p2,
-            "p3": parsed.p3,
-            "missing": parsed.missing,
-        }
-        session_state["rounds"].append(round_entry)
-        write_json(session_dir / "metadata.json", session_state)
+            print(f"\n=== Round {round_no} ===")
+            print(f"Judge recommendation: {rec_choice} ({rec_reason})")
+            print(f"P1={len(parsed.p1)} P2={len(parsed.p2)} P3={len(parsed.p3)} Missing={len(parsed.missing)}")
+            fingerprints: Optional[Dict] = None
+            if not parsed.backend_error:
+                with TRACER.span("fingerprint_findings", round=round_no) as span:
+                    fingerprints = finding_index.observe(
+                        round_no, {"p1": parsed.p1, "p2": parsed.p2, "p3": parsed.p3}
+                    )
+                    span.update(new=fingerprints["new"], recurring=fingerprints["recurring"])
+                print(
+                    f"Findings: new={fingerprints['new']} recurring={fingerprints['recurring']} "
+                    f"escalated={fingerprints['escalated']} resolved={fingerprints['resolved']}"
+                )
 
-        if choice == "A":
-            final_decision = "Keep Original"
-            final_artifact = current_artifact
-            break
-        if choice == "B":
-            if args.skip_materialize_opposite:
-                log_event("debate: skip materialize_opposite due to --skip-materialize-opposite")
-                final_decision = "Accept Opposite (materialization skipped)"
+            auto_stop_reason: Optional[str] = None
+            auto_stop_kind = ""
+            if (
+                round_no > 1
+                and not parsed.backend_error
+                and not has_material
+                and not previous_has_material
+            ):
+                auto_stop_reason = "Converged (two consecutive rounds with no new P1/P2)"
+                auto_stop_kind = "no_material"
+            elif has_agreement_signal and not has_material and not parsed.backend_error:
+                auto_stop_reason = "Converged (agreement signal from opposite model)"
+                auto_stop_kind = "agreement"
+            elif (
+                round_no > 1
+                and fingerprints is not None
+                and has_material
+                and fingerprints["new_material"] == 0
+                and not args.no_fingerprint_convergence
+            ):
+                if parsed.p1:
+                    # Another round will not resolve P1s the reviewer keeps repeating, but they are still open.
+                    auto_stop_reason = "Stopped (P1 findings recur unresolved)"
+                    auto_stop_kind = "recurring_p1"
+                else:
+                    auto_stop_reason = "Converged (no new P1/P2 findings; remaining P2 ones recur from earlier rounds)"
+                    auto_stop_kind = "recurring_findings"
+
+            if auto_stop_reason:
+                if speculator:
+                    speculator.discard("auto stop")
+                round_entry = build_round_entry(
+                    round_no,
+                    "AUTO_STOP",
+                    parsed=parsed,
+                    rec_choice=rec_choice,
+                    rec_reason=rec_reason,
+                    review=review,
+                    round_cache=round_cache,
+                    round_scheduler=round_scheduler,
+                    fingerprints=fingerprints,
+                    auto_stop=auto_stop_kind,
+                )
+                record_speculation(round_entry, speculator)
+                session_state["rounds"].append(round_entry)
+                checkpoint()
+                final_decision = auto_stop_reason
                 final_artifact = current_artifact
+                break
+
+            if args.mode == "auto":
+                choice = rec_choice
+                print(f"Auto mode choice: {choice}")
             else:
-                final_decision = "Accept Opposite"
-                local_backend = "codex" if env_name == "codex" else "claude"
-                log_event(f"debate: round={round_no} materialize_opposite backend={local_backend}")
-                final_artifact = accept_opposite_revision(
-                    local_backend,
-                    current_artifact,
-                    critique,
-                    git_root,
-                    timeout_seconds=args.backend_timeout_seconds,
-                )
-            break
-        if choice == "C":
-            previous_has_material = has_material
-            local_backend = "codex" if env_name == "codex" else "claude"
-            log_event(f"debate: round={round_no} generate_compromise backend={local_backend}")
-            current_artifact = generate_compromise(
-                local_backend,
-                current_artifact,
-                critique,
-                git_root,
-                timeout_seconds=args.backend_timeout_seconds,
-                allow_stdin_fallback=(args.mode == "manual"),
+                choice = choose_interactive(rec_choice)
+            if speculator and (choice not in ("B", "C") or (choice == "B" and args.skip_materialize_opposite)):
+                speculator.discard(f"choice {choice}")
+
+            round_entry = build_round_entry(
+                round_no,
+                choice,
+                parsed=parsed,
+                rec_choice=rec_choice,
+                rec_reason=rec_reason,
+                review=review,
+                round_cache=round_cache,
+                round_scheduler=round_scheduler,
+                fingerprints=fingerprints,
             )
-            continue
-        if choice == "D":
-            previous_has_material = has_material
-            rebuttal = ""
-            if args.mode == "manual":
-                rebuttal = input("Optional rebuttal (empty to auto-generate): ").strip()
-            if not rebuttal:
-                rebuttal = "Please address remaining concerns with concrete evidence and tradeoffs."
-            current_artifact = f"{current_artifact}\n\n## Rebuttal\n{rebuttal}\n"
-            continue
-        if choice == "E":
-            if parsed.backend_error and args.mode == "auto":
-                final_decision = "Stopped (backend error - no review performed)"
-            else:
-                final_decision = "Stopped by user"
-            final_artifact = current_artifact
-            break
+            record_speculation(round_entry, speculator)
+            session_state["rounds"].append(round_entry)
+            checkpoint()
+            previous_round_input = round_artifact
+            previous_unresolved = [f"- [P1] {item}" for item in parsed.p1] + [f"- [P2] {item}" for item in parsed.p2]
 
-    completed_at = dt.datetime.now().isoformat()
-    total_duration_seconds = round(time.time() - started_at, 3)
+            if choice == "A":
+                final_decision = "Keep Original"
+                final_artifact = current_artifact
+                break
+            if choice == "B":
+                if args.skip_materialize_opposite:
+                    log_event("debate: skip materialize_opposite due to --skip-materialize-opposite")
+                    final_decision = "Accept Opposite (materialization skipped)"
+                    final_artifact = current_artifact
+                else:
+                    final_decision = "Accept Opposite"
+                    local_backend = "codex" if env_name == "codex" else "claude"
+                    log_event(f"debate: round={round_no} materialize_opposite backend={local_backend}")
+                    speculative = speculator.claim("B", parsed, critique) if speculator else None
+                    if speculative is not None:
+                        final_artifact = speculative
+                    else:
+                        final_artifact = accept_opposite_revision(
+                            local_backend,
+                            current_artifact,
+                            critique,
+                            git_root,
+                            timeout_seconds=args.backend_timeout_seconds,
+                            runtime=runtime,
+                        )
+                    record_speculation(round_entry, speculator)
+                break
+            if choice == "C":
+                previous_has_material = has_material
+                local_backend = "codex" if env_name == "codex" else "claude"
+                log_event(f"debate: round={round_no} generate_compromise backend={local_backend}")
+                speculative = speculator.claim("C", parsed, critique) if speculator else None
+                if speculative is not None:
+                    current_artifact = speculative
+                else:
+                    current_artifact = generate_compromise(
+                        local_backend,
+                        current_artifact,
+                        critique,
+                        git_root,
+                        timeout_seconds=args.backend_timeout_seconds,
+                        allow_stdin_fallback=(args.mode == "manual"),
+                        runtime=runtime,
+                    )
+                record_speculation(round_entry, speculator)
+                save_current_artifact(session_dir, session_state, current_artifact, round_no)
+                checkpoint()
+                continue
+            if choice == "D":
+                previous_has_material = has_material
+                rebuttal = ""
+                if args.mode == "manual":
+                    rebuttal = input("Optional rebuttal (empty to auto-generate): ").strip()
+                if not rebuttal:
+                    rebuttal = "Please address remaining concerns with concrete evidence and tradeoffs."
+                current_artifact = f"{current_artifact}\n\n## Rebuttal\n{rebuttal}\n"
+                save_current_artifact(session_dir, session_state, current_artifact, round_no)
+                checkpoint()
+                continue
+            if choice == "E":
+                if parsed.backend_error and args.mode == "auto":
+                    final_decision = "Stopped (backend error - no review performed)"
+                else:
+                    final_decision = "Stopped by user"
+                final_artifact = current_artifact
+                break
 
-    session_state["status"] = "closed"
-    session_state["final_decision"] = final_decision
-    session_state["completed_at"] = completed_at
-    session_state["total_duration_seconds"] = total_duration_seconds
-    write_json(session_dir / "metadata.json", session_state)
+        completed_at = dt.datetime.now().isoformat()
+        total_duration_seconds = round(time.time() - started_at, 3)
+
+        session_state["status"] = "closed"
+        session_state["final_decision"] = final_decision
+        session_state["completed_at"] = completed_at
+        session_state["total_duration_seconds"] = total_duration_seconds
+        session_state["trace_files"] = [str(session_dir / "trace.jsonl"), str(session_dir / "trace.json")]
+        if runtime.recorder:
+            session_state["recording"] = runtime.recorder.stats()
+        if runtime.scheduler:
+            session_state["scheduler"].update(runtime.scheduler.stats())
+        checkpoint(snapshot=True)
+    finally:
+        journal.close()
 
     summary = [
         "## Debate Summary",
@@ -1051,6 +5896,15 @@ def main() -> int:
         f"Rounds: {len(session_state['rounds'])}",
         f"Final Decision: {final_decision}",
         f"Total Duration Seconds: {total_duration_seconds}",
+    ]
+    if "speculation" in session_state:
+        spec = session_state["speculation"]
+        summary.append(
+            f"Speculative Revisions: used={spec['used']} wasted={spec['wasted']} "
+            f"saved={spec['saved_seconds']}s wasted_time={spec['wasted_seconds']}s"
+            + (" (used revisions were written from the critique up to its P3 section)" if spec["used"] else "")
+        )
+    summary += [
         "",
         "### Next Actions",
         "1. Apply selected artifact content",
@@ -1068,6 +5922,7 @@ def main() -> int:
         "final_decision": final_decision,
         "completed_at": completed_at,
         "total_duration_seconds": total_duration_seconds,
+        "speculation": session_state.get("speculation"),
         "final_artifact_file": str(session_dir / "final-artifact.md"),
         "judge_recommendation_history": [
             {
@@ -1081,6 +5936,15 @@ def main() -> int:
         ],
     }
     write_json(session_dir / "decision.json", decision)
+    TRACER.record("session", invoked_at, time.time(), session_id=session_id, rounds=len(session_state["rounds"]))
+    TRACER.write_chrome_trace(session_dir / "trace.json")
+    if args.metrics_textfile:
+        metrics = MetricsTextfile(Path(args.metrics_textfile).expanduser())
+        collect_session_metrics(metrics, session_state, TRACER.spans())
+        try:
+            metrics.flush()
+        except OSError as exc:
+            log_event(f"debate: warning metrics_textfile_failed path={metrics.path} error={exc}")
 
     print("\n" + "\n".join(summary))
     print(f"Saved: {session_dir}")
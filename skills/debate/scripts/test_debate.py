@@ -0,0 +1,506 @@
+"""Unit tests for debate.py (stdlib unittest).
+
+Run: python -m unittest discover -s skills/debate/scripts
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import debate  # noqa: E402
+
+
+def feed(parser: debate.CritiqueStreamParser, lines):
+    reasons = []
+    for line in lines:
+        parser.feed_line(line)
+        reasons.append(parser.fail_fast_reason(p1_threshold=99))
+    return reasons
+
+
+class CritiqueStreamParserAgreementTest(unittest.TestCase):
+    def test_preamble_agreement_does_not_stop_before_p1(self):
+        parser = debate.CritiqueStreamParser()
+        reasons = feed(
+            parser,
+            ["Overall this looks good, but one blocker:", "## P1 - Must Fix", "- null deref"],
+        )
+        self.assertEqual(reasons, [None, None, None])
+        self.assertEqual(parser.result().p1, ["null deref"])
+
+    def test_unqualified_preamble_agreement_is_ignored(self):
+        parser = debate.CritiqueStreamParser()
+        self.assertEqual(feed(parser, ["LGTM overall.", "## P1 - Must Fix"]), [None, None])
+
+    def test_agreement_in_recommendation_after_p1_p2_stops(self):
+        parser = debate.CritiqueStreamParser()
+        reasons = feed(
+            parser,
+            [
+                "## P1 - Must Fix",
+                "- None",
+                "## P2 - Should Fix",
+                "- None",
+                "## Recommended Decision",
+                "Approved as written.",
+            ],
+        )
+        self.assertEqual(reasons[-1], "agreement signal with no P1/P2 findings")
+
+    def test_recommendation_before_p2_does_not_stop(self):
+        parser = debate.CritiqueStreamParser()
+        reasons = feed(parser, ["## P1 - Must Fix", "- None", "## Recommended Decision", "LGTM"])
+        self.assertIsNone(reasons[-1])
+
+
+class DetectAgreementSignalTest(unittest.TestCase):
+    def test_markers(self):
+        self.assertTrue(debate.detect_agreement_signal("LGTM"))
+        self.assertTrue(debate.detect_agreement_signal("Approved, no blockers."))
+
+    def test_negated_or_qualified_markers(self):
+        for text in ("Not approved.", "This is not really approved", "Looks good, but the lock leaks", "unapproved"):
+            with self.subTest(text=text):
+                self.assertFalse(debate.detect_agreement_signal(text))
+
+
+class FindingIndexTest(unittest.TestCase):
+    def test_severity_escalation_is_material(self):
+        index = debate.FindingIndex()
+        index.observe(1, {"p1": [], "p2": [], "p3": ["Missing null check on user lookup in handler.py"]})
+        result = index.observe(2, {"p1": ["Null check missing on user lookup in handler.py"], "p2": [], "p3": []})
+        self.assertEqual(result["new"], 0)
+        self.assertEqual(result["escalated"], 1)
+        self.assertEqual(result["new_material"], 1)
+        self.assertEqual(index.entries[0]["severity"], "p1")
+
+    def test_recurring_at_same_severity_is_not_material(self):
+        index = debate.FindingIndex()
+        finding = {"p1": ["Null check missing on user lookup in handler.py"], "p2": [], "p3": []}
+        index.observe(1, finding)
+        result = index.observe(2, finding)
+        self.assertEqual((result["recurring"], result["new_material"]), (1, 0))
+
+
+class SessionGcTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make(self, name, *, age_days, status=None, files=None):
+        path = self.base / name
+        path.mkdir()
+        if status:
+            (path / "metadata.json").write_text(json.dumps({"session_id": name, "status": status}))
+        for file_name, text in (files or {}).items():
+            (path / file_name).write_text(text)
+        stamp = time.time() - age_days * 86400
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def test_unfinished_sessions_survive_age_and_size_passes(self):
+        self.make("debate-20250101-000000-1", age_days=100, status="closed")
+        self.make("debate-20250102-000000-1", age_days=100, status="in_progress")
+        self.make("debate-20250103-000000-1", age_days=10, status="in_progress", files={"big": "x" * 4096})
+        self.make("debate-20250104-000000-1", age_days=10, status="closed", files={"big": "x" * 4096})
+        policy = debate.RetentionPolicy(max_age_days=90, max_bytes=1024, keep_last=0, compact_after_days=30)
+        stats = debate.run_session_gc(self.base, policy, dry_run=True)
+        self.assertEqual(stats["deleted"], ["debate-20250101-000000-1", "debate-20250104-000000-1"])
+
+    def test_stale_unfinished_session_is_deleted(self):
+        self.make("debate-20240101-000000-1", age_days=400, status="in_progress")
+        stats = debate.run_session_gc(self.base, debate.RetentionPolicy(keep_last=0), dry_run=True)
+        self.assertEqual(stats["deleted"], ["debate-20240101-000000-1"])
+
+    def test_batch_dirs_are_collected_once_finished(self):
+        self.make("batch-20250101-000000-1", age_days=100, files={"batch-decision.json": "{}"})
+        self.make(f"batch-20250102-000000-{os.getpid()}", age_days=100)
+        stats = debate.run_session_gc(self.base, debate.RetentionPolicy(keep_last=0), dry_run=True)
+        self.assertEqual(stats["deleted"], ["batch-20250101-000000-1"])
+
+
+class GitArtifactTest(unittest.TestCase):
+    def git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def test_merge_commit_yields_first_parent_patch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.repo = Path(tmp)
+            self.git("init", "-q", "-b", "main")
+            self.git("config", "user.email", "dev@example.com")
+            self.git("config", "user.name", "dev")
+            (self.repo / "a.txt").write_text("a\n")
+            self.git("add", "a.txt")
+            self.git("commit", "-qm", "a")
+            self.git("checkout", "-qb", "side")
+            (self.repo / "b.txt").write_text("b\n")
+            self.git("add", "b.txt")
+            self.git("commit", "-qm", "b")
+            self.git("checkout", "-q", "main")
+            (self.repo / "a.txt").write_text("a\nc\n")
+            self.git("commit", "-qam", "c")
+            self.git("merge", "-q", "--no-edit", "side")
+            dest = self.repo / "artifact.diff"
+            files, truncated = debate.stream_git_artifact(
+                debate.git_collect_cmd("commit:HEAD"), cwd=self.repo, dest=dest, max_bytes=1 << 20
+            )
+            self.assertFalse(truncated)
+            self.assertEqual([entry["path"] for entry in files], ["b.txt"])
+            self.assertIn("diff --git a/b.txt b/b.txt", dest.read_text())
+
+    def test_hung_command_is_killed_with_its_process_group(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            started = time.monotonic()
+            # sh's child keeps the stdout pipe open, so killing only sh would still block the read.
+            with self.assertRaisesRegex(RuntimeError, "timed out after 1s"):
+                debate.stream_git_artifact(
+                    ["sh", "-c", "sleep 30; echo done"],
+                    cwd=Path(tmp),
+                    dest=Path(tmp) / "out",
+                    max_bytes=1 << 20,
+                    timeout=1,
+                )
+            self.assertLess(time.monotonic() - started, 10)
+
+
+def write_trace(session_dir: Path, spans) -> None:
+    session_dir.mkdir(parents=True)
+    lines = [
+        json.dumps({"name": name, "duration_seconds": seconds, "attrs": attrs}) for name, seconds, attrs in spans
+    ]
+    (session_dir / "trace.jsonl").write_text("\n".join(lines) + "\n")
+
+
+def review_span(seconds, error=None, bytes_in=1000):
+    attrs = {"backend": "codex", "target": "proposal", "bytes_in": bytes_in}
+    if error:
+        attrs["error"] = error
+    return ("call_backend_review", seconds, attrs)
+
+
+class AdaptiveIntensityTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def plan(self):
+        args = debate.argparse.Namespace(
+            intensity="adaptive", max_rounds=3, budget_minutes=20, backend_timeout_seconds=600
+        )
+        plan = debate.plan_adaptive_intensity(
+            args,
+            overridden=[],
+            session_base_dir=self.base,
+            backend="codex",
+            local_backend="claude",
+            target="proposal",
+            artifact_bytes=1000,
+            session_id="debate-current",
+        )
+        return args, plan
+
+    def test_latency_model_rescales_to_input_size(self):
+        model = debate.LatencyModel.fit([(1000, 10.0), (2000, 20.0), (3000, 30.0)])
+        self.assertAlmostEqual(model.predict(4000), 40.0)
+        self.assertAlmostEqual(model.percentile_at(4000, 50), 40.0)
+
+    def test_fast_history_shortens_timeout(self):
+        failed = review_span(500.0, "codex failed: rate limited")
+        write_trace(self.base / "debate-20250101-000000-1", [review_span(10.0)] * 40 + [failed])
+        args, plan = self.plan()
+        self.assertEqual((plan["review_samples"], plan["review_timeouts"]), (40, 0))
+        self.assertEqual(args.backend_timeout_seconds, debate.ADAPTIVE_MIN_TIMEOUT_SECONDS)
+
+    def test_timeouts_are_samples_and_keep_the_base_timeout(self):
+        timed_out = review_span(180.0, "Command '['codex', 'exec']' timed out after 180 seconds")
+        write_trace(self.base / "debate-20250101-000000-1", [review_span(10.0)] * 40 + [timed_out])
+        args, plan = self.plan()
+        self.assertEqual((plan["review_samples"], plan["review_timeouts"]), (41, 1))
+        base = debate.INTENSITY_PROFILES[debate.ADAPTIVE_BASE_INTENSITY]["backend_timeout_seconds"]
+        self.assertEqual(args.backend_timeout_seconds, base)
+
+
+STRUCTURED_CRITIQUE = "## P1 - Must Fix\n- None\n## P2 - Should Fix\n- None\n## Recommended Decision\n- continue"
+
+
+class HedgeTest(unittest.TestCase):
+    def test_fast_fallback_wins_and_slow_primary_is_cancelled(self):
+        cancelled = []
+
+        def review(name, runtime):
+            if name == "slow":
+                if runtime.cancel.wait(5):
+                    cancelled.append(name)
+                    raise debate.BackendCancelledError("slow call cancelled after 0.1s")
+                return STRUCTURED_CRITIQUE
+            return STRUCTURED_CRITIQUE + "\n- from fast"
+
+        critique, entry = debate.hedged_review(
+            review, primary="slow", fallback="fast", hedge_after=0.05, runtime=debate.BackendRuntime()
+        )
+        self.assertIn("from fast", critique)
+        self.assertEqual((entry["hedged"], entry["winner"], entry["loser_status"]), (True, "fast", "cancelled"))
+        self.assertEqual(cancelled, ["slow"])
+
+    def test_primary_within_threshold_is_not_hedged(self):
+        critique, entry = debate.hedged_review(
+            lambda name, runtime: f"{STRUCTURED_CRITIQUE}\n- from {name}",
+            primary="fast",
+            fallback="slow",
+            hedge_after=5,
+            runtime=debate.BackendRuntime(),
+        )
+        self.assertIn("from fast", critique)
+        self.assertEqual((entry["hedged"], entry["winner"]), (False, "fast"))
+
+    def test_threshold_counts_cancelled_primaries_at_elapsed_time(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            spans = [review_span(10.0)] * 5 + [review_span(90.0, "codex call cancelled after 90.0s")] * 2
+            write_trace(base / "debate-20250101-000000-1", spans)
+            seconds, source = debate.resolve_hedge_threshold(
+                "auto", session_base_dir=base, backend="codex", target="proposal", session_id="debate-current"
+            )
+        self.assertEqual(seconds, 90.0)
+        self.assertIn("2 cut short", source)
+
+
+class SessionJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.session_dir = Path(self.tmp.name)
+        self.journal = debate.SessionJournal(self.session_dir)
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(self.journal.close)
+
+    def logged(self):
+        return debate.parse_session_events((self.session_dir / debate.SESSION_EVENTS_FILE).read_text())
+
+    def replayed(self):
+        return debate.apply_session_events({}, self.logged())
+
+    def test_rewritten_round_relogs_from_that_round(self):
+        state = {"status": "in_progress", "rounds": [{"round": 1, "choice": "C"}, {"round": 2, "choice": "C"}]}
+        self.journal.checkpoint(state)
+        state["rounds"][1] = {"round": 2, "choice": "D"}
+        self.journal.checkpoint(state)
+        rewrite = [{key: event[key] for key in event if key not in ("seq", "ts")} for event in self.logged()[-2:]]
+        self.assertEqual(
+            rewrite,
+            [{"type": "rounds_truncate", "keep": 1}, {"type": "round", "entry": {"round": 2, "choice": "D"}}],
+        )
+        self.assertEqual(self.replayed()["rounds"], state["rounds"])
+
+    def test_dropped_rounds_are_truncated(self):
+        state = {"rounds": [{"round": 1}, {"round": 2}, {"round": 3}]}
+        self.journal.checkpoint(state)
+        state["rounds"] = [{"round": 1}, {"round": 2, "resumed": True}]
+        self.journal.checkpoint(state)
+        self.assertEqual(self.logged()[-2]["type"], "rounds_truncate")
+        self.assertEqual(self.logged()[-2]["keep"], 1)
+        self.assertEqual(self.replayed()["rounds"], state["rounds"])
+
+    def test_torn_last_line_is_ignored(self):
+        state = {"status": "in_progress", "rounds": [{"round": 1}]}
+        self.journal.checkpoint(state)
+        with (self.session_dir / debate.SESSION_EVENTS_FILE).open("a") as events:
+            events.write('{"seq": 99, "type": "state", "fields": {"status": "clo')
+        replayed = self.replayed()
+        self.assertEqual((replayed["status"], replayed["rounds"]), ("in_progress", [{"round": 1}]))
+        self.assertEqual(replayed["journal_seq"], self.journal.seq)
+
+    def test_events_already_in_the_snapshot_are_skipped(self):
+        snapshot = {"journal_seq": 2, "status": "closed", "rounds": []}
+        events = [
+            {"seq": 2, "type": "state", "fields": {"status": "in_progress"}},
+            {"seq": 3, "type": "round", "entry": {"round": 1}},
+        ]
+        self.assertEqual(debate.apply_session_events(snapshot, events)["status"], "closed")
+        self.assertEqual(snapshot["rounds"], [{"round": 1}])
+
+    def test_close_is_idempotent(self):
+        self.journal.checkpoint({"status": "in_progress"})
+        self.journal.close()
+        self.journal.close()
+
+
+SPECULATION_PREFIX = ["## P1 - Must Fix", "- Lock is never released in worker.py:12", "## P2 - Should Fix", "- None"]
+
+
+class RevisionSpeculatorTest(unittest.TestCase):
+    def speculate(self, lines):
+        speculator = debate.RevisionSpeculator(
+            local_backend="claude", current="draft", cwd=None, timeout_seconds=5, runtime=debate.BackendRuntime()
+        )
+        parser = debate.CritiqueStreamParser()
+        received = []
+        with mock.patch.object(debate, "run_revision_call", return_value="revised"):
+            for line in lines:
+                parser.feed_line(line)
+                received.append(line)
+                speculator.observe(parser, received)
+            speculator._done.wait(5)
+        return speculator
+
+    def claim(self, speculator, critique, choice="B"):
+        return speculator.claim(choice, debate.parse_critique(critique), critique)
+
+    def test_used_when_nothing_material_follows_the_snapshot(self):
+        speculator = self.speculate([*SPECULATION_PREFIX, "## P3 - Nice to Have"])
+        tail = ["## P3 - Nice to Have", "- None", "## Missing Alternatives", "- None"]
+        critique = "\n".join([*SPECULATION_PREFIX, *tail])
+        self.assertEqual(self.claim(speculator, critique), "revised")
+        self.assertEqual(speculator.entry()["status"], "used")
+
+    def test_discarded_when_p3_or_missing_items_arrive(self):
+        for tail in (["- Rename the helper"], ["- None", "## Missing Alternatives", "- Use a queue instead"]):
+            with self.subTest(tail=tail):
+                speculator = self.speculate([*SPECULATION_PREFIX, "## P3 - Nice to Have"])
+                critique = "\n".join([*SPECULATION_PREFIX, "## P3 - Nice to Have", *tail])
+                self.assertIsNone(self.claim(speculator, critique))
+                self.assertEqual(speculator.entry()["status"], "wasted")
+
+    def test_discarded_when_recommendation_text_follows_the_snapshot(self):
+        speculator = self.speculate([*SPECULATION_PREFIX, "## Recommended Decision"])
+        critique = "\n".join([*SPECULATION_PREFIX, "## Recommended Decision", "Keep the old lock order."])
+        self.assertIsNone(self.claim(speculator, critique))
+        self.assertEqual(speculator.status, "wasted")
+
+    def test_discarded_when_choice_or_findings_change(self):
+        speculator = self.speculate([*SPECULATION_PREFIX, "## P3 - Nice to Have"])
+        self.assertIsNone(self.claim(speculator, "\n".join(SPECULATION_PREFIX), choice="C"))
+        self.assertEqual(speculator.status, "wasted")
+        speculator = self.speculate([*SPECULATION_PREFIX, "## P3 - Nice to Have"])
+        changed = "\n".join(["## P1 - Must Fix", "- Another bug", "## P2 - Should Fix", "- None"])
+        self.assertIsNone(self.claim(speculator, changed))
+
+
+class BackendSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.state = {}
+
+    def scheduler(self, session_id, *, max_concurrent=1, rpm=100):
+        return debate.BackendScheduler(
+            Path(self.tmp.name), session_id=session_id, max_concurrent={"codex": max_concurrent}, rpm={"codex": rpm}
+        )
+
+    def test_fair_order_round_robins_sessions_least_recently_served_first(self):
+        waiters = {
+            "a1": {"session": "a", "enqueued": 1.0},
+            "a2": {"session": "a", "enqueued": 2.0},
+            "b1": {"session": "b", "enqueued": 3.0},
+        }
+        self.assertEqual(debate.fair_order(waiters, {}), ["a1", "b1", "a2"])
+        self.assertEqual(debate.fair_order(waiters, {"a": 100.0}), ["b1", "a1", "a2"])
+
+    def test_released_slot_goes_to_the_other_session(self):
+        first, second = self.scheduler("a"), self.scheduler("b")
+        self.assertEqual(first._try_grant(self.state, "codex", "a1", 1.0), (True, 0))
+        self.assertEqual(first._try_grant(self.state, "codex", "a2", 2.0), (False, 0))
+        # Session a was just served, so b1 queues ahead of the older a2.
+        self.assertEqual(second._try_grant(self.state, "codex", "b1", 3.0), (False, 0))
+        del self.state["holders"]["a1"]
+        self.assertEqual(first._try_grant(self.state, "codex", "a2", 2.0), (False, 1))
+        self.assertEqual(second._try_grant(self.state, "codex", "b1", 3.0), (True, 0))
+        self.assertEqual(set(self.state["holders"]), {"b1"})
+
+    def test_rpm_bucket_exhausts_and_refills(self):
+        scheduler = self.scheduler("a", max_concurrent=10, rpm=2)
+        self.assertTrue(scheduler._try_grant(self.state, "codex", "t1", 1.0)[0])
+        self.assertTrue(scheduler._try_grant(self.state, "codex", "t2", 2.0)[0])
+        self.assertEqual(scheduler._try_grant(self.state, "codex", "t3", 3.0), (False, 0))
+        self.assertLess(self.state["tokens"], 1)
+        self.state["refilled_at"] -= 30  # half a minute at 2 rpm refills one request
+        self.assertEqual(scheduler._try_grant(self.state, "codex", "t3", 3.0), (True, 0))
+
+    def test_entries_of_dead_processes_are_dropped(self):
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+        self.state["holders"] = {"gone": {"pid": proc.pid, "session": "x", "enqueued": 0.0, "since": 0.0}}
+        self.state["waiters"] = {"gone-2": {"pid": proc.pid, "session": "x", "enqueued": 0.5}}
+        self.assertEqual(self.scheduler("a")._try_grant(self.state, "codex", "t1", 1.0), (True, 0))
+        self.assertEqual((set(self.state["holders"]), self.state["waiters"]), ({"t1"}, {}))
+
+
+STUB_BACKEND = """#!{python}
+import sys
+print("## P1 - Must Fix\\n- None\\n## P2 - Should Fix\\n- Retry loop in client.py:40 swallows errors")
+print("## P3 - Nice to Have\\n- None\\n## Missing Alternatives\\n- None\\n## Recommended Decision\\n- continue")
+"""
+
+
+class RecordReplayTest(unittest.TestCase):
+    def git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def run_debate(self, *args):
+        return subprocess.run(
+            [sys.executable, str(Path(debate.__file__)), *args],
+            cwd=self.repo,
+            env=self.env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+    def test_replay_of_git_scoped_code_review_matches_recording(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            bin_dir = root / "bin"
+            bin_dir.mkdir()
+            for name in ("codex", "claude"):
+                stub = bin_dir / name
+                stub.write_text(STUB_BACKEND.format(python=sys.executable))
+                stub.chmod(0o755)
+            self.repo = root / "repo"
+            self.repo.mkdir()
+            self.git("init", "-q", "-b", "main")
+            self.git("config", "user.email", "dev@example.com")
+            self.git("config", "user.name", "dev")
+            (self.repo / "client.py").write_text("def call():\n    pass\n")
+            self.git("add", "client.py")
+            self.git("commit", "-qm", "init")
+            (self.repo / "client.py").write_text("def call():\n    while True:\n        pass\n")
+            self.env = {
+                key: value for key, value in os.environ.items() if key not in ("CODEX_THREAD_ID", "CODEX_SANDBOX_ID")
+            }
+            self.env.update(PATH=f"{bin_dir}{os.pathsep}{self.env.get('PATH', '')}", XDG_STATE_HOME=str(root / "xdg"))
+            state = root / "state"
+            common = ["--state-dir", str(state), "--no-session-gc", "--max-rounds", "1"]
+            recorded = self.run_debate("--target", "code", "--scope", "uncommitted", "--record", *common)
+            self.assertEqual(recorded.returncode, 0, recorded.stderr)
+            (record_dir,) = state.glob("debate-*")
+            record_meta = json.loads((record_dir / "metadata.json").read_text())
+            self.assertEqual(record_meta["artifact_kind"], "diff")
+
+            replayed = self.run_debate("--replay", record_dir.name, *common)
+            self.assertEqual(replayed.returncode, 0, replayed.stderr)
+            self.assertNotIn("replay_miss", replayed.stderr)
+            (replay_dir,) = [path for path in state.glob("debate-*") if path != record_dir]
+            replay_meta = json.loads((replay_dir / "metadata.json").read_text())
+            self.assertEqual(replay_meta["scope"], "uncommitted")
+            self.assertEqual(replay_meta["artifact_kind"], record_meta["artifact_kind"])
+            self.assertEqual(replay_meta["recording"]["misses"], 0)
+            self.assertEqual(replay_meta["recording"]["replayed"], record_meta["recording"]["recorded"])
+            self.assertEqual(replay_meta["final_decision"], record_meta["final_decision"])
+            self.assertEqual(replay_meta["rounds"][-1]["choice"], record_meta["rounds"][-1]["choice"])
+
+
+if __name__ == "__main__":
+    unittest.main()